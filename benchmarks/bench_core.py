@@ -0,0 +1,268 @@
+import argparse
+import csv
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+# Add root to path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+from core.calculations import (
+    calculate_tension, calculate_compression, calculate_bolt_shear, calculate_flexure,
+    calculate_weld, calculate_combined, calculate_base_plate, calculate_moment_plate
+)
+from core.batch import (
+    tension_batch, compression_batch, bolt_shear_batch, flexure_batch, weld_batch,
+    combined_batch, base_plate_batch, moment_plate_batch
+)
+from core.profiles import ProfileDatabase
+
+DB_PATH = os.path.join(ROOT, 'data', 'profiles.csv')
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+# Default allowed slowdown before a metric counts as a regression (percent)
+DEFAULT_THRESHOLD = 25.0
+
+# Number of input sets evaluated by a "batch" benchmark
+BATCH_SIZE = 10000
+
+CATALOGUE_SIZES = [100, 1000, 10000, 100000]
+
+# The GUI recalculates live on every debounced edit; a single scalar check must stay
+# well inside one frame (16 ms) for typing to feel instant.
+LIVE_BUDGET = 0.005  # s
+
+
+def measure(func, number=1, repeat=5):
+    """
+    Time a callable.
+
+    Args:
+        func (callable): Zero-argument callable to time.
+        number (int): Calls per timing sample.
+        repeat (int): Number of samples.
+
+    Returns:
+        float: Best (minimum) seconds per call over all samples.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = (time.perf_counter() - start) / number
+        best = min(best, elapsed)
+    return best
+
+
+def write_synthetic_catalogue(path, n_rows):
+    """
+    Write a synthetic WF catalogue with n_rows sections scaled from WF 200x100.
+    """
+    header = ["type", "name", "weight_kg_m", "depth_mm", "width_mm", "web_thick_mm", "flange_thick_mm",
+              "area_cm2", "ix_cm4", "iy_cm4", "rx_cm", "ry_cm", "zx_cm3", "zy_cm3"]
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for i in range(n_rows):
+            s = 1.0 + (i % 1000) / 500.0
+            d = round(200 * s, 1)
+            bf = round(100 * s, 1)
+            writer.writerow([
+                "WF", f"WF {d}x{bf}-{i}", round(21.3 * s**2, 2), d, bf, round(5.5 * s, 2), round(8 * s, 2),
+                round(27.16 * s**2, 2), round(1840 * s**4, 1), round(134 * s**4, 1),
+                round(8.24 * s, 3), round(2.22 * s, 3), round(184 * s**3, 1), round(26.8 * s**3, 2)
+            ])
+
+
+def bench_calculations(db, batch_size):
+    """
+    Time every calculate_* function for one call (scalar) and for batch_size input sets (batch).
+    """
+    profile = db.get_profile("WF 200x100")
+    cases = {
+        "tension": lambda i: calculate_tension(profile.Ag, profile.Ag * 0.85, 240 + i % 10, 370),
+        "compression": lambda i: calculate_compression(profile.Ag, profile.rx, profile.ry, 1.0, 1000 + i % 5000, 1.0, 1000 + i % 5000, 240),
+        "bolt_shear": lambda i: calculate_bolt_shear(16 + i % 8, 4, 372),
+        "flexure": lambda i: calculate_flexure(profile, 500 + i % 8000, 1.0, 240),
+        "weld": lambda i: calculate_weld("Fillet", 490, 6, 100 + i % 200),
+        "combined": lambda i: calculate_combined(profile, 100000 + i, 20e6, 1e6, 3000, 1.0, 1.0, 240),
+        "base_plate": lambda i: calculate_base_plate(500000 + i, 25, 400, 400, profile.d, profile.bf),
+        "moment_plate": lambda i: calculate_moment_plate(40 + i % 10, 16, 4, 20, profile),
+    }
+
+    metrics = {}
+    for name, case in cases.items():
+        metrics[f"calc.{name}.scalar"] = measure(lambda: case(0), number=2000)
+
+        def batch():
+            for i in range(batch_size):
+                case(i)
+        metrics[f"calc.{name}.batch"] = measure(batch, number=1, repeat=3)
+    return metrics
+
+
+def bench_vectorized(db, batch_size):
+    """
+    Time the core.batch kernels on batch_size input sets (same inputs as bench_calculations).
+    """
+    profile = db.get_profile("WF 200x100")
+    i = np.arange(batch_size)
+    cases = {
+        "tension": lambda: tension_batch(profile.Ag, profile.Ag * 0.85, 240 + i % 10, 370),
+        "compression": lambda: compression_batch(profile.Ag, profile.rx, profile.ry, 1.0, 1000 + i % 5000, 1.0, 1000 + i % 5000, 240),
+        "bolt_shear": lambda: bolt_shear_batch(16 + i % 8, 4, 372),
+        "flexure": lambda: flexure_batch(profile, 500 + i % 8000, 1.0, 240),
+        "weld": lambda: weld_batch("Fillet", 490, 6, 100 + i % 200),
+        "combined": lambda: combined_batch(profile, 100000 + i, 20e6, 1e6, 3000, 1.0, 1.0, 240),
+        "base_plate": lambda: base_plate_batch(500000 + i, 25, 400, 400, profile.d, profile.bf),
+        "moment_plate": lambda: moment_plate_batch(40 + i % 10, 16, 4, 20, profile),
+    }
+    return {f"calc.{name}.vectorized": measure(case, repeat=3) for name, case in cases.items()}
+
+
+def bench_database(sizes, workdir):
+    """
+    Time ProfileDatabase load and name lookup for synthetic catalogues of each size.
+    """
+    metrics = {}
+    for n in sizes:
+        path = os.path.join(workdir, f"catalogue_{n}.csv")
+        write_synthetic_catalogue(path, n)
+        repeat = 3 if n < 100000 else 1
+        metrics[f"db.load.{n}"] = measure(lambda: ProfileDatabase(path), repeat=repeat)
+
+        db = ProfileDatabase(path)
+        names = db.get_all_names()
+        probe = [names[0], names[len(names) // 2], names[-1]]
+        metrics[f"db.lookup.{n}"] = measure(lambda: [db.get_profile(p) for p in probe], number=10, repeat=repeat)
+    return metrics
+
+
+def bench_plotting(db):
+    from core.plotting import create_section_plot
+    profile = db.get_profile("WF 200x100")
+    return {"plot.create_section_plot": measure(lambda: create_section_plot(profile), number=5)}
+
+
+def bench_report(workdir):
+    from core.reports import PDFReport, generate_report
+    path = os.path.join(workdir, "bench_report.pdf")
+    html_path = os.path.join(workdir, "bench_report.html")
+    inputs = {"Profile": "WF 200x100", "Length (L)": "3000 mm", "K Factor": 1.0, "Yield Strength (Fy)": "240 MPa"}
+    results = {"KL/r": "135.14", "Critical Stress (Fcr)": "94.12 MPa", "Design Strength": "230.07 kN", "status": "Calculated"}
+    return {"report.pdf_generate": measure(lambda: PDFReport.generate(path, "Benchmark", inputs, results), number=3),
+            "report.html_generate": measure(lambda: generate_report(html_path, "Benchmark", inputs, results), number=3)}
+
+
+def run_benchmarks(quick=False):
+    """
+    Run the whole suite.
+
+    Args:
+        quick (bool): Use smaller batches and catalogues (for smoke runs).
+
+    Returns:
+        dict: Metric name -> seconds.
+    """
+    db = ProfileDatabase(DB_PATH)
+    batch_size = 1000 if quick else BATCH_SIZE
+    sizes = CATALOGUE_SIZES[:2] if quick else CATALOGUE_SIZES
+
+    metrics = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        metrics.update(bench_calculations(db, batch_size))
+        metrics.update(bench_vectorized(db, batch_size))
+        metrics.update(bench_database(sizes, workdir))
+        metrics.update(bench_plotting(db))
+        metrics.update(bench_report(workdir))
+    return metrics
+
+
+def compare(metrics, baseline, threshold):
+    """
+    Compare metrics against a baseline.
+
+    Args:
+        metrics (dict): Current metric name -> seconds.
+        baseline (dict): Baseline metric name -> seconds.
+        threshold (float): Allowed slowdown in percent.
+
+    Returns:
+        list: (name, baseline, current, change_pct) for every regressed metric.
+    """
+    regressions = []
+    for name, base in baseline.items():
+        current = metrics.get(name)
+        if current is None or base <= 0:
+            continue
+        change = (current - base) / base * 100
+        if change > threshold:
+            regressions.append((name, base, current, change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark suite for the steel calculator core.")
+    parser.add_argument("--output", default="bench_results.json", help="Where to write the JSON results.")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON to compare against.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed slowdown in percent.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline.")
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes for a fast smoke run.")
+    args = parser.parse_args(argv)
+
+    metrics = run_benchmarks(quick=args.quick)
+    record = {
+        "date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "quick": args.quick,
+        "metrics": metrics,
+    }
+
+    with open(args.output, 'w') as f:
+        json.dump(record, f, indent=2)
+
+    for name, value in sorted(metrics.items()):
+        print(f"{name:<32} {value * 1e6:>14.2f} us")
+
+    over_budget = [k for k, v in metrics.items() if k.endswith(".scalar") and v > LIVE_BUDGET]
+    for name in over_budget:
+        print(f"LIVE BUDGET EXCEEDED: {name} takes {metrics[name] * 1e3:.2f} ms (budget {LIVE_BUDGET * 1e3:.0f} ms)")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(record, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 1 if over_budget else 0
+
+    if over_budget:
+        return 1
+
+    if not os.path.exists(args.baseline):
+        print("No baseline found; run with --save-baseline to create one.")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["metrics"]
+
+    regressions = compare(metrics, baseline, args.threshold)
+    if regressions:
+        print(f"\nREGRESSIONS (> {args.threshold:.0f}% slower than baseline):")
+        for name, base, current, change in regressions:
+            print(f"  {name:<30} {base * 1e6:>12.2f} -> {current * 1e6:>12.2f} us  (+{change:.1f}%)")
+        return 1
+
+    print(f"\nNo regressions beyond {args.threshold:.0f}%.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
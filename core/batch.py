@@ -0,0 +1,328 @@
+import inspect
+import math
+
+import numpy as np
+
+from core import calculations
+from core.classification import E_STEEL, local_buckling, effective_area_ratio
+from core.instrumentation import instrumented
+from core.results import (
+    ResultTable, TensionResult, CompressionResult, BoltShearResult, FlexureResult, WeldResult,
+    CombinedResult, BasePlateResult, MomentPlateResult,
+    ZONE_CLOSED, ZONE_YIELDING, ZONE_INELASTIC_LTB, ZONE_ELASTIC_LTB, ZONE_FLB, ZONE_WLB
+)
+
+# Vectorized counterparts of core.calculations. Every argument may be a scalar or a
+# 1-D array; arrays are broadcast against each other and the result is a ResultTable
+# whose rows match the scalar functions exactly.
+
+
+def profile_columns(profiles, attrs):
+    """
+    Collect profile attributes into arrays.
+
+    Args:
+        profiles (SteelProfile or sequence of SteelProfile): One profile (broadcast to
+            every row) or one profile per row.
+        attrs (iterable of str): Attribute names, e.g. ("Sx", "Zx").
+
+    Returns:
+        dict: Attribute name -> float or ndarray.
+    """
+    if hasattr(profiles, "name"):
+        return {a: getattr(profiles, a) for a in attrs}
+    return {a: np.fromiter((getattr(p, a) for p in profiles), dtype=float, count=len(profiles)) for a in attrs}
+
+
+def _f(x):
+    return np.asarray(x, dtype=float)
+
+
+@instrumented("batch", "tension")
+def tension_batch(Ag, Ae, Fy, Fu):
+    """
+    Vectorized calculate_tension.
+
+    Returns:
+        ResultTable: Columns phi_Pn, yield.Pn, yield.phi_Pn, rupture.Pn, rupture.phi_Pn
+    """
+    Pn_yield = _f(Fy) * _f(Ag)
+    Pn_rupture = _f(Fu) * _f(Ae)
+    phi_Pn_yield = 0.9 * Pn_yield
+    phi_Pn_rupture = 0.75 * Pn_rupture
+    return ResultTable(TensionResult, {
+        "phi_Pn": np.minimum(phi_Pn_yield, phi_Pn_rupture),
+        "yield.Pn": Pn_yield,
+        "yield.phi_Pn": phi_Pn_yield,
+        "rupture.Pn": Pn_rupture,
+        "rupture.phi_Pn": phi_Pn_rupture,
+    })
+
+
+def _compression_columns(Ag, rx, ry, Kx, Lx, Ky, Ly, Fy):
+    Fy = _f(Fy)
+    KL_r = np.maximum(_f(Kx) * _f(Lx) / _f(rx), _f(Ky) * _f(Ly) / _f(ry))
+    with np.errstate(divide="ignore"):
+        Fe = (math.pi**2 * E_STEEL) / KL_r**2
+        Fcr = np.where(KL_r <= 4.71 * np.sqrt(E_STEEL / Fy), 0.658**(Fy / Fe) * Fy, 0.877 * Fe)
+    Pn = Fcr * _f(Ag)
+    return {"phi_Pn": 0.9 * Pn, "Pn": Pn, "Fcr": Fcr, "KL_r": KL_r, "Fe": Fe}
+
+
+@instrumented("batch", "compression")
+def compression_batch(Ag, rx, ry, Kx, Lx, Ky, Ly, Fy):
+    """
+    Vectorized calculate_compression.
+
+    Returns:
+        ResultTable: Columns phi_Pn, Pn, Fcr, KL_r, Fe
+    """
+    return ResultTable(CompressionResult, _compression_columns(Ag, rx, ry, Kx, Lx, Ky, Ly, Fy))
+
+
+def _section_compression_columns(profiles, Kx, Lx, Ky, Ly, Fy):
+    props = profile_columns(profiles, ("Ag", "rx", "ry"))
+    comp = _compression_columns(props["Ag"], props["rx"], props["ry"], Kx, Lx, Ky, Ly, Fy)
+    Q = effective_area_ratio(profiles, Fy, comp["Fcr"])
+    comp["Pn"] = comp["Pn"] * Q
+    comp["phi_Pn"] = comp["phi_Pn"] * Q
+    return comp
+
+
+@instrumented("batch", "section_compression")
+def section_compression_batch(profiles, Kx, Lx, Ky, Ly, Fy):
+    """
+    Compression of catalogue sections: compression_batch with the E7 slender-element
+    reduction (Ae / Ag), which needs the section and not just Ag, rx and ry.
+
+    Returns:
+        ResultTable: Columns phi_Pn, Pn, Fcr, KL_r, Fe
+    """
+    return ResultTable(CompressionResult, _section_compression_columns(profiles, Kx, Lx, Ky, Ly, Fy))
+
+
+@instrumented("batch", "bolt_shear")
+def bolt_shear_batch(db, n, Fnv):
+    """
+    Vectorized calculate_bolt_shear.
+
+    Returns:
+        ResultTable: Columns phi_Rn, Rn, Ab
+    """
+    Ab = 0.25 * math.pi * _f(db)**2
+    Rn = _f(n) * _f(Fnv) * Ab
+    return ResultTable(BoltShearResult, {"phi_Rn": 0.75 * Rn, "Rn": Rn, "Ab": Ab})
+
+
+def _flexure_columns(profiles, Lb, Cb, Fy):
+    props = profile_columns(profiles, ("Sx", "Zx", "J", "rts", "h0", "ry"))
+    Sx, Zx, J, rts, h0 = (_f(props[k]) for k in ("Sx", "Zx", "J", "rts", "h0"))
+    Lb, Cb, Fy = _f(Lb), _f(Cb), _f(Fy)
+    E = E_STEEL
+
+    Mp = Fy * Zx
+    Lp = 1.76 * _f(props["ry"]) * np.sqrt(E / Fy)
+    jc = J / (Sx * h0)
+    Lr = 1.95 * rts * E / (0.7 * Fy) * np.sqrt(jc + np.sqrt(jc**2 + 6.76 * ((0.7 * Fy) / E)**2))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Mn_inelastic = Cb * (Mp - (Mp - 0.7 * Fy * Sx) * ((Lb - Lp) / (Lr - Lp)))
+        L_rts = Lb / rts
+        Fcr = (Cb * math.pi**2 * E) / L_rts**2 * np.sqrt(1 + 0.078 * jc * L_rts**2)
+
+    # Closed sections (rts is NaN) yield without LTB, as in calculate_flexure
+    closed = np.isnan(rts)
+    Lp = np.where(closed, np.inf, Lp)
+    Lr = np.where(closed, np.inf, Lr)
+    zone = np.where(closed, ZONE_CLOSED, np.where(
+        Lb <= Lp, ZONE_YIELDING, np.where(Lb <= Lr, ZONE_INELASTIC_LTB, ZONE_ELASTIC_LTB)))
+    Mn = np.where(zone <= ZONE_YIELDING, Mp,
+                  np.minimum(np.where(zone == ZONE_INELASTIC_LTB, Mn_inelastic, Fcr * Sx), Mp))
+
+    # Flange / web local buckling from the classification lookup, as in calculate_flexure
+    local = local_buckling(profiles, Fy)
+    M_flb, M_wlb = local["flb"] * Mp, local["wlb"] * Mp
+    governs = np.minimum(M_flb, M_wlb) < Mn
+    zone = np.where(governs, np.where(M_flb <= M_wlb, ZONE_FLB, ZONE_WLB), zone)
+    Mn = np.where(governs, np.minimum(M_flb, M_wlb), Mn)
+    Fcr = np.where(zone == ZONE_ELASTIC_LTB, Fcr, np.nan)
+    return {"phi_Mn": 0.9 * Mn, "Mn": Mn, "Mp": Mp, "Lp": Lp, "Lr": Lr, "Lb": Lb, "zone": zone, "Fcr": Fcr}
+
+
+@instrumented("batch", "flexure")
+def flexure_batch(profiles, Lb, Cb, Fy):
+    """
+    Vectorized calculate_flexure.
+
+    Args:
+        profiles (SteelProfile or sequence of SteelProfile): See profile_columns.
+
+    Returns:
+        ResultTable: Columns phi_Mn, Mn, Mp, Lp, Lr, Lb, zone (0-3, see core.results), Fcr (NaN unless zone 3)
+    """
+    return ResultTable(FlexureResult, _flexure_columns(profiles, Lb, Cb, Fy))
+
+
+@instrumented("batch", "weld")
+def weld_batch(weld_type, Fexx, size, length):
+    """
+    Vectorized calculate_weld. Rows with an unknown weld type are NaN.
+
+    Returns:
+        ResultTable: Columns phi_Rn, Rn, Awe, Fnw, phi
+    """
+    weld_type = np.asarray(weld_type)
+    te = np.where(weld_type == "Fillet", 0.707 * _f(size), np.where(weld_type == "Groove", _f(size), np.nan))
+    Fnw = 0.6 * _f(Fexx)
+    Awe = te * _f(length)
+    Rn = Fnw * Awe
+    phi = np.where(np.isnan(te), np.nan, 0.75)
+    return ResultTable(WeldResult, {"phi_Rn": phi * Rn, "Rn": Rn, "Awe": Awe, "Fnw": Fnw, "phi": phi})
+
+
+def combined_capacities(profiles, Kx, Lx, Ky, Ly, Lb, Cb, Fy):
+    """
+    Design strengths entering the H1-1 interaction: compression (with slender-element
+    reduction), major-axis flexure and minor-axis flexure (with flange local buckling).
+
+    Returns:
+        dict: Arrays phi_Pn, phi_Mnx, phi_Mny
+    """
+    Zy = profile_columns(profiles, ("Zy",))["Zy"]
+    return {
+        "phi_Pn": _section_compression_columns(profiles, Kx, Lx, Ky, Ly, Fy)["phi_Pn"],
+        "phi_Mnx": _flexure_columns(profiles, Lb, Cb, Fy)["phi_Mn"],
+        "phi_Mny": 0.9 * local_buckling(profiles, Fy)["flb_y"] * _f(Fy) * _f(Zy),
+    }
+
+
+def _combined_columns(profiles, Pu, Mux, Muy, L, K, Cb, Fy):
+    cap = combined_capacities(profiles, K, L, K, L, L, Cb, Fy)
+    phi_Pn, phi_Mnx, phi_Mny = cap["phi_Pn"], cap["phi_Mnx"], cap["phi_Mny"]
+
+    Pr = _f(Pu) / phi_Pn
+    Mrx = _f(Mux) / phi_Mnx
+    Mry = _f(Muy) / phi_Mny
+    high = Pr >= 0.2
+    ratio = np.where(high, Pr + (8 / 9) * (Mrx + Mry), Pr / 2 + (Mrx + Mry))
+    return {
+        "ratio": ratio,
+        "eq": np.where(high, "H1-1a (Pr >= 0.2)", "H1-1b (Pr < 0.2)"),
+        "Pr": Pr,
+        "Mrx": Mrx,
+        "Mry": Mry,
+        "phi_Pn": phi_Pn,
+        "phi_Mnx": phi_Mnx,
+        "phi_Mny": phi_Mny,
+        "status": np.where(ratio <= 1.0, "OK", "NOT SAFE"),
+    }
+
+
+@instrumented("batch", "combined")
+def combined_batch(profiles, Pu, Mux, Muy, L, K, Cb, Fy):
+    """
+    Vectorized calculate_combined.
+
+    Returns:
+        ResultTable: Columns ratio, eq, Pr, Mrx, Mry, phi_Pn, phi_Mnx, phi_Mny, status
+    """
+    return ResultTable(CombinedResult, _combined_columns(profiles, Pu, Mux, Muy, L, K, Cb, Fy))
+
+
+@instrumented("batch", "base_plate")
+def base_plate_batch(Pu, fc, B, N, profile_d, profile_bf):
+    """
+    Vectorized calculate_base_plate.
+
+    Returns:
+        ResultTable: Columns phi_Pp, bearing_ratio, t_req, m, n, A1, status
+    """
+    Pu, B, N = _f(Pu), _f(B), _f(N)
+    A1 = B * N
+    phi_Pp = 0.65 * 0.85 * _f(fc) * A1
+    bearing_ratio = Pu / phi_Pp
+    m = (N - 0.95 * _f(profile_d)) / 2
+    n = (B - 0.8 * _f(profile_bf)) / 2
+    t_req = np.maximum(m, n) * np.sqrt(np.maximum((2 * Pu) / (0.9 * 250 * A1), 0.0))
+    return ResultTable(BasePlateResult, {
+        "phi_Pp": phi_Pp,
+        "bearing_ratio": bearing_ratio,
+        "t_req": t_req,
+        "m": m,
+        "n": n,
+        "A1": A1,
+        "status": np.where(bearing_ratio <= 1.0, "OK", "Plate Area Too Small"),
+    })
+
+
+@instrumented("batch", "moment_plate")
+def moment_plate_batch(Mu_kNm, d_bolt, n_bolts, thick_plate, profiles, Fnt=620):
+    """
+    Vectorized calculate_moment_plate.
+
+    Returns:
+        ResultTable: Columns Tu_total, Tu_bolt, phi_Rn_bolt, bolt_ratio, plate_check, status
+    """
+    props = profile_columns(profiles, ("d", "tf"))
+    Tu_total = _f(Mu_kNm) * 1000000 / (_f(props["d"]) - _f(props["tf"]))
+    Tu_bolt = Tu_total / _f(n_bolts)
+    phi_Rn_bolt = 0.75 * _f(Fnt) * 0.25 * math.pi * _f(d_bolt)**2
+    bolt_ratio = Tu_bolt / phi_Rn_bolt
+    plate_ok = _f(thick_plate) >= _f(d_bolt)
+    return ResultTable(MomentPlateResult, {
+        "Tu_total": Tu_total,
+        "Tu_bolt": Tu_bolt,
+        "phi_Rn_bolt": phi_Rn_bolt,
+        "bolt_ratio": bolt_ratio,
+        "plate_check": np.where(plate_ok, "OK", "Plate too thin (Ref < d_bolt)"),
+        "status": np.where((bolt_ratio <= 1.0) & plate_ok, "OK", "NOT SAFE"),
+    })
+
+
+# Registry shared by the calculation service and parametric sweeps:
+# check name -> (scalar function, batch kernel). Defaults of optional inputs come from
+# the scalar function's signature.
+CHECKS = {
+    "tension": (calculations.calculate_tension, tension_batch),
+    "compression": (calculations.calculate_compression, compression_batch),
+    "bolt_shear": (calculations.calculate_bolt_shear, bolt_shear_batch),
+    "flexure": (calculations.calculate_flexure, flexure_batch),
+    "weld": (calculations.calculate_weld, weld_batch),
+    "combined": (calculations.calculate_combined, combined_batch),
+    "base_plate": (calculations.calculate_base_plate, base_plate_batch),
+    "moment_plate": (calculations.calculate_moment_plate, moment_plate_batch),
+}
+
+# Kernel arguments taken from the profile when a profile is given: argument -> attribute
+PROFILE_INPUTS = {
+    "tension": {"Ag": "Ag", "Ae": "Ag"},
+    "compression": {"Ag": "Ag", "rx": "rx", "ry": "ry"},
+    "base_plate": {"profile_d": "d", "profile_bf": "bf"},
+}
+
+
+def _kernel_inputs(check):
+    scalar, kernel = CHECKS[check]
+    names = tuple(("profile" if p == "profiles" else p) for p in inspect.signature(kernel).parameters)
+    defaults = {k: v.default for k, v in inspect.signature(scalar).parameters.items()
+                if v.default is not inspect.Parameter.empty}
+    return names, defaults
+
+
+_INPUTS = {check: _kernel_inputs(check) for check in CHECKS}
+
+
+def kernel_inputs(check):
+    """
+    Inputs of a check's batch kernel.
+
+    Returns:
+        tuple: (argument names in kernel order, with "profile" for the profile list;
+            dict of defaults for optional inputs)
+    """
+    return _INPUTS[check]
+
+
+def profile_inputs(check, profile):
+    """Kernel arguments of a check that can be filled from a SteelProfile."""
+    return {name: getattr(profile, attr) for name, attr in PROFILE_INPUTS.get(check, {}).items()}
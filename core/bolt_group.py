@@ -0,0 +1,300 @@
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.instrumentation import instrumented, count
+from core.results import ResultTable, BoltGroupResult
+
+# Eccentrically loaded bolt groups (AISC Manual Part 7).
+#
+# Instantaneous center of rotation (IC) method: under a load P the plate rotates about
+# an unknown point; each bolt deforms in proportion to its distance from that point,
+#     delta_i = DELTA_MAX * r_i / r_max,   R_i = Rult * (1 - exp(-10 delta_i))^0.55  (delta in inches),
+# acting perpendicular to r_i. For a trial IC the moment balance gives P; the IC is the
+# point where the horizontal and vertical force balances also hold. That 2-unknown
+# system is solved by damped Newton iteration, starting from the elastic-method IC, for
+# a whole stack of bolt groups at once (residuals are array operations over all bolts of
+# all groups). The result is the coefficient C = P / Rult, so the design strength is
+# phi * C * rn with rn the strength of one bolt.
+#
+# Load geometry: the load acts at angle `angle` (degrees) from vertical along a line at
+# distance e from the bolt group centroid; angle = 0 is a vertical load at x = e.
+
+DELTA_MAX = 0.34  # in, bolt deformation at ultimate (AISC)
+MAX_ITER = 60
+TOLERANCE = 1e-10
+# Starting points tried by solve_ic, as fractions of the elastic IC distance
+START_FACTORS = (0.25, 0.5, 0.75)
+
+CACHE_SIZE = 4096  # solved (group, e, angle) cases kept, least recently used evicted first
+
+
+class CoefficientCache:
+    """Bounded LRU map of solved cases: (group, e, angle) -> (C, C_elastic)."""
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+
+_cache = CoefficientCache()
+
+
+@dataclass(frozen=True)
+class BoltGroup:
+    """
+    Bolt positions in mm, any origin (rows of (x, y)).
+    """
+    points: tuple
+
+    def __post_init__(self):
+        # Tuples keep the group hashable for the coefficient cache
+        object.__setattr__(self, "points", tuple((float(x), float(y)) for x, y in self.points))
+
+    @classmethod
+    def grid(cls, n_rows, n_cols=1, pitch=75.0, gauge=75.0):
+        """Rectangular pattern: n_rows rows (vertical spacing pitch) by n_cols columns (spacing gauge)."""
+        return cls([(j * gauge, i * pitch) for i in range(n_rows) for j in range(n_cols)])
+
+    def centered(self):
+        """Bolt positions as an array relative to the group centroid."""
+        pts = np.array(self.points)
+        return pts - pts.mean(axis=0)
+
+
+def load_line(e, angle):
+    """Direction u of the load and a point A on its line of action, per case."""
+    t = np.radians(angle)
+    u = np.stack([np.sin(t), -np.cos(t)], axis=-1)             # load direction
+    A = np.asarray(e)[..., None] * np.stack([np.cos(t), np.sin(t)], axis=-1)  # point on the line of action
+    return u, A
+
+
+def elastic_coefficient(group, e, angle=0.0):
+    """
+    Elastic-method coefficient: load per unit bolt strength at which the most stressed bolt
+    reaches its strength (direct shear plus torsion about the centroid).
+    """
+    pts = group.centered()
+    n = len(pts)
+    u, A = load_line(e, angle)
+    Ip = np.sum(pts**2)
+    M = A[0] * u[1] - A[1] * u[0]  # moment of a unit load about the centroid
+    force = u / n + (M / Ip if Ip > 0 else 0.0) * np.stack([-pts[:, 1], pts[:, 0]], axis=1)
+    return 1.0 / np.max(np.hypot(force[:, 0], force[:, 1]))
+
+
+def _residual(c, pts, u, A):
+    """
+    Force imbalance and load for trial ICs.
+
+    Args:
+        c (ndarray): (m, 2) trial IC locations.
+        pts (ndarray): (m, n, 2) bolt positions about the centroid.
+        u, A (ndarray): (m, 2) load direction and a point on its line.
+
+    Returns:
+        tuple: (residual (m, 2), P (m,)) for Rult = 1.
+    """
+    r = pts - c[:, None, :]
+    d = np.hypot(r[..., 0], r[..., 1])
+    d_max = d.max(axis=1, keepdims=True)
+    R = (1 - np.exp(-10 * DELTA_MAX * d / d_max)) ** 0.55
+    arm = (A[:, 0] - c[:, 0]) * u[:, 1] - (A[:, 1] - c[:, 1]) * u[:, 0]
+    sense = np.where(arm >= 0, 1.0, -1.0)
+    P = np.sum(R * d, axis=1) / np.abs(arm)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scale = np.where(d > 0, R / d, 0.0)
+    # Bolt forces on the plate oppose the rotation caused by the load
+    Fx = np.sum(sense[:, None] * scale * r[..., 1], axis=1)
+    Fy = -np.sum(sense[:, None] * scale * r[..., 0], axis=1)
+    return np.stack([Fx + P * u[:, 0], Fy + P * u[:, 1]], axis=1), P
+
+
+def solve_ic(residual, c, size):
+    """
+    Damped Newton iteration for the IC of a stack of groups.
+
+    The imbalance also vanishes for an IC at infinity (pure translation), so the
+    iteration is started from the elastic IC and from points between it and the
+    centroid; of the converged starts, the IC closest to the centroid is kept.
+
+    Args:
+        residual (callable): (c (k, 2), rows (k,)) -> (force imbalance (k, 2), P (k,))
+            for trial ICs of the groups at `rows`.
+        c (ndarray): (m, 2) elastic-method ICs.
+        size (ndarray): (m,) characteristic size of each group (finite-difference step scale).
+
+    Returns:
+        ndarray: P (m,) at the converged ICs.
+    """
+    m = len(c)
+    rows = np.tile(np.arange(m), len(START_FACTORS) + 1)
+    c = np.concatenate([c] + [f * c for f in START_FACTORS])
+    h = 1e-6 * size[rows]
+    F, P = residual(c, rows)
+    norm = np.hypot(F[:, 0], F[:, 1])
+    active = np.flatnonzero(norm > TOLERANCE * np.maximum(P, 1.0))
+    for _ in range(MAX_ITER):
+        if not len(active):
+            break
+        # Finite-difference Jacobian of the unconverged starts
+        ca, Fa, ha = c[active], F[active], h[active]
+        J = np.empty((len(active), 2, 2))
+        for k in range(2):
+            dc = np.zeros_like(ca)
+            dc[:, k] = ha
+            J[:, :, k] = (residual(ca + dc, rows[active])[0] - Fa) / ha[:, None]
+        det = J[:, 0, 0] * J[:, 1, 1] - J[:, 0, 1] * J[:, 1, 0]
+        det = np.where(np.abs(det) > 1e-300, det, 1e-300)
+        step = -np.stack([J[:, 1, 1] * Fa[:, 0] - J[:, 0, 1] * Fa[:, 1],
+                          -J[:, 1, 0] * Fa[:, 0] + J[:, 0, 0] * Fa[:, 1]], axis=1) / det[:, None]
+        # Backtracking: halve the step until the imbalance decreases
+        pending, t, moved = active, np.ones(len(active)), np.zeros(len(active), dtype=bool)
+        for _ in range(12):
+            todo = ~moved
+            trial = c[pending] + t[todo, None] * step[todo]
+            F_trial, P_trial = residual(trial, rows[pending])
+            norm_trial = np.hypot(F_trial[:, 0], F_trial[:, 1])
+            ok = norm_trial < norm[pending]
+            done = pending[ok]
+            c[done], F[done], P[done], norm[done] = trial[ok], F_trial[ok], P_trial[ok], norm_trial[ok]
+            moved[np.flatnonzero(todo)[ok]] = True
+            pending = pending[~ok]
+            if not len(pending):
+                break
+            t[~moved] /= 2
+        # Starts that can no longer improve are dropped
+        active = active[moved]
+        active = active[norm[active] > TOLERANCE * np.maximum(P[active], 1.0)]
+
+    converged = norm <= 1e3 * TOLERANCE * np.maximum(P, 1.0)
+    distance = np.where(converged, np.hypot(c[:, 0], c[:, 1]), np.inf).reshape(-1, m)
+    pick = np.argmin(distance, axis=0)
+    # Groups without any converged start fall back to their smallest imbalance
+    fallback = ~np.isfinite(distance.min(axis=0))
+    pick[fallback] = np.argmin((norm / P).reshape(-1, m)[:, fallback], axis=0)
+    return P.reshape(-1, m)[pick, np.arange(m)]
+
+
+def elastic_ic(Ip, total, e, angle):
+    """Elastic-method IC: distance Ip / (total e) from the centroid, on the side opposite the load."""
+    r0 = Ip / (total * np.abs(e))
+    t = np.radians(angle)
+    return -(np.sign(e) * r0)[:, None] * np.stack([np.cos(t), np.sin(t)], axis=-1)
+
+
+def _solve_stack(pts, e, angle):
+    """IC coefficients for a stack of groups with the same number of bolts."""
+    m, n = pts.shape[:2]
+    u, A = load_line(e, angle)
+    Ip = np.sum(pts**2, axis=(1, 2))
+    P = solve_ic(lambda c, rows: _residual(c, pts[rows], u[rows], A[rows]), elastic_ic(Ip, n, e, angle), np.maximum(np.sqrt(Ip / n), 1.0))
+    count("bolt_group.solved", m)
+    return P
+
+
+@instrumented("bolt_group", "ic_coefficients")
+def ic_coefficients(groups, e, angle=0.0):
+    """
+    IC-method coefficients C for many (group, e, angle) cases. Cases already solved are
+    taken from the cache; the rest are solved together, stacked by bolt count.
+
+    Args:
+        groups (BoltGroup or sequence of BoltGroup): Bolt groups.
+        e (float or array): Eccentricity of the load line from the centroid (mm).
+        angle (float or array): Load angle from vertical (degrees).
+
+    Returns:
+        tuple: (C, C_elastic) arrays.
+    """
+    if isinstance(groups, BoltGroup):
+        groups = [groups]
+    n_cases = max(len(groups), np.size(e), np.size(angle))
+    groups = groups * n_cases if len(groups) == 1 else groups
+    e = np.broadcast_to(np.asarray(e, dtype=float), (n_cases,))
+    angle = np.broadcast_to(np.asarray(angle, dtype=float), (n_cases,))
+    keys = [(g, round(float(ei), 9), round(float(ai), 9)) for g, ei, ai in zip(groups, e, angle)]
+
+    found = {}  # this call's cases, independent of what the bounded cache evicts
+    pending = {}
+    for k in dict.fromkeys(keys):
+        found[k] = _cache.get(k)
+        if found[k] is not None:
+            continue
+        group, ek, ak = k
+        n = len(group.points)
+        if ek == 0 or n == 1:
+            found[k] = (float(n), float(n))  # concentric: every bolt reaches its strength
+            _cache.put(k, found[k])
+        else:
+            pending.setdefault(n, []).append(k)
+
+    for stack in pending.values():
+        pts = np.stack([k[0].centered() for k in stack])
+        P = _solve_stack(pts, np.array([k[1] for k in stack]), np.array([k[2] for k in stack]))
+        for k, C in zip(stack, P):
+            found[k] = (float(C), float(elastic_coefficient(k[0], k[1], k[2])))
+            _cache.put(k, found[k])
+
+    C = np.array([found[k][0] for k in keys])
+    C_elastic = np.array([found[k][1] for k in keys])
+    return C, C_elastic
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def ic_coefficient(group, e, angle=0.0):
+    """IC-method coefficient C of one bolt group (cached)."""
+    return float(ic_coefficients(group, e, angle)[0][0])
+
+
+def eccentric_bolt_batch(groups, e, angle, db, Fnv, phi=0.75):
+    """
+    Design shear strength of eccentrically loaded bolt groups (IC method).
+
+    Args:
+        groups (BoltGroup or sequence of BoltGroup): Bolt groups.
+        e (float or array): Load eccentricity from the centroid (mm).
+        angle (float or array): Load angle from vertical (degrees).
+        db (float or array): Bolt diameter (mm).
+        Fnv (float or array): Nominal shear stress (MPa).
+
+    Returns:
+        ResultTable: Columns phi_Rn, Rn, C, C_elastic, rn (strength of one bolt)
+    """
+    C, C_elastic = ic_coefficients(groups, e, angle)
+    rn = np.asarray(Fnv, dtype=float) * 0.25 * math.pi * np.asarray(db, dtype=float)**2
+    Rn = C * rn
+    return ResultTable(BoltGroupResult, {"phi_Rn": phi * Rn, "Rn": Rn, "C": C, "C_elastic": C_elastic, "rn": rn})
+
+
+def calculate_eccentric_bolts(group, e, angle, db, Fnv, phi=0.75):
+    """
+    Scalar form of eccentric_bolt_batch.
+
+    Returns:
+        BoltGroupResult
+    """
+    return eccentric_bolt_batch(group, e, angle, db, Fnv, phi)[0]
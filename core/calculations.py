@@ -1,8 +1,13 @@
 import math
 
-# Constants
-E_STEEL = 200000  # MPa
+from core.classification import E_STEEL, local_buckling, effective_area_ratio
+from core.instrumentation import instrumented
+from core.results import (
+    LimitState, TensionResult, CompressionResult, BoltShearResult, FlexureResult,
+    WeldResult, CombinedResult, BasePlateResult, MomentPlateResult
+)
 
+@instrumented("calc", "tension")
 def calculate_tension(Ag, Ae, Fy, Fu):
     """
     Calculate design tensile strength according to SNI 1729 (AISC 360).
@@ -10,12 +15,12 @@ def calculate_tension(Ag, Ae, Fy, Fu):
     
     Args:
         Ag (float): Gross area (mm2)
-        Ae (float): Effective net area (mm2). Assuming Ae = Ag for now if no connection details provided, but usually user inputs U.
+        Ae (float): Effective net area (mm2), U * An (see core.net_section)
         Fy (float): Yield strength (MPa)
         Fu (float): Ultimate strength (MPa)
         
     Returns:
-        dict: Results including Pn_yield, Pn_rupture, phi_Pn
+        TensionResult: phi_Pn plus "yield" and "rupture" limit states (dict-style access)
     """
     # Yielding in gross section
     Pn_yield = Fy * Ag
@@ -29,12 +34,13 @@ def calculate_tension(Ag, Ae, Fy, Fu):
 
     phi_Pn = min(phi_Pn_yield, phi_Pn_rupture)
     
-    return {
-        "phi_Pn": phi_Pn,
-        "yield": {"Pn": Pn_yield, "phi_Pn": phi_Pn_yield},
-        "rupture": {"Pn": Pn_rupture, "phi_Pn": phi_Pn_rupture}
-    }
+    return TensionResult(
+        phi_Pn=phi_Pn,
+        yield_=LimitState(Pn=Pn_yield, phi_Pn=phi_Pn_yield),
+        rupture=LimitState(Pn=Pn_rupture, phi_Pn=phi_Pn_rupture)
+    )
 
+@instrumented("calc", "compression")
 def calculate_compression(Ag, rx, ry, Kx, Lx, Ky, Ly, Fy):
     """
     Calculate design compressive strength.
@@ -68,14 +74,15 @@ def calculate_compression(Ag, rx, ry, Kx, Lx, Ky, Ly, Fy):
     phi = 0.9
     phi_Pn = phi * Pn
     
-    return {
-        "phi_Pn": phi_Pn,
-        "Pn": Pn,
-        "Fcr": Fcr,
-        "KL_r": KL_r,
-        "Fe": Fe
-    }
+    return CompressionResult(
+        phi_Pn=phi_Pn,
+        Pn=Pn,
+        Fcr=Fcr,
+        KL_r=KL_r,
+        Fe=Fe
+    )
 
+@instrumented("calc", "bolt_shear")
 def calculate_bolt_shear(db, n, Fnv, threads_excluded=True):
     """
     Calculate bolt shear capacity.
@@ -91,12 +98,13 @@ def calculate_bolt_shear(db, n, Fnv, threads_excluded=True):
     phi = 0.75
     phi_Rn = phi * Rn
     
-    return {
-        "phi_Rn": phi_Rn,
-        "Rn": Rn,
-        "Ab": Ab
-    }
+    return BoltShearResult(
+        phi_Rn=phi_Rn,
+        Rn=Rn,
+        Ab=Ab
+    )
 
+@instrumented("calc", "flexure")
 def calculate_flexure(profile, Lb, Cb, Fy):
     """
     Calculate design flexural strength (Moment Capacity).
@@ -145,7 +153,12 @@ def calculate_flexure(profile, Lb, Cb, Fy):
     Mn = 0
     buckling_state = ""
     
-    if Lb <= Lp:
+    if math.isnan(rts):
+        # Closed section (HSS): rts is undefined and LTB does not govern (F7)
+        Lp = Lr = math.inf
+        Mn = Mp
+        buckling_state = "Yielding (closed section, no LTB)"
+    elif Lb <= Lp:
         # Zone 1: Plastic Moment
         Mn = Mp
         buckling_state = "Yielding (Lb <= Lp)"
@@ -170,20 +183,33 @@ def calculate_flexure(profile, Lb, Cb, Fy):
         Mn = Fcr * Sx
         Mn = min(Mn, Mp) # Cap at Mp
         buckling_state = f"Elastic LTB (Lb > Lr), Fcr={Fcr:.2f} MPa"
-    
+
+    # 3. Flange / web local buckling (F3-F7), from the classification lookup
+    local = local_buckling(profile, Fy)
+    M_flb = float(local["flb"]) * Mp
+    M_wlb = float(local["wlb"]) * Mp
+    if min(M_flb, M_wlb) < Mn:
+        if M_flb <= M_wlb:
+            Mn = M_flb
+            buckling_state = "Flange local buckling"
+        else:
+            Mn = M_wlb
+            buckling_state = "Web local buckling"
+
     phi = 0.9
     phi_Mn = phi * Mn
     
-    return {
-        "phi_Mn": phi_Mn,
-        "Mn": Mn,
-        "Mp": Mp,
-        "Lp": Lp,
-        "Lr": Lr,
-        "Lb": Lb,
-        "state": buckling_state
-    }
+    return FlexureResult(
+        phi_Mn=phi_Mn,
+        Mn=Mn,
+        Mp=Mp,
+        Lp=Lp,
+        Lr=Lr,
+        Lb=Lb,
+        state=buckling_state
+    )
 
+@instrumented("calc", "weld")
 def calculate_weld(weld_type, Fexx, size, length):
     """
     Calculate design strength of welded connections.
@@ -219,14 +245,15 @@ def calculate_weld(weld_type, Fexx, size, length):
 
     phi_Rn = phi * Rn
     
-    return {
-        "phi_Rn": phi_Rn,
-        "Rn": Rn,
-        "Awe": Awe,
-        "Fnw": Fnw,
-        "phi": phi
-    }
+    return WeldResult(
+        phi_Rn=phi_Rn,
+        Rn=Rn,
+        Awe=Awe,
+        Fnw=Fnw,
+        phi=phi
+    )
 
+@instrumented("calc", "combined")
 def calculate_combined(profile, Pu, Mux, Muy, L, K, Cb, Fy):
     """
     Calculate combined forces capacity (Beam-Column).
@@ -245,7 +272,8 @@ def calculate_combined(profile, Pu, Mux, Muy, L, K, Cb, Fy):
     # 1. Axial Capacity (Comp)
     # Assume Kx=Ky=K and Lx=Ly=L for simplification
     res_comp = calculate_compression(profile.Ag, profile.rx, profile.ry, K, L, K, L, Fy)
-    phi_Pn = res_comp['phi_Pn']
+    # Slender elements: effective area at Fcr (E7)
+    phi_Pn = res_comp['phi_Pn'] * float(effective_area_ratio(profile, Fy, res_comp['Fcr']))
     
     # 2. Flexural Capacity X (Strong Axis)
     # Assume Lb = L
@@ -256,9 +284,8 @@ def calculate_combined(profile, Pu, Mux, Muy, L, K, Cb, Fy):
     # Weak axis bending of I-shapes: LTB does not apply.
     # Yield limit: Mpy = min(FyZy, 1.6FySy)
     # We will just take Mpy = Fy * Zy for simplicity.
-    Mny = Fy * profile.Zy
-    # Check flange local buckling if necessary (rare for hot rolled standard profiles to be non-compact)
-    # Assume compact for now.
+    # Flange local buckling (F6 / F7) from the classification lookup.
+    Mny = float(local_buckling(profile, Fy)["flb_y"]) * Fy * profile.Zy
     phi_Mny = 0.9 * Mny
     
     # 4. Interaction Check
@@ -278,18 +305,19 @@ def calculate_combined(profile, Pu, Mux, Muy, L, K, Cb, Fy):
         ratio = (Pr / 2) + (Mrx + Mry)
         eq_used = "H1-1b (Pr < 0.2)"
         
-    return {
-        "ratio": ratio,
-        "eq": eq_used,
-        "Pr": Pr,
-        "Mrx": Mrx,
-        "Mry": Mry,
-        "phi_Pn": phi_Pn,
-        "phi_Mnx": phi_Mnx,
-        "phi_Mny": phi_Mny,
-        "status": "OK" if ratio <= 1.0 else "NOT SAFE"
-    }
+    return CombinedResult(
+        ratio=ratio,
+        eq=eq_used,
+        Pr=Pr,
+        Mrx=Mrx,
+        Mry=Mry,
+        phi_Pn=phi_Pn,
+        phi_Mnx=phi_Mnx,
+        phi_Mny=phi_Mny,
+        status="OK" if ratio <= 1.0 else "NOT SAFE"
+    )
 
+@instrumented("calc", "base_plate")
 def calculate_base_plate(Pu, fc, B, N, profile_d, profile_bf):
     """
     Calculate Column Base Plate thickness and bearing.
@@ -335,18 +363,17 @@ def calculate_base_plate(Pu, fc, B, N, profile_d, profile_bf):
     except ValueError:
         t_req = 0.0 # If Pu is negative (tension), base plate logic different. Assume compression only.
 
-    return {
-        "phi_Pp": phi_Pp,
-        "bearing_ratio": bearing_ratio,
-        "t_req": t_req,
-        "m": m,
-        "n": n,
-        "A1": A1,
-        "n": n,
-        "A1": A1,
-        "status": "OK" if bearing_ratio <= 1.0 else "Plate Area Too Small"
-    }
+    return BasePlateResult(
+        phi_Pp=phi_Pp,
+        bearing_ratio=bearing_ratio,
+        t_req=t_req,
+        m=m,
+        n=n,
+        A1=A1,
+        status="OK" if bearing_ratio <= 1.0 else "Plate Area Too Small"
+    )
 
+@instrumented("calc", "moment_plate")
 def calculate_moment_plate(Mu_kNm, d_bolt, n_bolts, thick_plate, profile, Fnt=620, Fy_plate=250):
     """
     Calculate Moment End Plate (Flush, 4-Bolt type assumption).
@@ -404,11 +431,11 @@ def calculate_moment_plate(Mu_kNm, d_bolt, n_bolts, thick_plate, profile, Fnt=62
     if thick_plate < d_bolt:
         plate_check = "Plate too thin (Ref < d_bolt)"
         
-    return {
-        "Tu_total": Tu_total,
-        "Tu_bolt": Tu_bolt,
-        "phi_Rn_bolt": phi_Rn_bolt,
-        "bolt_ratio": bolt_ratio,
-        "plate_check": plate_check,
-        "status": "OK" if (bolt_ratio <= 1.0 and plate_check == "OK") else "NOT SAFE"
-    }
+    return MomentPlateResult(
+        Tu_total=Tu_total,
+        Tu_bolt=Tu_bolt,
+        phi_Rn_bolt=phi_Rn_bolt,
+        bolt_ratio=bolt_ratio,
+        plate_check=plate_check,
+        status="OK" if (bolt_ratio <= 1.0 and plate_check == "OK") else "NOT SAFE"
+    )
@@ -0,0 +1,234 @@
+import csv
+import hashlib
+import io
+import os
+import sys
+
+import numpy as np
+
+from core.instrumentation import instrumented, count
+from core.profiles import SteelProfile, _mm_columns
+from core.section_properties import DERIVED, catalogue_properties
+
+# Several profile catalogues (e.g. SNI/JIS, ASTM/AISC, EN) behind one query interface.
+# All sources share one float64 block with a column per property; section type and
+# standard are stored as small integer codes, and names are interned strings, so a
+# catalogue of thousands of sections costs a few hundred bytes per row. SteelProfile
+# objects are only created for rows that are actually requested.
+
+# Catalogue columns in SteelProfile constructor order: (attribute, CSV column, scale to N/mm units)
+COLUMNS = (
+    ("weight", "weight_kg_m", 1.0),
+    ("d", "depth_mm", 1.0),
+    ("bf", "width_mm", 1.0),
+    ("tw", "web_thick_mm", 1.0),
+    ("tf", "flange_thick_mm", 1.0),
+    ("Ag", "area_cm2", 100.0),
+    ("Ix", "ix_cm4", 1e4),
+    ("Iy", "iy_cm4", 1e4),
+    ("rx", "rx_cm", 10.0),
+    ("ry", "ry_cm", 10.0),
+    ("Zx", "zx_cm3", 1e3),
+    ("Zy", "zy_cm3", 1e3),
+)
+
+_N_RAW = len(COLUMNS)
+_INDEX = {attr: j for j, (attr, _, _) in enumerate(COLUMNS)}
+_INDEX.update({name: _N_RAW + j for j, name in enumerate(DERIVED)})
+_SCALE = np.array([scale for _, _, scale in COLUMNS] + [1.0] * len(DERIVED))
+
+
+class FederatedCatalogue:
+    """
+    Profiles from several catalogue files in one columnar store.
+
+    Usage:
+        cat = FederatedCatalogue({"SNI": "data/profiles.csv", "AISC": "aisc.csv"})
+        rows = cat.query(standard="SNI", section_type="WF", d=(200, 400))
+        profiles = cat.profiles(rows)
+
+    The catalogue also offers get_profile / get_all_names / version, so it can be used
+    wherever a ProfileDatabase is expected (member checks, the calculation service).
+    """
+    def __init__(self, sources=None):
+        """
+        Args:
+            sources (dict): Optional standard label -> CSV path, loaded in order.
+        """
+        self._data = np.empty((0, _N_RAW + len(DERIVED)))
+        self._names = []
+        self._type_codes = np.empty(0, dtype=np.uint8)
+        self._standard_codes = np.empty(0, dtype=np.uint8)
+        self.types = []       # code -> section type
+        self.standards = []   # code -> standard label
+        self._versions = []
+        self._by_name = {}            # name -> first row with that name
+        self._by_standard_name = {}   # (standard code, name) -> row
+        self._objects = {}            # row -> SteelProfile, materialized on demand
+        for standard, path in (sources or {}).items():
+            self.add(standard, path)
+
+    def __len__(self):
+        return len(self._names)
+
+    @staticmethod
+    def _code(table, value):
+        value = sys.intern(value)
+        if value not in table:
+            if len(table) == 255:
+                raise ValueError("Too many distinct categories for a uint8 code")
+            table.append(value)
+        return table.index(value)
+
+    @instrumented("parse", "federated_csv")
+    def add(self, standard, csv_path):
+        """
+        Append every section of one catalogue file under a standard label.
+
+        Returns:
+            int: Number of rows added.
+        """
+        if not os.path.exists(csv_path):
+            raise FileNotFoundError(f"Database file not found: {csv_path}")
+        if sys.intern(standard) in self.standards:
+            raise ValueError(f"Standard '{standard}' is already loaded")
+        with open(csv_path, 'rb') as f:
+            data = f.read()
+        version = hashlib.sha1(data).hexdigest()
+        rows = list(csv.DictReader(io.StringIO(data.decode('utf-8'))))
+        count("parse.rows", len(rows))
+        if not rows:
+            return 0
+
+        std = self._code(self.standards, standard)
+        block = np.empty((len(rows), self._data.shape[1]))
+        type_codes = np.empty(len(rows), dtype=np.uint8)
+        by_type = {}
+        for i, row in enumerate(rows):
+            type_codes[i] = self._code(self.types, row['type'])
+            by_type.setdefault(row['type'], []).append(i)
+        for section_type, idx in by_type.items():
+            part = [rows[i] for i in idx]
+            block[idx, :_N_RAW] = np.array([[row[column] for _, column, _ in COLUMNS] for row in part], dtype=float)
+            derived = catalogue_properties(csv_path, version, section_type, _mm_columns(part))
+            for j, name in enumerate(DERIVED):
+                block[idx, _N_RAW + j] = derived[name]
+
+        start = len(self._names)
+        for i, row in enumerate(rows):
+            name = sys.intern(row['name'])
+            self._names.append(name)
+            self._by_name.setdefault(name, start + i)
+            self._by_standard_name[(std, name)] = start + i
+
+        self._data = np.concatenate([self._data, block])
+        self._type_codes = np.concatenate([self._type_codes, type_codes])
+        self._standard_codes = np.concatenate([self._standard_codes, np.full(len(rows), std, dtype=np.uint8)])
+        self._versions.append(version)
+        return len(rows)
+
+    @property
+    def version(self):
+        """Combined fingerprint of every loaded source (changes when any file or the set changes)."""
+        key = ";".join(f"{s}={v}" for s, v in zip(self.standards, self._versions))
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def column(self, attr, rows=None):
+        """
+        One property as an array in N/mm units (same units as the SteelProfile attribute).
+
+        Args:
+            attr (str): Catalogue property (see COLUMNS) or derived property (r, h0, J, Cw, rts).
+            rows (array-like): Optional row indices.
+        """
+        j = _INDEX[attr]
+        values = self._data[:, j] if rows is None else self._data[rows, j]
+        return values * _SCALE[j]
+
+    def query(self, standard=None, section_type=None, **bounds):
+        """
+        Rows matching a standard, a section type and property ranges.
+
+        Args:
+            standard (str or list): Standard label(s), None for all.
+            section_type (str or list): Section type(s), None for all.
+            **bounds: attr=(low, high) in N/mm units; either end may be None,
+                e.g. d=(200, 400), Zx=(5e5, None).
+
+        Returns:
+            ndarray: Matching row indices, in load order.
+        """
+        mask = np.ones(len(self._names), dtype=bool)
+        for codes, table, wanted in ((self._standard_codes, self.standards, standard),
+                                     (self._type_codes, self.types, section_type)):
+            if wanted is None:
+                continue
+            wanted = [wanted] if isinstance(wanted, str) else wanted
+            mask &= np.isin(codes, [table.index(w) for w in wanted if w in table])
+        for attr, (low, high) in bounds.items():
+            values = self.column(attr)
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+        return np.flatnonzero(mask)
+
+    def names(self, rows=None):
+        if rows is None:
+            return list(self._names)
+        return [self._names[i] for i in rows]
+
+    def section_type(self, row):
+        return self.types[self._type_codes[row]]
+
+    def standard(self, row):
+        return self.standards[self._standard_codes[row]]
+
+    def profile(self, row):
+        """SteelProfile for one row (created once, then reused)."""
+        row = int(row)
+        p = self._objects.get(row)
+        if p is None:
+            values = self._data[row]
+            p = self._objects[row] = SteelProfile(
+                self._names[row], *values[:_N_RAW],
+                section_type=self.section_type(row),
+                derived={name: values[_N_RAW + j] for j, name in enumerate(DERIVED)}
+            )
+        return p
+
+    def profiles(self, rows=None):
+        """SteelProfiles of rows (every row when None)."""
+        if rows is None:
+            rows = range(len(self._names))
+        return [self.profile(i) for i in rows]
+
+    def get_profiles(self, section_type=None, standard=None):
+        """Profiles of a section type and standard (None for all), as ProfileDatabase.get_profiles."""
+        return self.profiles(self.query(standard=standard, section_type=section_type))
+
+    def get_profile(self, name, standard=None):
+        """
+        Profile by name; with several sources, the first loaded one wins unless
+        a standard is given.
+        """
+        if standard is None:
+            row = self._by_name.get(name)
+        elif standard in self.standards:
+            row = self._by_standard_name.get((self.standards.index(standard), name))
+        else:
+            row = None
+        return None if row is None else self.profile(row)
+
+    def get_all_names(self, section_type=None, standard=None):
+        rows = self.query(standard=standard, section_type=section_type)
+        names = self.names(rows)
+        # A name present in several sources is listed once
+        return list(dict.fromkeys(names))
+
+    def nbytes(self):
+        """Approximate memory held by the store (arrays, distinct name strings and indexes)."""
+        unique = {id(n): n for n in self._names}.values()
+        return (self._data.nbytes + self._type_codes.nbytes + self._standard_codes.nbytes
+                + sys.getsizeof(self._names) + sum(sys.getsizeof(n) for n in unique)
+                + sys.getsizeof(self._by_name) + sys.getsizeof(self._by_standard_name))
@@ -0,0 +1,157 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from core.batch import tension_batch, section_compression_batch, flexure_batch, combined_batch
+from core.results import result_type, ResultMixin, TensionResult, CompressionResult, FlexureResult, CombinedResult
+
+# Member checks driven by a structure model rather than a GUI view. Each member names
+# a check type, a catalogue profile and the check inputs; demands are compared against
+# the design strength so every check reports a utilisation ratio and a status.
+
+CHECK_TYPES = ("tension", "compression", "flexure", "combined")
+
+# Result type of each check, used to rebuild saved results
+RESULT_TYPES = {
+    "tension": TensionResult,
+    "compression": CompressionResult,
+    "flexure": FlexureResult,
+    "combined": CombinedResult,
+}
+
+# Input defaults (match the GUI defaults)
+DEFAULTS = {"Fy": 240.0, "Fu": 370.0, "K": 1.0, "Cb": 1.0, "U": 1.0, "Pu": 0.0, "Mu": 0.0, "Mux": 0.0, "Muy": 0.0}
+
+
+@dataclass
+class Member:
+    """
+    One member to be checked.
+
+    Args:
+        id (str): Unique member id.
+        check (str): One of CHECK_TYPES.
+        profile (str): Profile name in the ProfileDatabase.
+        params (dict): Check inputs in N, mm, MPa (e.g. L, K, Lb, Cb, Fy, Fu, U, Ae, Pu, Mu, Mux, Muy).
+        level (str): Optional storey / level label (used for grouping and queries, not in the check).
+    """
+    id: str
+    check: str
+    profile: str
+    params: dict = field(default_factory=dict)
+    level: str = None
+
+
+@result_type()
+class MemberResult(ResultMixin):
+    member_id: str
+    check: str
+    ratio: float
+    status: str
+    result: object
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a MemberResult from to_dict(), including its check result."""
+        return cls(data["member_id"], data["check"], data["ratio"], data["status"],
+                   RESULT_TYPES[data["check"]].from_dict(data["result"]))
+
+
+def _missing(member, name):
+    return ValueError(f"Missing parameter {name} for member {member.id} ({member.check})")
+
+
+def _column(members, key, default=None):
+    # Inputs without a default (here or in DEFAULTS) are required
+    if default is None:
+        default = DEFAULTS.get(key)
+    if default is None:
+        for m in members:
+            if key not in m.params:
+                raise _missing(m, f"'{key}'")
+    return np.fromiter((m.params.get(key, default) for m in members), dtype=float, count=len(members))
+
+
+def _lengths(members, key):
+    # Flexure uses Lb, compression Lx/Ly; all fall back to L
+    for m in members:
+        if key not in m.params and "L" not in m.params:
+            raise _missing(m, f"'{key}'" if key == "L" else f"'{key}' or 'L'")
+    return np.fromiter((m.params.get(key, m.params.get("L")) for m in members), dtype=float, count=len(members))
+
+
+def _evaluate_tension(members, profiles):
+    Ag = np.fromiter((p.Ag for p in profiles), dtype=float, count=len(profiles))
+    U = _column(members, "U")
+    Ae = np.fromiter((m.params.get("Ae", np.nan) for m in members), dtype=float, count=len(members))
+    Ae = np.where(np.isnan(Ae), U * Ag, Ae)
+    table = tension_batch(Ag, Ae, _column(members, "Fy"), _column(members, "Fu"))
+    return table, _column(members, "Pu") / table["phi_Pn"]
+
+
+def _evaluate_compression(members, profiles):
+    K = _column(members, "K")
+    Kx = np.fromiter((m.params.get("Kx", k) for m, k in zip(members, K)), dtype=float, count=len(members))
+    Ky = np.fromiter((m.params.get("Ky", k) for m, k in zip(members, K)), dtype=float, count=len(members))
+    # Slender-element reduction as in the combined check, so both agree at zero moment
+    table = section_compression_batch(profiles, Kx, _lengths(members, "Lx"), Ky, _lengths(members, "Ly"),
+                                      _column(members, "Fy"))
+    return table, _column(members, "Pu") / table["phi_Pn"]
+
+
+def _evaluate_flexure(members, profiles):
+    table = flexure_batch(profiles, _lengths(members, "Lb"), _column(members, "Cb"), _column(members, "Fy"))
+    Mu = np.fromiter((m.params.get("Mu", m.params.get("Mux", 0.0)) for m in members), dtype=float, count=len(members))
+    return table, Mu / table["phi_Mn"]
+
+
+def _evaluate_combined(members, profiles):
+    table = combined_batch(
+        profiles, _column(members, "Pu"), _column(members, "Mux"), _column(members, "Muy"),
+        _lengths(members, "L"), _column(members, "K"), _column(members, "Cb"), _column(members, "Fy")
+    )
+    return table, table["ratio"]
+
+
+EVALUATORS = {
+    "tension": _evaluate_tension,
+    "compression": _evaluate_compression,
+    "flexure": _evaluate_flexure,
+    "combined": _evaluate_combined,
+}
+
+
+def evaluate_members(members, db):
+    """
+    Run the checks for many members, grouped by check type through the batch kernels.
+
+    Args:
+        members (list of Member): Members to check.
+        db (ProfileDatabase): Catalogue used to resolve profile names.
+
+    Returns:
+        list of MemberResult: One result per member, in input order.
+    """
+    groups = {}
+    for i, m in enumerate(members):
+        if m.check not in EVALUATORS:
+            raise ValueError(f"Unknown check type '{m.check}' for member {m.id}")
+        groups.setdefault(m.check, []).append(i)
+
+    resolved = {}
+    out = [None] * len(members)
+    for check, idx in groups.items():
+        group = [members[i] for i in idx]
+        profiles = []
+        for m in group:
+            p = resolved.get(m.profile)
+            if p is None:
+                p = resolved[m.profile] = db.get_profile(m.profile)
+                if p is None:
+                    raise ValueError(f"Unknown profile '{m.profile}' for member {m.id}")
+            profiles.append(p)
+        table, ratio = EVALUATORS[check](group, profiles)
+        status = np.where(ratio <= 1.0, "OK", "NOT SAFE")
+        for j, i in enumerate(idx):
+            out[i] = MemberResult(members[i].id, check, float(ratio[j]), str(status[j]), table[j])
+    return out
@@ -0,0 +1,288 @@
+import numpy as np
+
+from core.instrumentation import instrumented, count
+from core.section_properties import FAMILY_BY_TYPE
+
+# Local buckling classification of section elements (SNI 1729 / AISC 360 Table B4.1).
+#
+# Width-to-thickness ratios only depend on the geometry, so they are computed once per
+# section, vectorized over every section added (e.g. a whole catalogue), and kept in a
+# lookup table keyed by section. Limits are multiples of sqrt(E / Fy); the element
+# classes and the local buckling strengths derived from them are cached per steel grade.
+# Local buckling strengths are stored as fractions of Mp, which is how the capacity
+# functions apply them (Mn = min(Mn from yielding / LTB, factor * Mp)).
+#
+# I-shapes (WF, H-Beam): flange b = bf/2 over tf; web h = d - 2(tf + r) over tw.
+#   Flexure F3 (flange local buckling), F4/F5 (noncompact / slender web), F6 (minor axis).
+# Box HSS (wall t = tw): flat widths B - 3t and H - 3t over t. Flexure F7.
+# Slender elements in compression: effective widths of E7.1.
+
+E_STEEL = 200000  # MPa
+
+COMPACT, NONCOMPACT, SLENDER = 0, 1, 2
+CLASS_NAMES = ("Compact", "Noncompact", "Slender")
+
+# Common structural steel grades, Fy in MPa (SNI 1729 BJ grades)
+GRADES = {"BJ 34": 210.0, "BJ 37": 240.0, "BJ 41": 250.0, "BJ 50": 290.0, "BJ 55": 410.0}
+_STANDARD_FY = frozenset(GRADES.values())
+
+# Table B4.1b (flexure): (lambda_p, lambda_r) / sqrt(E / Fy), for (flange, web)
+FLEXURE_LIMITS = {"I": ((0.38, 1.0), (3.76, 5.70)), "BOX": ((1.12, 1.40), (2.42, 5.70))}
+# Table B4.1a (compression): lambda_r / sqrt(E / Fy), for (flange, web)
+COMPRESSION_LIMITS = {"I": (0.56, 1.49), "BOX": (1.40, 1.40)}
+# Table E7.1 effective width imperfection factors (c1, c2), for (flange, web)
+EFFECTIVE_WIDTH = {"I": ((0.22, 1.49), (0.18, 1.31)), "BOX": ((0.20, 1.38), (0.20, 1.38))}
+
+GEOMETRY = ("box", "lam_f", "lam_w", "area_f", "area_w", "kc", "aw", "S_Zx", "S_Zy",
+            "d", "bf", "t_f", "t_w", "b_flat", "h_flat", "Ag", "Ix", "Iy", "Zx", "Zy")
+
+
+def section_key(profile):
+    """Lookup key of a section: name plus the plate dimensions (names may repeat across catalogues)."""
+    return (profile.section_type, profile.name, profile.d, profile.bf, profile.tw, profile.tf)
+
+
+def element_geometry(section_types, d, bf, tw, tf, r, Ag, Ix, Iy, Sx, Sy, Zx, Zy):
+    """
+    Width-to-thickness data of many sections (arrays, mm units).
+
+    Returns:
+        dict: Name in GEOMETRY -> array.
+    """
+    box = np.array([FAMILY_BY_TYPE.get(t, "I") == "BOX" for t in section_types], dtype=bool)
+    b_flat = np.where(box, bf - 3 * tw, bf / 2)
+    h_flat = np.where(box, d - 3 * tw, d - 2 * (tf + r))
+    t_f = np.where(box, tw, tf)
+    lam_f = b_flat / t_f
+    lam_w = h_flat / tw
+    return {
+        "box": box, "lam_f": lam_f, "lam_w": lam_w,
+        # Element areas as fractions of Ag (four half flanges of an I, two walls of each box side)
+        "area_f": np.where(box, 2, 4) * b_flat * t_f / Ag,
+        "area_w": np.where(box, 2, 1) * h_flat * tw / Ag,
+        "kc": np.clip(4 / np.sqrt(lam_w), 0.35, 0.76),
+        # F4-12 web-to-flange area ratio (capped at 10)
+        "aw": np.minimum(np.where(box, 2 * h_flat / b_flat, h_flat * tw / (bf * tf)), 10.0),
+        "S_Zx": Sx / Zx, "S_Zy": Sy / Zy,
+        "d": d, "bf": bf, "t_f": t_f, "t_w": tw, "b_flat": b_flat, "h_flat": h_flat,
+        "Ag": Ag, "Ix": Ix, "Iy": Iy, "Zx": Zx, "Zy": Zy,
+    }
+
+
+def _classes(lam, lam_p, lam_r):
+    return np.where(lam <= lam_p, COMPACT, np.where(lam <= lam_r, NONCOMPACT, SLENDER))
+
+
+def _box_effective_modulus(depth, t, b_flat, lam, I, Ag, Z, s):
+    """Se / Z of a box with a slender compression flange (F7-4 effective width)."""
+    be = np.minimum(1.92 * t * s * (1 - 0.38 / lam * s), b_flat)
+    lost = (b_flat - be) * t
+    y0 = (depth - t) / 2
+    shift = lost * y0 / (Ag - lost)  # neutral axis moves away from the compression flange
+    Ie = I - lost * y0**2 - (Ag - lost) * shift**2
+    return Ie / (depth / 2 + shift) / Z
+
+
+def grade_columns(g, Fy):
+    """
+    Element classes and local buckling factors (fractions of Mp) for one grade or an
+    array of Fy per row.
+
+    Args:
+        g (dict): Geometry rows (see element_geometry).
+        Fy (float or array): Yield strength (MPa).
+
+    Returns:
+        dict: flange / web (flexure classes), compression (COMPACT or SLENDER),
+            flb, wlb (major axis factors), flb_y (minor axis factor).
+    """
+    Fy = np.asarray(Fy, dtype=float)
+    s = np.sqrt(E_STEEL / Fy)
+    box = g["box"]
+    lam_f, lam_w, S_Zx, S_Zy = g["lam_f"], g["lam_w"], g["S_Zx"], g["S_Zy"]
+    (pf_i, rf_i), (pw_i, rw_i) = FLEXURE_LIMITS["I"]
+    (pf_b, rf_b), (pw_b, rw_b) = FLEXURE_LIMITS["BOX"]
+    pf, rf = np.where(box, pf_b, pf_i) * s, np.where(box, rf_b, rf_i) * s
+    pw, rw = np.where(box, pw_b, pw_i) * s, np.where(box, rw_b, rw_i) * s
+    flange, web = _classes(lam_f, pf, rf), _classes(lam_w, pw, rw)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Flange local buckling: F3-1 / F3-2 (I), F7-2 / F7-3 (box)
+        flb_nc = np.where(box, 1 - (1 - S_Zx) * (3.57 * lam_f / s - 4.0),
+                          1 - (1 - 0.7 * S_Zx) * (lam_f - pf) / (rf - pf))
+        flb_sl = np.where(box, _box_effective_modulus(g["d"], g["t_f"], g["b_flat"], lam_f, g["Ix"], g["Ag"], g["Zx"], s),
+                          0.9 * E_STEEL * g["kc"] * S_Zx / (Fy * lam_f**2))
+        flb = np.where(flange == COMPACT, 1.0, np.where(flange == NONCOMPACT, flb_nc, flb_sl))
+
+        # Web local buckling: F4-9b with Rpc (I), F7-6 (box); slender webs Rpg (F5-6)
+        wlb_nc = np.where(box, 1 - (1 - S_Zx) * (0.305 * lam_w / s - 0.738),
+                          1 - (1 - S_Zx) * (lam_w - pw) / (rw - pw))
+        Rpg = np.minimum(1 - g["aw"] / (1200 + 300 * g["aw"]) * (lam_w - 5.7 * s), 1.0)
+        wlb = np.where(web == COMPACT, 1.0, np.where(web == NONCOMPACT, wlb_nc, Rpg * S_Zx))
+
+        # Minor axis: flanges of an I (F6-2 / F6-4), the depth walls of a box as flanges (F7)
+        lam_y = np.where(box, lam_w, lam_f)
+        flange_y = _classes(lam_y, pf, rf)
+        flb_y_nc = np.where(box, 1 - (1 - S_Zy) * (3.57 * lam_y / s - 4.0),
+                            1 - (1 - 0.7 * S_Zy) * (lam_y - pf) / (rf - pf))
+        flb_y_sl = np.where(box, _box_effective_modulus(g["bf"], g["t_w"], g["h_flat"], lam_y, g["Iy"], g["Ag"], g["Zy"], s),
+                            0.69 * E_STEEL * S_Zy / (Fy * lam_y**2))
+        flb_y = np.where(flange_y == COMPACT, 1.0, np.where(flange_y == NONCOMPACT, flb_y_nc, flb_y_sl))
+
+    cf = np.where(box, COMPRESSION_LIMITS["BOX"][0], COMPRESSION_LIMITS["I"][0]) * s
+    cw = np.where(box, COMPRESSION_LIMITS["BOX"][1], COMPRESSION_LIMITS["I"][1]) * s
+    compression = np.where((lam_f > cf) | (lam_w > cw), SLENDER, COMPACT)
+    return {"flange": flange, "web": web, "compression": compression,
+            "flb": np.clip(flb, 0.0, 1.0), "wlb": np.clip(wlb, 0.0, 1.0), "flb_y": np.clip(flb_y, 0.0, 1.0)}
+
+
+class ClassificationTable:
+    """
+    Width-to-thickness data per section and, per grade, element classes and local
+    buckling factors. Sections are added in vectorized batches. The standard GRADES (and
+    grades requested with keep=True) are computed over the whole table on first use, kept
+    and extended as sections are added; any other Fy is evaluated for the requested rows
+    only, so arbitrary yield strengths do not accumulate whole-table columns.
+    """
+    def __init__(self):
+        self._index = {}     # section key -> row
+        self._geometry = {k: np.empty(0, dtype=bool if k == "box" else float) for k in GEOMETRY}  # one entry per row
+        self._grades = {}    # Fy -> grade columns of every row, for kept grades only
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, profile):
+        return section_key(profile) in self._index
+
+    @instrumented("classification", "add")
+    def add(self, profiles):
+        """Add the sections not in the table yet (one vectorized pass)."""
+        new, keys = [], set()
+        for p in profiles:
+            key = section_key(p)
+            if key not in self._index and key not in keys:
+                keys.add(key)
+                new.append(p)
+        if not new:
+            return 0
+        cols = {a: np.array([getattr(p, a) for p in new], dtype=float)
+                for a in ("d", "bf", "tw", "tf", "r", "Ag", "Ix", "Iy", "Sx", "Sy", "Zx", "Zy")}
+        g = element_geometry([p.section_type for p in new], **cols)
+        start = len(self._index)
+        for i, p in enumerate(new):
+            self._index[section_key(p)] = start + i
+        self._geometry = {k: np.concatenate([self._geometry[k], v]) for k, v in g.items()}
+        for Fy, columns in self._grades.items():
+            added = grade_columns(g, Fy)
+            for k in columns:
+                columns[k] = np.concatenate([columns[k], added[k]])
+        count("classification.sections", len(new))
+        return len(new)
+
+    def rows(self, profiles):
+        """Row index of each profile (a single profile gives a scalar); missing sections are added."""
+        if hasattr(profiles, "name"):
+            key = section_key(profiles)
+            if key not in self._index:
+                self.add([profiles])
+            return self._index[key]
+        keys = [section_key(p) for p in profiles]
+        if any(k not in self._index for k in keys):
+            self.add(profiles)
+        return np.fromiter((self._index[k] for k in keys), dtype=np.intp, count=len(keys))
+
+    def grade(self, Fy, keep=None):
+        """
+        Grade columns of every row for one Fy.
+
+        Args:
+            keep (bool): Cache the columns; default only for the standard GRADES.
+        """
+        Fy = float(Fy)
+        columns = self._grades.get(Fy)
+        if columns is None:
+            columns = grade_columns(self._geometry, Fy)
+            if keep or keep is None and Fy in _STANDARD_FY:
+                self._grades[Fy] = columns
+        return columns
+
+    def geometry(self, profiles):
+        rows = self.rows(profiles)
+        return {k: v[rows] for k, v in self._geometry.items()}
+
+    def lookup(self, profiles, Fy):
+        """
+        Local buckling data of profiles for a grade.
+
+        Args:
+            profiles (SteelProfile or sequence of SteelProfile): As in core.batch.profile_columns.
+            Fy (float or array): Yield strength; a kept grade is read from the table, any
+                other value is evaluated for these rows from the stored ratios.
+
+        Returns:
+            dict: See grade_columns().
+        """
+        rows = self.rows(profiles)
+        if np.ndim(Fy) == 0 and (float(Fy) in self._grades or float(Fy) in _STANDARD_FY):
+            return {k: v[rows] for k, v in self.grade(Fy).items()}
+        return grade_columns({k: v[rows] for k, v in self._geometry.items()}, Fy)
+
+
+_table = ClassificationTable()
+
+
+@instrumented("classification", "catalogue")
+def classify_catalogue(db, grades=tuple(GRADES.values())):
+    """
+    Classify every section of a catalogue for the given grades (ProfileDatabase or
+    FederatedCatalogue; lazy partitions are loaded).
+    """
+    _table.add(db.get_profiles())
+    for Fy in grades:
+        _table.grade(Fy, keep=True)
+    return _table
+
+
+def classify(profiles):
+    """Make sure the sections are in the lookup table (e.g. before sampling their properties)."""
+    _table.rows(profiles)
+
+
+def local_buckling(profiles, Fy):
+    """Local buckling data of profiles for Fy, from the lookup table; see ClassificationTable.lookup."""
+    return _table.lookup(profiles, Fy)
+
+
+def section_classes(profile, Fy):
+    """
+    Element classes of one section as text.
+
+    Returns:
+        dict: flange, web (flexure) and compression class names.
+    """
+    data = local_buckling(profile, Fy)
+    return {"flange": CLASS_NAMES[int(data["flange"])], "web": CLASS_NAMES[int(data["web"])],
+            "compression": "Slender" if data["compression"] == SLENDER else "Nonslender"}
+
+
+def effective_area_ratio(profiles, Fy, Fcr):
+    """
+    Ae / Ag of sections in compression at stress Fcr (E7.1 effective widths; 1 when no
+    element is slender).
+    """
+    g = _table.geometry(profiles)
+    Fy, Fcr = np.asarray(Fy, dtype=float), np.asarray(Fcr, dtype=float)
+    s = np.sqrt(E_STEEL / Fy)
+    box = g["box"]
+    loss = 0.0
+    for k, (lam, area) in enumerate(((g["lam_f"], g["area_f"]), (g["lam_w"], g["area_w"]))):
+        lam_r = np.where(box, COMPRESSION_LIMITS["BOX"][k], COMPRESSION_LIMITS["I"][k]) * s
+        c1 = np.where(box, EFFECTIVE_WIDTH["BOX"][k][0], EFFECTIVE_WIDTH["I"][k][0])
+        c2 = np.where(box, EFFECTIVE_WIDTH["BOX"][k][1], EFFECTIVE_WIDTH["I"][k][1])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            Fel = (c2 * lam_r / lam)**2 * Fy
+            ratio = np.sqrt(Fel / Fcr)
+            be_b = np.minimum((1 - c1 * ratio) * ratio, 1.0)
+        loss = loss + np.where(lam > lam_r * np.sqrt(Fy / Fcr), area * (1 - be_b), 0.0)
+    return 1 - loss
@@ -0,0 +1,343 @@
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.batch import combined_batch
+from core.classification import E_STEEL
+from core.instrumentation import instrumented, count
+from core.moment_gradient import moment_gradient_factors
+
+# Linear elastic analysis of plane frames (x horizontal, y up; N, mm).
+#
+# Members are Euler-Bernoulli frame elements with A = Ag and I = Ix of their profile
+# (strong-axis bending in the plane of the frame). Element stiffness matrices are
+# built for all members at once and assembled as COO triplets over the free degrees
+# of freedom, which are numbered in reverse Cuthill-McKee order of the nodes so the
+# matrix is banded. The band is stored as a block tridiagonal matrix (blocks at
+# least as wide as the half bandwidth) and factorized by block Cholesky; the factor
+# is kept and reused for every load case (all cases are solved as one right-hand
+# side matrix).
+#
+# Member end forces are in local coordinates, [N1, V1, M1, N2, V2, M2], as forces
+# acting on the member at its start and end node (local x from start to end).
+
+MIN_BLOCK = 64  # smallest block size of the banded factorization
+
+
+def _rcm_order(n_nodes, members):
+    """Reverse Cuthill-McKee ordering of the nodes (bandwidth reduction)."""
+    adjacency = [[] for _ in range(n_nodes)]
+    for a, b in members:
+        adjacency[a].append(b)
+        adjacency[b].append(a)
+    degree = np.array([len(a) for a in adjacency])
+    for a in adjacency:
+        a.sort(key=lambda k: degree[k])
+    seen = np.zeros(n_nodes, dtype=bool)
+    order = []
+    for start in np.argsort(degree, kind="stable"):
+        if seen[start]:
+            continue
+        seen[start] = True
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for nb in adjacency[node]:
+                if not seen[nb]:
+                    seen[nb] = True
+                    queue.append(nb)
+    return np.array(order[::-1], dtype=np.intp)
+
+
+class BandedCholesky:
+    """
+    Block tridiagonal Cholesky factor of a symmetric positive definite band matrix.
+
+    Args:
+        rows, cols, values (ndarray): COO triplets (duplicates are summed; only the
+            lower triangle, rows >= cols, is used).
+        n (int): Matrix size.
+        half_bandwidth (int): Largest |row - col| of a nonzero.
+    """
+    def __init__(self, rows, cols, values, n, half_bandwidth):
+        m = max(half_bandwidth, MIN_BLOCK) if n > MIN_BLOCK else max(n, 1)
+        nb = -(-n // m)
+        self.n, self.m, self.nb = n, m, nb
+        lower = rows >= cols
+        rows, cols, values = rows[lower], cols[lower], values[lower]
+        bi, bj = rows // m, cols // m
+        diag = np.zeros((nb, m, m))
+        sub = np.zeros((max(nb - 1, 1), m, m))
+        same = bi == bj
+        np.add.at(diag, (bi[same], rows[same] % m, cols[same] % m), values[same])
+        np.add.at(sub, (bj[~same], rows[~same] % m, cols[~same] % m), values[~same])
+        # Symmetric diagonal blocks; padding beyond n gets a unit diagonal
+        diag = diag + np.tril(diag, -1).transpose(0, 2, 1)
+        pad = np.arange(n, nb * m)
+        diag[pad // m, pad % m, pad % m] = 1.0
+        self._factorize(diag, sub)
+
+    @instrumented("frame", "factorize")
+    def _factorize(self, diag, sub):
+        L, S = np.empty_like(diag), np.empty_like(sub)
+        for i in range(self.nb):
+            D = diag[i] - S[i - 1] @ S[i - 1].T if i else diag[i]
+            try:
+                L[i] = np.linalg.cholesky(D)
+            except np.linalg.LinAlgError:
+                raise ValueError("Stiffness matrix is singular: the frame is unstable (check supports)") from None
+            if i < self.nb - 1:
+                S[i] = np.linalg.solve(L[i], sub[i].T).T
+        self.L, self.S = L, S
+
+    def solve(self, b):
+        """Solve K x = b for one (n,) or many (n, k) right-hand sides."""
+        b = np.asarray(b, dtype=float)
+        vector = b.ndim == 1
+        rhs = np.zeros((self.nb * self.m, 1 if vector else b.shape[1]))
+        rhs[:self.n] = b[:, None] if vector else b
+        y = rhs.reshape(self.nb, self.m, -1)
+        for i in range(self.nb):
+            r = y[i] - self.S[i - 1] @ y[i - 1] if i else y[i]
+            y[i] = np.linalg.solve(self.L[i], r)
+        for i in reversed(range(self.nb)):
+            r = y[i] - self.S[i].T @ y[i + 1] if i < self.nb - 1 else y[i]
+            y[i] = np.linalg.solve(self.L[i].T, r)
+        x = y.reshape(-1, y.shape[-1])[:self.n]
+        return x[:, 0] if vector else x
+
+
+@dataclass
+class FrameResult:
+    """
+    Results of all load cases.
+
+    Attributes:
+        displacements (ndarray): (cases, nodes, 3) ux, uy (mm), rz (rad).
+        end_forces (ndarray): (cases, members, 3 + 3) local member end forces (N, N-mm).
+        reactions (ndarray): (cases, nodes, 3) support reactions (zero at free DOFs).
+        member_loads (ndarray): (cases, members, 2) local uniform loads qx, qy (N/mm).
+        lengths (ndarray): (members,) member lengths (mm).
+    """
+    displacements: np.ndarray
+    end_forces: np.ndarray
+    reactions: np.ndarray
+    member_loads: np.ndarray
+    lengths: np.ndarray
+
+    def design_forces(self, case=0):
+        """
+        Member demands of one load case for the capacity checks.
+
+        Returns:
+            dict: Pu (largest compression, N; negative in tension), Mu (largest |M|
+                along the member, N-mm), Vu (largest |V|, N), M1, M2 (end moments,
+                internal sign convention).
+        """
+        f = self.end_forces[case]
+        q = self.member_loads[case, :, 1]
+        L = self.lengths
+        # Internal moment M(x) = -M1 + V1 x + q x^2 / 2; interior extremum where the shear vanishes
+        M_start, M_end = -f[:, 2], f[:, 5]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = np.where(q != 0, -f[:, 1] / q, -1.0)
+        inside = (x > 0) & (x < L)
+        M_mid = np.where(inside, -f[:, 2] + f[:, 1] * x + q * x**2 / 2, 0.0)
+        return {
+            "Pu": np.maximum(f[:, 0], -f[:, 3]),
+            "Mu": np.maximum.reduce([np.abs(M_start), np.abs(M_end), np.abs(M_mid)]),
+            "Vu": np.maximum(np.abs(f[:, 1]), np.abs(f[:, 4])),
+            "M1": M_start,
+            "M2": M_end,
+        }
+
+    def moment_diagrams(self, case=0, points=17):
+        """
+        Internal moment sampled at evenly spaced points along every member.
+
+        Returns:
+            ndarray: (members, points) moments (N-mm), from start to end node.
+        """
+        f = self.end_forces[case]
+        q = self.member_loads[case, :, 1]
+        x = np.linspace(0.0, 1.0, points)[None, :] * self.lengths[:, None]
+        return -f[:, 2:3] + f[:, 1:2] * x + q[:, None] * x**2 / 2
+
+
+class Frame2D:
+    """
+    Plane frame model.
+
+    Args:
+        nodes (array): (n, 2) node coordinates (mm).
+        members (array): (m, 2) start and end node of each member.
+        profiles (SteelProfile or sequence of SteelProfile): Section of every member.
+        supports (dict): Node -> (ux, uy, rz) restraint flags, e.g. {0: (1, 1, 1)} for a fixed base.
+        E (float): Modulus of elasticity (MPa).
+    """
+    def __init__(self, nodes, members, profiles, supports, E=E_STEEL):
+        self.nodes = np.asarray(nodes, dtype=float)
+        self.members = np.asarray(members, dtype=np.intp)
+        n_members = len(self.members)
+        self.profiles = [profiles] * n_members if hasattr(profiles, "name") else list(profiles)
+        self.E = E
+        self.fixed = np.zeros((len(self.nodes), 3), dtype=bool)
+        for node, flags in supports.items():
+            self.fixed[node] = np.asarray(flags, dtype=bool)
+        self.A = np.array([p.Ag for p in self.profiles])
+        self.I = np.array([p.Ix for p in self.profiles])
+        delta = self.nodes[self.members[:, 1]] - self.nodes[self.members[:, 0]]
+        self.lengths = np.hypot(delta[:, 0], delta[:, 1])
+        self.cos, self.sin = delta[:, 0] / self.lengths, delta[:, 1] / self.lengths
+        self._numbering()
+        self._factor = None
+
+    @classmethod
+    def grid(cls, bays, storeys, bay_width, storey_height, column, beam):
+        """
+        Regular moment frame with fixed bases. Nodes are numbered storey by storey;
+        columns come first in the member list, then beams.
+        """
+        xs, ys = np.meshgrid(np.arange(bays + 1) * bay_width, np.arange(storeys + 1) * storey_height)
+        nodes = np.column_stack([xs.ravel(), ys.ravel()])
+        node = np.arange(len(nodes)).reshape(storeys + 1, bays + 1)
+        columns = np.column_stack([node[:-1].ravel(), node[1:].ravel()])
+        beams = np.column_stack([node[1:, :-1].ravel(), node[1:, 1:].ravel()])
+        members = np.vstack([columns, beams])
+        profiles = [column] * len(columns) + [beam] * len(beams)
+        return cls(nodes, members, profiles, {int(k): (1, 1, 1) for k in node[0]})
+
+    def _numbering(self):
+        order = _rcm_order(len(self.nodes), self.members)
+        dof = np.full((len(self.nodes), 3), -1, dtype=np.intp)
+        free = ~self.fixed[order]
+        dof[order[free.any(axis=1)].repeat(free.sum(axis=1)[free.any(axis=1)]),
+            np.nonzero(free)[1]] = np.arange(free.sum())
+        self.dof = dof
+        self.n_free = int(free.sum())
+        # Equation numbers of the 6 member end DOFs (-1 where restrained)
+        self._member_dofs = np.concatenate([dof[self.members[:, 0]], dof[self.members[:, 1]]], axis=1)
+
+    def _rotation(self):
+        """(m, 6, 6) global-to-local transformation matrices."""
+        c, s = self.cos, self.sin
+        T = np.zeros((len(c), 6, 6))
+        for k in (0, 3):
+            T[:, k, k], T[:, k, k + 1] = c, s
+            T[:, k + 1, k], T[:, k + 1, k + 1] = -s, c
+            T[:, k + 2, k + 2] = 1.0
+        return T
+
+    def _local_stiffness(self):
+        """(m, 6, 6) member stiffness matrices in local coordinates."""
+        L, EA, EI = self.lengths, self.E * self.A, self.E * self.I
+        k = np.zeros((len(L), 6, 6))
+        a = EA / L
+        b12, b6, b4, b2 = 12 * EI / L**3, 6 * EI / L**2, 4 * EI / L, 2 * EI / L
+        k[:, 0, 0] = k[:, 3, 3] = a
+        k[:, 0, 3] = k[:, 3, 0] = -a
+        k[:, 1, 1] = k[:, 4, 4] = b12
+        k[:, 1, 4] = k[:, 4, 1] = -b12
+        k[:, 1, 2] = k[:, 2, 1] = k[:, 1, 5] = k[:, 5, 1] = b6
+        k[:, 4, 2] = k[:, 2, 4] = k[:, 4, 5] = k[:, 5, 4] = -b6
+        k[:, 2, 2] = k[:, 5, 5] = b4
+        k[:, 2, 5] = k[:, 5, 2] = b2
+        return k
+
+    @instrumented("frame", "assemble")
+    def stiffness(self):
+        """
+        Global stiffness matrix over the free DOFs as COO triplets.
+
+        Returns:
+            tuple: (rows, cols, values) arrays; duplicates are to be summed.
+        """
+        T = self._rotation()
+        k = np.einsum("mji,mjk,mkl->mil", T, self._local_stiffness(), T)
+        rows = np.repeat(self._member_dofs[:, :, None], 6, axis=2)
+        cols = np.repeat(self._member_dofs[:, None, :], 6, axis=1)
+        keep = (rows >= 0) & (cols >= 0)
+        count("frame.triplets", int(keep.sum()))
+        return rows[keep], cols[keep], k[keep]
+
+    def factorize(self):
+        """Factorize the stiffness matrix (done once; load cases reuse the factor)."""
+        if self._factor is None:
+            rows, cols, values = self.stiffness()
+            half = int(np.max(np.abs(rows - cols))) if len(rows) else 0
+            self._factor = BandedCholesky(rows, cols, values, self.n_free, half)
+        return self._factor
+
+    @instrumented("frame", "analyze")
+    def analyze(self, nodal_loads=None, member_loads=None):
+        """
+        Solve load cases.
+
+        Args:
+            nodal_loads (array): (cases, nodes, 3) or (nodes, 3) Fx, Fy (N), Mz (N-mm).
+            member_loads (array): (cases, members, 2) or (members, 2) uniform loads in
+                local coordinates, qx (along the member) and qy (transverse), N/mm.
+
+        Returns:
+            FrameResult
+        """
+        n_nodes, n_members = len(self.nodes), len(self.members)
+        shapes = [np.shape(x)[0] for x, nd in ((nodal_loads, 3), (member_loads, 3))
+                  if x is not None and np.ndim(x) == nd]
+        n_cases = shapes[0] if shapes else 1
+        P = np.zeros((n_cases, n_nodes, 3)) if nodal_loads is None else \
+            np.broadcast_to(np.asarray(nodal_loads, dtype=float), (n_cases, n_nodes, 3))
+        q = np.zeros((n_cases, n_members, 2)) if member_loads is None else \
+            np.broadcast_to(np.asarray(member_loads, dtype=float), (n_cases, n_members, 2))
+
+        # Fixed-end forces of the uniform loads (local), and their equivalent nodal loads (global)
+        L = self.lengths
+        qx, qy = q[..., 0], q[..., 1]
+        fef = np.stack([-qx * L / 2, -qy * L / 2, -qy * L**2 / 12,
+                        -qx * L / 2, -qy * L / 2, qy * L**2 / 12], axis=-1)
+        T = self._rotation()
+        equivalent = -np.einsum("mji,cmj->cmi", T, fef)
+        F = P.reshape(n_cases, -1).copy()
+        ends = np.concatenate([self.members[:, :1] * 3 + np.arange(3), self.members[:, 1:] * 3 + np.arange(3)], axis=1)
+        for c in range(n_cases):
+            np.add.at(F[c], ends, equivalent[c])
+
+        free = self.dof.ravel() >= 0
+        U = np.zeros((n_cases, n_nodes * 3))
+        if self.n_free:
+            eq = self.dof.ravel()[free]
+            b = np.zeros((self.n_free, n_cases))
+            b[eq] = F[:, free].T
+            U[:, free] = self.factorize().solve(b)[eq].T
+        U = U.reshape(n_cases, n_nodes, 3)
+
+        u_members = np.concatenate([U[:, self.members[:, 0]], U[:, self.members[:, 1]]], axis=2)
+        forces = np.einsum("mij,mjk,cmk->cmi", self._local_stiffness(), T, u_members) + fef
+        # Reactions: member end forces (global) gathered at restrained DOFs, less applied loads
+        end_global = np.einsum("mji,cmj->cmi", T, forces).reshape(n_cases, -1)
+        R = np.zeros((n_cases, n_nodes * 3))
+        for c in range(n_cases):
+            np.add.at(R[c], ends.ravel(), end_global[c])
+        R = (R - P.reshape(n_cases, -1)).reshape(n_cases, n_nodes, 3) * self.fixed
+        count("frame.cases", n_cases)
+        return FrameResult(U, forces, R, np.array(q), self.lengths)
+
+    def check_members(self, result, case=0, K=1.0, Cb=None, Fy=240.0, Lb=None):
+        """
+        Combined-action check (H1-1) of every member with the forces of one load case.
+
+        Args:
+            Cb (float or array): Moment gradient factor (default: from each member's
+                moment diagram, the member being one unbraced segment).
+            Lb (float or array): Unbraced length (default: member length).
+
+        Returns:
+            ResultTable: See combined_batch.
+        """
+        forces = result.design_forces(case)
+        L = self.lengths if Lb is None else Lb
+        if Cb is None:
+            Cb = moment_gradient_factors(result.moment_diagrams(case))
+        return combined_batch(self.profiles, np.maximum(forces["Pu"], 0.0), forces["Mu"], 0.0, L, K, Cb, Fy)
@@ -0,0 +1,117 @@
+import json
+import os
+from dataclasses import dataclass, field
+
+from core.checks import MemberResult, evaluate_members
+from core.instrumentation import instrumented, count
+
+
+@dataclass
+class StatusChange:
+    member_id: str
+    old_status: str  # None for members added in this run
+    new_status: str  # None for members removed in this run
+    old_ratio: float = None
+    new_ratio: float = None
+
+
+@dataclass
+class RecheckReport:
+    """
+    Outcome of one incremental run.
+
+    Attributes:
+        results (dict): member_id -> MemberResult for every current member.
+        recomputed (list): Ids of members evaluated in this run.
+        removed (list): Ids present in the previous run but not in this one.
+        changes (list of StatusChange): Members whose status changed, appeared or disappeared.
+    """
+    results: dict
+    recomputed: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    changes: list = field(default_factory=list)
+
+
+def member_key(member, catalogue_version):
+    """
+    Fingerprint of everything that affects a member's result. Keys are compared by
+    equality, which is cheaper than hashing and stable across processes.
+    """
+    return (member.check, member.profile, catalogue_version, tuple(sorted(member.params.items())))
+
+
+class IncrementalChecker:
+    """
+    Re-checks a structure model, evaluating only members whose inputs (or the
+    profile catalogue) changed since the previous run.
+    """
+    def __init__(self, db):
+        self.db = db
+        self._state = {}  # member_id -> (key, MemberResult)
+
+    @instrumented("incremental", "run")
+    def run(self, members):
+        """
+        Args:
+            members (list of Member): The current model.
+
+        Returns:
+            RecheckReport
+        """
+        version = self.db.version
+        previous = self._state
+        state = {}
+        dirty = []
+        dirty_keys = []
+        for m in members:
+            key = member_key(m, version)
+            prev = previous.get(m.id)
+            if prev is not None and prev[0] == key:
+                state[m.id] = prev
+            else:
+                dirty.append(m)
+                dirty_keys.append(key)
+
+        report = RecheckReport(results={})
+        for m, key, res in zip(dirty, dirty_keys, evaluate_members(dirty, self.db)):
+            state[m.id] = (key, res)
+            prev = previous.get(m.id)
+            if prev is None:
+                report.changes.append(StatusChange(m.id, None, res.status, None, res.ratio))
+            elif prev[1].status != res.status:
+                report.changes.append(StatusChange(m.id, prev[1].status, res.status, prev[1].ratio, res.ratio))
+
+        for member_id, (_, res) in previous.items():
+            if member_id not in state:
+                report.removed.append(member_id)
+                report.changes.append(StatusChange(member_id, res.status, None, res.ratio, None))
+
+        count("incremental.recomputed", len(dirty))
+        count("incremental.reused", len(members) - len(dirty))
+        self._state = state
+        report.recomputed = [m.id for m in dirty]
+        report.results = {member_id: res for member_id, (_, res) in state.items()}
+        return report
+
+    def save(self, filepath):
+        """Persist fingerprints and results as JSON so the next session can reuse them."""
+        data = {
+            member_id: {"key": [key[0], key[1], key[2], [list(p) for p in key[3]]], "result": res.to_dict()}
+            for member_id, (key, res) in self._state.items()
+        }
+        # json.dumps uses the C encoder; json.dump streams through the pure-Python one
+        with open(filepath, 'w') as f:
+            f.write(json.dumps(data))
+
+    def load(self, filepath):
+        """Load state written by save(); results are rebuilt as MemberResult objects."""
+        if not os.path.exists(filepath):
+            return
+        with open(filepath) as f:
+            data = json.load(f)
+        self._state = {
+            member_id: ((k[0], k[1], k[2], tuple(tuple(p) for p in k[3])),
+                        MemberResult.from_dict(entry["result"]))
+            for member_id, entry in data.items()
+            for k in [entry["key"]]
+        }
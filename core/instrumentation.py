@@ -0,0 +1,192 @@
+import atexit
+import cProfile
+import functools
+import os
+import sys
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+
+# Set STEEL_CALC_PROFILE=1 to collect stage timings for the whole process and print
+# a summary on exit. STEEL_CALC_PROFILE_OUT=<path> additionally writes folded stacks
+# (flamegraph.pl / speedscope compatible) to <path> on exit.
+ENV_ENABLE = "STEEL_CALC_PROFILE"
+ENV_OUTPUT = "STEEL_CALC_PROFILE_OUT"
+
+_enabled = os.environ.get(ENV_ENABLE, "") not in ("", "0")
+
+_timers = defaultdict(lambda: [0, 0.0])  # (stage, key) -> [calls, total seconds]
+_counters = defaultdict(int)             # name -> count
+_folded = defaultdict(float)             # "a;b;c" -> self seconds
+_local = threading.local()
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """Clear all collected timers, counters and stacks."""
+    _timers.clear()
+    _counters.clear()
+    _folded.clear()
+
+
+def _stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _record(stage, key, elapsed, stack, frame):
+    stack.pop()
+    if stack:
+        stack[-1][1] += elapsed
+    path = ";".join(f[0] for f in stack)
+    _folded[f"{path};{frame[0]}" if path else frame[0]] += elapsed - frame[1]
+    entry = _timers[(stage, key)]
+    entry[0] += 1
+    entry[1] += elapsed
+
+
+def instrumented(stage, key=None):
+    """
+    Decorator timing every call of a function under (stage, key).
+    When instrumentation is disabled the wrapper only checks one flag.
+
+    Args:
+        stage (str): Pipeline stage, e.g. "parse", "calc", "plot", "report".
+        key (str): Sub-key within the stage (defaults to the function name).
+    """
+    def decorator(func):
+        name = key or func.__name__
+        label = f"{stage}:{name}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            stack = _stack()
+            frame = [label, 0.0]
+            stack.append(frame)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(stage, name, perf_counter() - start, stack, frame)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def timer(stage, key=""):
+    """
+    Context manager version of `instrumented` for timing a block of code.
+    """
+    if not _enabled:
+        yield
+        return
+    stack = _stack()
+    frame = [f"{stage}:{key}" if key else stage, 0.0]
+    stack.append(frame)
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        _record(stage, key, perf_counter() - start, stack, frame)
+
+
+def count(name, n=1):
+    """Increment counter `name` by n (no-op when disabled)."""
+    if _enabled:
+        _counters[name] += n
+
+
+def get_timers():
+    """
+    Returns:
+        dict: (stage, key) -> {"calls", "total", "mean"} in seconds.
+    """
+    return {k: {"calls": c, "total": t, "mean": t / c if c else 0.0} for k, (c, t) in _timers.items()}
+
+
+def get_counters():
+    return dict(_counters)
+
+
+def summary():
+    """
+    Format collected timers and counters as a plain-text table.
+    Totals are inclusive, so nested stages (e.g. derive inside parse) overlap.
+    """
+    lines = [f"{'Stage':<10} {'Key':<28} {'Calls':>10} {'Total (ms)':>12} {'Mean (us)':>12}"]
+    lines.append("-" * len(lines[0]))
+    for (stage, key), (calls, total) in sorted(_timers.items(), key=lambda kv: -kv[1][1]):
+        mean = total / calls * 1e6 if calls else 0.0
+        lines.append(f"{stage:<10} {key:<28} {calls:>10} {total * 1e3:>12.3f} {mean:>12.2f}")
+    if _counters:
+        lines.append("")
+        for name, value in sorted(_counters.items()):
+            lines.append(f"{name:<39} {value:>10}")
+    return "\n".join(lines)
+
+
+def dump_folded(filepath):
+    """
+    Write collected call stacks in folded format ("a;b;c <microseconds>" per line),
+    readable by flamegraph.pl, inferno or speedscope.
+    """
+    with open(filepath, 'w') as f:
+        for path, seconds in sorted(_folded.items()):
+            f.write(f"{path} {max(int(round(seconds * 1e6)), 0)}\n")
+
+
+@contextmanager
+def profile_run(filepath=None):
+    """
+    Run a block under cProfile and stage instrumentation.
+
+    Args:
+        filepath (str): If given, cProfile stats are written here (pstats format,
+            viewable with snakeviz or convertible with flameprof).
+
+    Yields:
+        cProfile.Profile: The active profiler.
+    """
+    was_enabled = _enabled
+    enable()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if not was_enabled:
+            disable()
+        if filepath:
+            profiler.dump_stats(filepath)
+
+
+def _report_at_exit():
+    if not _timers and not _counters:
+        return
+    print(summary(), file=sys.stderr)
+    output = os.environ.get(ENV_OUTPUT)
+    if output:
+        dump_folded(output)
+
+
+if _enabled:
+    atexit.register(_report_at_exit)
@@ -0,0 +1,177 @@
+import json
+import os
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.batch import combined_batch
+from core.instrumentation import instrumented, count
+
+# Precomputed axial-moment interaction surfaces (SNI 1729 / AISC H1-1). A surface is
+# fixed by the design strengths phi_Pn, phi_Mnx and phi_Mny of one (profile, L, K, Cb, Fy);
+# once those are known, checking force points is plain array arithmetic. Surfaces are
+# cached per key and can be saved to / loaded from JSON.
+
+
+def surface_key(profile_name, L, K=1.0, Cb=1.0, Fy=240.0):
+    """Cache key of a surface; numbers are normalized to float so 3000 and 3000.0 match."""
+    return (profile_name, float(L), float(K), float(Cb), float(Fy))
+
+
+def interaction_ratio(p, mx, my):
+    """
+    H1-1 ratio from normalized demands (P/phi_Pn, Mx/phi_Mnx, My/phi_Mny); arrays broadcast.
+    Surfaces hold the compression strength only, so tension (p < 0) raises ValueError
+    instead of reading as a smaller ratio.
+    """
+    p = np.asarray(p, dtype=float)
+    if np.any(p < 0):
+        raise ValueError("Tension (Pu < 0) is outside the compression interaction surface; "
+                         "check it against the tension strength")
+    m = np.abs(mx) + np.abs(my)
+    return np.where(p >= 0.2, p + (8 / 9) * m, p / 2 + m)
+
+
+@dataclass
+class InteractionSurface:
+    """
+    Interaction surface of one member design.
+
+    Attributes:
+        key (tuple): (profile name, L, K, Cb, Fy), see surface_key().
+        phi_Pn, phi_Mnx, phi_Mny (float): Design strengths in N and N-mm.
+    """
+    key: tuple
+    phi_Pn: float
+    phi_Mnx: float
+    phi_Mny: float
+
+    def ratio(self, Pu, Mux, Muy):
+        """
+        Interaction ratios of force points (compression positive, N and N-mm). Moments
+        act in either sense, so their magnitudes are used; for non-negative inputs the
+        ratio equals calculate_combined()'s. Tension (Pu < 0) raises ValueError.
+
+        Returns:
+            ndarray: One ratio per point (<= 1.0 is inside the surface).
+        """
+        return interaction_ratio(np.asarray(Pu, dtype=float) / self.phi_Pn,
+                                 np.asarray(Mux, dtype=float) / self.phi_Mnx,
+                                 np.asarray(Muy, dtype=float) / self.phi_Mny)
+
+    def contains(self, Pu, Mux, Muy):
+        return self.ratio(Pu, Mux, Muy) <= 1.0
+
+    def mesh(self, n=25):
+        """
+        Points on the surface (ratio = 1) for P >= 0, Mx >= 0, My >= 0.
+
+        Returns:
+            tuple: (P, Mx, My) arrays of shape (n, n).
+        """
+        p, theta = np.meshgrid(np.linspace(0, 1, n), np.linspace(0, np.pi / 2, n), indexing="ij")
+        # Moment budget mx + my at each axial level (linear in the moments on both branches)
+        budget = np.where(p >= 0.2, (9 / 8) * (1 - p), 1 - p / 2)
+        share = np.cos(theta) / (np.cos(theta) + np.sin(theta))
+        return p * self.phi_Pn, budget * share * self.phi_Mnx, budget * (1 - share) * self.phi_Mny
+
+    def to_dict(self):
+        return {"key": list(self.key), "phi_Pn": self.phi_Pn, "phi_Mnx": self.phi_Mnx, "phi_Mny": self.phi_Mny}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(tuple(data["key"]), data["phi_Pn"], data["phi_Mnx"], data["phi_Mny"])
+
+
+class InteractionCache:
+    """
+    Interaction surfaces per (profile, L, K, Cb, Fy), computed on first use.
+
+    Args:
+        db (ProfileDatabase or FederatedCatalogue): Catalogue used to resolve profile names.
+    """
+    def __init__(self, db):
+        self.db = db
+        self._surfaces = {}
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def __contains__(self, key):
+        return key in self._surfaces
+
+    def get(self, profile_name, L, K=1.0, Cb=1.0, Fy=240.0):
+        return self.get_many([surface_key(profile_name, L, K, Cb, Fy)])[0]
+
+    @instrumented("interaction", "surfaces")
+    def get_many(self, keys):
+        """
+        Surfaces for many keys; the missing ones are computed in one vectorized pass.
+
+        Args:
+            keys (list of tuple): Keys from surface_key().
+
+        Returns:
+            list of InteractionSurface: In the order of keys.
+        """
+        keys = [surface_key(*k) for k in keys]
+        missing = list(dict.fromkeys(k for k in keys if k not in self._surfaces))
+        if missing:
+            profiles = []
+            for k in missing:
+                p = self.db.get_profile(k[0])
+                if p is None:
+                    raise ValueError(f"Unknown profile '{k[0]}'")
+                profiles.append(p)
+            L, K, Cb, Fy = np.array([k[1:] for k in missing]).T
+            table = combined_batch(profiles, 0.0, 0.0, 0.0, L, K, Cb, Fy)
+            for i, k in enumerate(missing):
+                self._surfaces[k] = InteractionSurface(
+                    k, float(table["phi_Pn"][i]), float(table["phi_Mnx"][i]), float(table["phi_Mny"][i]))
+            count("interaction.computed", len(missing))
+        return [self._surfaces[k] for k in keys]
+
+    def ratios(self, keys, Pu, Mux, Muy):
+        """
+        Ratios of force points, each checked against its own surface.
+
+        Args:
+            keys (list of tuple): One key per point.
+            Pu, Mux, Muy (array): Demands per point.
+
+        Returns:
+            ndarray: One ratio per point.
+        """
+        keys = [surface_key(*k) for k in keys]
+        unique = list(dict.fromkeys(keys))
+        surfaces = self.get_many(unique)
+        index = {k: i for i, k in enumerate(unique)}
+        rows = np.fromiter((index[k] for k in keys), dtype=np.intp, count=len(keys))
+        capacity = np.array([[s.phi_Pn, s.phi_Mnx, s.phi_Mny] for s in surfaces])[rows]
+        return interaction_ratio(np.asarray(Pu, dtype=float) / capacity[:, 0],
+                                 np.asarray(Mux, dtype=float) / capacity[:, 1],
+                                 np.asarray(Muy, dtype=float) / capacity[:, 2])
+
+    def save(self, filepath):
+        """Write every cached surface, tagged with the catalogue version."""
+        data = {"catalogue_version": self.db.version, "surfaces": [s.to_dict() for s in self._surfaces.values()]}
+        with open(filepath, 'w') as f:
+            f.write(json.dumps(data))
+
+    def load(self, filepath):
+        """
+        Load surfaces written by save(). Surfaces from another catalogue version are ignored.
+
+        Returns:
+            int: Number of surfaces loaded.
+        """
+        if not os.path.exists(filepath):
+            return 0
+        with open(filepath) as f:
+            data = json.load(f)
+        if data.get("catalogue_version") != self.db.version:
+            return 0
+        for entry in data["surfaces"]:
+            surface = InteractionSurface.from_dict(entry)
+            self._surfaces[surface.key] = surface
+        return len(data["surfaces"])
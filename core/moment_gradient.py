@@ -0,0 +1,92 @@
+import numpy as np
+
+from core.batch import flexure_batch
+from core.instrumentation import instrumented, count
+
+# Lateral-torsional buckling modification factor from moment diagrams (SNI 1729 / AISC 360 F1):
+#     Cb = 12.5 Mmax / (2.5 Mmax + 3 MA + 4 MB + 3 MC)
+# with Mmax the largest absolute moment in the unbraced segment and MA, MB, MC the
+# absolute moments at its quarter, centre and three-quarter points.
+#
+# A diagram is one row of samples along a segment; many segments are one 2-D array
+# (segments, samples). Quarter-point moments are linearly interpolated between samples,
+# so the positions need not include the quarter points.
+
+QUARTER_POINTS = np.array([0.25, 0.5, 0.75])
+
+
+def _positions(x, shape):
+    """Sample positions normalized to 0..1 along each segment, shape (segments, samples)."""
+    if x is None:
+        return np.broadcast_to(np.linspace(0.0, 1.0, shape[1]), shape)
+    x = np.broadcast_to(np.asarray(x, dtype=float), shape)
+    start, end = x[:, :1], x[:, -1:]
+    return (x - start) / (end - start)
+
+
+def quarter_point_moments(moments, x=None):
+    """
+    Moments at the quarter points of every segment by linear interpolation.
+
+    Args:
+        moments (array): (segments, samples) moment diagrams, at least 2 samples each.
+        x (array): Sample positions, (samples,) shared or (segments, samples), ascending
+            per segment; default evenly spaced from end to end.
+
+    Returns:
+        ndarray: (segments, 3) MA, MB, MC (signed).
+    """
+    M = np.atleast_2d(np.asarray(moments, dtype=float))
+    s = _positions(x, M.shape)
+    # Interval holding each quarter point: last sample at or before it
+    j = np.sum(s[:, :, None] <= QUARTER_POINTS, axis=1) - 1
+    j = np.clip(j, 0, M.shape[1] - 2)
+    s0, s1 = np.take_along_axis(s, j, axis=1), np.take_along_axis(s, j + 1, axis=1)
+    M0, M1 = np.take_along_axis(M, j, axis=1), np.take_along_axis(M, j + 1, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w = np.where(s1 > s0, (QUARTER_POINTS - s0) / (s1 - s0), 0.0)
+    return M0 + w * (M1 - M0)
+
+
+@instrumented("batch", "moment_gradient")
+def moment_gradient_factors(moments, x=None):
+    """
+    Cb of many unbraced segments at once.
+
+    Args:
+        moments (array): (segments, samples) moment diagrams (any consistent unit).
+        x (array): Sample positions, see quarter_point_moments.
+
+    Returns:
+        ndarray: (segments,) Cb; 1.0 for segments without moment.
+    """
+    M = np.atleast_2d(np.asarray(moments, dtype=float))
+    M_max = np.max(np.abs(M), axis=1)
+    MA, MB, MC = np.abs(quarter_point_moments(M, x)).T
+    count("moment_gradient.segments", len(M))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Cb = 12.5 * M_max / (2.5 * M_max + 3 * MA + 4 * MB + 3 * MC)
+    return np.where(M_max > 0, Cb, 1.0)
+
+
+def moment_gradient_factor(moments, x=None):
+    """Cb of one segment from its sampled moment diagram."""
+    return float(moment_gradient_factors(np.asarray(moments, dtype=float)[None, :],
+                                         None if x is None else np.asarray(x, dtype=float)[None, :])[0])
+
+
+def flexure_from_diagrams(profiles, moments, Lb, Fy, x=None):
+    """
+    Flexural capacity with Cb computed from each segment's moment diagram.
+
+    Args:
+        profiles (SteelProfile or sequence of SteelProfile): See profile_columns.
+        moments (array): (segments, samples) moment diagrams.
+        Lb (float or array): Unbraced length of each segment (mm).
+        Fy (float or array): Yield stress (MPa).
+        x (array): Sample positions, see quarter_point_moments.
+
+    Returns:
+        ResultTable: See flexure_batch.
+    """
+    return flexure_batch(profiles, Lb, moment_gradient_factors(moments, x), Fy)
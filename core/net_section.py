@@ -0,0 +1,227 @@
+import functools
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.batch import tension_batch, profile_columns
+from core.instrumentation import instrumented, count
+
+# Net and effective net area of bolted tension members (SNI 1729 / AISC 360 B4.3, D3).
+#
+# A hole pattern describes one connected element (e.g. one flange): gauge lines across
+# the width, each with hole positions along the member. A failure path crosses the
+# element through at most one hole per gauge line; its width loss is
+#     sum(hole widths) - sum(s^2 / 4g)
+# over consecutive holes (s = stagger, g = gauge between their lines). The critical
+# path has the largest loss. It is found by dynamic programming over the gauge lines:
+# the best path ending at a hole only depends on the best paths ending at holes on
+# earlier lines. Predecessors further away than the stagger at which s^2/4g cancels
+# their whole path loss are pruned with a sorted window, so neither paths nor all hole
+# pairs are enumerated.
+
+# B4.3b: hole width = nominal hole + 2 mm
+DAMAGE_ALLOWANCE = 2.0
+
+
+def standard_hole(d_bolt):
+    """Nominal standard hole diameter (AISC Table J3.3M)."""
+    return d_bolt + 2.0 if d_bolt <= 22 else d_bolt + 3.0
+
+
+def effective_hole(d_bolt):
+    """Hole width used for net area: standard hole + damage allowance."""
+    return standard_hole(d_bolt) + DAMAGE_ALLOWANCE
+
+
+@dataclass(frozen=True)
+class HolePattern:
+    """
+    Bolt holes in one connected element.
+
+    Args:
+        gauges (tuple): Transverse position of each gauge line (mm, any origin).
+        pitches (tuple of tuple): Longitudinal hole positions on each gauge line (mm).
+        hole (float): Hole width for net area (mm), e.g. effective_hole(20).
+    """
+    gauges: tuple
+    pitches: tuple
+    hole: float
+
+    def __post_init__(self):
+        # Tuples keep the pattern hashable for the critical path cache
+        object.__setattr__(self, "gauges", tuple(float(g) for g in self.gauges))
+        object.__setattr__(self, "pitches", tuple(tuple(float(x) for x in line) for line in self.pitches))
+        object.__setattr__(self, "hole", float(self.hole))
+
+    @classmethod
+    def grid(cls, gauges, n_rows, pitch, hole, stagger=0.0):
+        """
+        Regular pattern: n_rows holes per line at `pitch`; every other line offset by `stagger`.
+        """
+        pitches = [[j * pitch + (stagger if i % 2 else 0.0) for j in range(n_rows)] for i in range(len(gauges))]
+        return cls(gauges, pitches, hole)
+
+
+@dataclass(frozen=True)
+class NetPath:
+    """
+    Critical failure path of a hole pattern.
+
+    Attributes:
+        loss (float): Width lost along the path (mm): holes minus s^2/4g gains.
+        holes (tuple): (gauge line index, longitudinal position) of each hole on the path.
+    """
+    loss: float
+    holes: tuple
+
+
+@functools.lru_cache(maxsize=4096)
+def critical_path(pattern):
+    """
+    Critical (largest loss) failure path of a pattern; memoized per pattern.
+
+    Returns:
+        NetPath
+    """
+    order = np.argsort(pattern.gauges, kind="stable")
+    gauges = [pattern.gauges[i] for i in order]
+    xs = [np.sort(np.asarray(pattern.pitches[i], dtype=float)) for i in order]
+
+    best = []   # per line: best loss of a path ending at each hole
+    prev = []   # per line: (line, hole) predecessor of each hole, or None
+    pruned = 0
+    for b, xb in enumerate(xs):
+        loss_b = np.full(len(xb), pattern.hole)
+        prev_b = [None] * len(xb)
+        for a in range(b):
+            g = gauges[b] - gauges[a]
+            if g <= 0 or not len(xb) or not len(xs[a]):
+                continue
+            # A predecessor only helps while best - s^2/4g > 0, i.e. within |s| < radius
+            radius = np.sqrt(4 * g * best[a].max())
+            lo = np.searchsorted(xs[a], xb - radius, side="right")
+            hi = np.searchsorted(xs[a], xb + radius, side="left")
+            width = int((hi - lo).max())
+            pruned += len(xb) * len(xs[a]) - int((hi - lo).sum())
+            if width <= 0:
+                continue
+            idx = lo[:, None] + np.arange(width)[None, :]
+            valid = idx < hi[:, None]
+            idx = np.minimum(idx, len(xs[a]) - 1)
+            s = xb[:, None] - xs[a][idx]
+            gain = np.where(valid, best[a][idx] - s**2 / (4 * g), -np.inf)
+            j = np.argmax(gain, axis=1)
+            cand = pattern.hole + gain[np.arange(len(xb)), j]
+            better = cand > loss_b
+            loss_b = np.where(better, cand, loss_b)
+            for h in np.flatnonzero(better):
+                prev_b[h] = (a, int(idx[h, j[h]]))
+        best.append(loss_b)
+        prev.append(prev_b)
+    count("net_section.pruned_pairs", pruned)
+
+    ends = [(line, int(np.argmax(b))) for line, b in enumerate(best) if len(b)]
+    if not ends:
+        return NetPath(0.0, ())
+    end = max(ends, key=lambda e: best[e[0]][e[1]])
+    loss = float(best[end[0]][end[1]])
+    path = []
+    while end is not None:
+        path.append((int(order[end[0]]), float(xs[end[0]][end[1]])))
+        end = prev[end[0]][end[1]]
+    return NetPath(loss, tuple(reversed(path)))
+
+
+def net_area(Ag, t, pattern, elements=1):
+    """
+    Net area An = Ag - elements * t * (critical path loss).
+
+    Args:
+        Ag (float): Gross area (mm2).
+        t (float): Thickness of the connected element (mm).
+        pattern (HolePattern or None): Holes in one element; None for no holes.
+        elements (int): Number of identical connected elements (e.g. 2 flanges).
+    """
+    if pattern is None:
+        return Ag
+    return Ag - elements * t * critical_path(pattern).loss
+
+
+def tee_eccentricity(profile):
+    """Connection eccentricity x of an I-shape connected by its flanges: centroid of the half-section tee from the flange face."""
+    stem = profile.d / 2 - profile.tf
+    A_flange = profile.bf * profile.tf
+    A_stem = stem * profile.tw
+    return (A_flange * profile.tf / 2 + A_stem * (profile.tf + stem / 2)) / (A_flange + A_stem)
+
+
+def shear_lag_factor(profile, connected="flanges", bolts_per_line=3, l=None):
+    """
+    Shear lag factor U (SNI 1729 / AISC Table D3.1) for bolted connections.
+
+    Args:
+        profile (SteelProfile): Member section.
+        connected (str): "all" (every element connected, case 1), "flanges" or "web" (I-shapes),
+            "gusset" (HSS with a concentric gusset, case 6).
+        bolts_per_line (int): Fasteners per line in the direction of load.
+        l (float): Connection length (mm), enables case 2 / case 6.
+
+    Returns:
+        float: U (the larger of the applicable cases, as D3 permits).
+    """
+    if connected == "all":
+        return 1.0
+    if profile.section_type == "HSS":
+        if connected != "gusset" or not l:
+            raise ValueError("HSS needs a concentric gusset connection with its length l")
+        B, H = profile.bf, profile.d
+        x = (B**2 + 2 * B * H) / (4 * (B + H))
+        return 1 - x / l
+
+    candidates = []
+    if connected == "flanges":
+        if bolts_per_line >= 3:
+            candidates.append(0.90 if profile.bf >= 2 / 3 * profile.d else 0.85)
+        if l:
+            candidates.append(1 - tee_eccentricity(profile) / l)
+    elif connected == "web":
+        if bolts_per_line >= 4:
+            candidates.append(0.70)
+    else:
+        raise ValueError(f"Unknown connection '{connected}'")
+    if not candidates:
+        raise ValueError("Shear lag factor needs more bolts per line or the connection length l")
+    return max(candidates)
+
+
+@instrumented("batch", "net_section")
+def effective_net_areas(profiles, patterns, U, elements=2):
+    """
+    Net and effective net areas for many members. Patterns shared by several members
+    are evaluated once.
+
+    Args:
+        profiles (sequence of SteelProfile): Members.
+        patterns (sequence of HolePattern or None): Holes in one connected flange per member.
+        U (float or array): Shear lag factor(s).
+        elements (int or array): Connected elements with that pattern (2 = both flanges).
+
+    Returns:
+        tuple: (An, Ae) arrays in mm2.
+    """
+    props = profile_columns(profiles, ("Ag", "tf"))
+    loss = np.fromiter((critical_path(p).loss if p is not None else 0.0 for p in patterns),
+                       dtype=float, count=len(patterns))
+    An = props["Ag"] - np.asarray(elements, dtype=float) * props["tf"] * loss
+    return An, np.asarray(U, dtype=float) * An
+
+
+def net_tension_batch(profiles, patterns, U, Fy, Fu, elements=2):
+    """
+    Tension capacity with net section and shear lag (tension_batch with Ae from the hole patterns).
+
+    Returns:
+        ResultTable: See tension_batch.
+    """
+    _, Ae = effective_net_areas(profiles, patterns, U, elements)
+    return tension_batch(profile_columns(profiles, ("Ag",))["Ag"], Ae, Fy, Fu)
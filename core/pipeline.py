@@ -0,0 +1,395 @@
+import heapq
+import json
+import queue
+import threading
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from core.batch import (
+    tension_batch, bolt_shear_batch, weld_batch, base_plate_batch, moment_plate_batch, combined_capacities
+)
+from core.checks import DEFAULTS
+from core.instrumentation import timer, count
+
+# Whole-structure design run. A structure is a stream of records:
+#
+#   {"kind": "combination", "name": "1.2D+1.6L", "factors": {"D": 1.2, "L": 1.6}}
+#   {"kind": "member", "id": "C1", "profile": "WF 200x100", "level": "1",
+#    "params": {"L": 3000, "K": 1.0, "Fy": 240},
+#    "loads": {"D": {"P": 1e5, "Mx": 5e6, "My": 0}, "L": {...}}}
+#   {"kind": "connection", "id": "J1", "type": "bolt_shear", "params": {"db": 20, "n": 4, "Fnv": 372},
+#    "loads": {"D": {"V": 5e4}}}
+#   {"kind": "support", "id": "S1", "profile": "WF 200x100", "params": {"fc": 25, "B": 300, "N": 300},
+#    "loads": {"D": {"P": 2e5}}}
+#
+# Loads are unfactored per load case, in N and N-mm; P > 0 is compression. Combinations
+# must appear before the items they apply to. Records flow in micro-batches through
+#
+#   parse -> resolve -> capacities -> interactions -> connections -> report
+#
+# with one thread per stage and bounded queues between them, so memory stays constant
+# for any model size and stages overlap in time.
+
+BATCH_SIZE = 1024
+QUEUE_SIZE = 4
+TOP_N = 20
+
+CONNECTION_TYPES = ("bolt_shear", "weld", "moment_plate")
+
+_END = object()
+
+
+@dataclass
+class Batch:
+    """Micro-batch of records of one kind ("member" or "connection", which includes supports)."""
+    kind: str
+    items: list
+    combinations: dict
+    profiles: list = None
+    capacities: dict = None
+    results: list = None
+
+
+@dataclass
+class PipelineSummary:
+    """
+    Attributes:
+        counts (dict): (kind, status) -> number of items.
+        worst (list): The highest-ratio result records, descending.
+        items (int): Number of items checked.
+    """
+    counts: dict = field(default_factory=dict)
+    worst: list = field(default_factory=list)
+    items: int = 0
+
+    def failing(self):
+        return sum(n for (_, status), n in self.counts.items() if status != "OK")
+
+
+def read_structure(source):
+    """
+    Iterate the records of a structure.
+
+    Args:
+        source: Path to a JSON Lines file (one record per line), a dict with
+            "load_combinations" (name -> factors), "members", "connections" and
+            "supports" lists, or any iterable of records.
+    """
+    if isinstance(source, str):
+        with open(source) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif isinstance(source, dict):
+        for name, factors in source.get("load_combinations", {}).items():
+            yield {"kind": "combination", "name": name, "factors": factors}
+        for kind, key in (("member", "members"), ("connection", "connections"), ("support", "supports")):
+            for item in source.get(key, []):
+                yield dict(item, kind=kind)
+    else:
+        yield from source
+
+
+def _missing(item, name):
+    return ValueError(f"Missing parameter {name} for {item.get('kind')} {item.get('id')}")
+
+
+def _param(items, key, default=None):
+    """
+    One parameter of every item; default may be a scalar or a per-item array. Parameters
+    without a default (here or in DEFAULTS) are required.
+    """
+    if default is None:
+        default = DEFAULTS.get(key)
+    if default is None:
+        for it in items:
+            if key not in it.get("params", {}):
+                raise _missing(it, f"'{key}'")
+    default = np.broadcast_to(np.asarray(default, dtype=float), (len(items),))
+    return np.fromiter((it.get("params", {}).get(key, d) for it, d in zip(items, default)), dtype=float, count=len(items))
+
+
+def _length(items, key):
+    """Length parameter of every item, falling back to L."""
+    for it in items:
+        params = it.get("params", {})
+        if key not in params and "L" not in params:
+            raise _missing(it, f"'{key}' or 'L'")
+    return np.fromiter((it["params"].get(key, it["params"].get("L")) for it in items), dtype=float, count=len(items))
+
+
+def factored(items, combinations, components):
+    """
+    Factored demands of every item under every combination.
+
+    Returns:
+        ndarray: Shape (items, combinations, components).
+    """
+    names = list(combinations)
+    cases = sorted({case for factors in combinations.values() for case in factors})
+    factors = np.array([[combinations[c].get(case, 0.0) for case in cases] for c in names]).reshape(len(names), len(cases))
+    loads = np.array([[[it.get("loads", {}).get(case, {}).get(q, 0.0) for q in components] for case in cases]
+                      for it in items], dtype=float).reshape(len(items), len(cases), len(components))
+    return np.einsum("ncq,kc->nkq", loads, factors)
+
+
+def _records(batch, check, ratio, ok):
+    """Reduce (items, combinations) ratios to one record per item at the governing combination."""
+    names = list(batch.combinations)
+    governing = np.argmax(ratio, axis=1)
+    worst = ratio[np.arange(len(batch.items)), governing]
+    safe = ok.all(axis=1)
+    records = []
+    for i, it in enumerate(batch.items):
+        records.append({
+            "id": it["id"], "kind": it["kind"], "check": check if isinstance(check, str) else check[i],
+            "profile": it.get("profile"), "level": it.get("level"),
+            "ratio": float(worst[i]), "combination": names[governing[i]],
+            "status": "OK" if safe[i] else "NOT SAFE",
+        })
+    return records
+
+
+class DesignPipeline:
+    """
+    Runs every applicable check of a structure as streaming stages.
+
+    Args:
+        db (ProfileDatabase or FederatedCatalogue): Profile catalogue.
+        batch_size (int): Records per micro-batch.
+        queue_size (int): Batches buffered between two stages.
+        top_n (int): Number of worst results kept in the summary.
+    """
+    def __init__(self, db, batch_size=BATCH_SIZE, queue_size=QUEUE_SIZE, top_n=TOP_N):
+        self.db = db
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.top_n = top_n
+        self._profiles = {}
+
+    # --- stages -----------------------------------------------------------------
+
+    def resolve(self, batch):
+        if batch.kind != "member" and not any("profile" in it for it in batch.items):
+            return batch
+        profiles = []
+        for it in batch.items:
+            name = it.get("profile")
+            p = self._profiles.get(name)
+            if p is None and name is not None:
+                p = self._profiles[name] = self.db.get_profile(name)
+                if p is None:
+                    raise ValueError(f"Unknown profile '{name}' for {it['kind']} {it['id']}")
+            profiles.append(p)
+        batch.profiles = profiles
+        return batch
+
+    def capacities(self, batch):
+        if batch.kind != "member":
+            return batch
+        items, profiles = batch.items, batch.profiles
+        Fy = _param(items, "Fy")
+        K = _param(items, "K")
+        U = _param(items, "U")
+        Ae = _param(items, "Ae", np.nan)
+        Ag = np.fromiter((p.Ag for p in profiles), dtype=float, count=len(profiles))
+        # Same compression / flexure strengths as combined_batch, with separate x/y lengths
+        cap = combined_capacities(profiles, _param(items, "Kx", K), _length(items, "Lx"), _param(items, "Ky", K),
+                                  _length(items, "Ly"), _length(items, "Lb"), _param(items, "Cb"), Fy)
+        batch.capacities = {
+            "phi_Pt": tension_batch(Ag, np.where(np.isnan(Ae), U * Ag, Ae), Fy, _param(items, "Fu"))["phi_Pn"],
+            "phi_Pc": cap["phi_Pn"],
+            "phi_Mnx": cap["phi_Mnx"],
+            "phi_Mny": cap["phi_Mny"],
+        }
+        return batch
+
+    def interactions(self, batch):
+        if batch.kind != "member":
+            return batch
+        cap = batch.capacities
+        demand = factored(batch.items, batch.combinations, ("P", "Mx", "My"))
+        P, Mx, My = demand[..., 0], np.abs(demand[..., 1]), np.abs(demand[..., 2])
+        # Tension and compression capacities per combination sign (H1-1 / H1-2 form)
+        phi_Pn = np.where(P >= 0, cap["phi_Pc"][:, None], cap["phi_Pt"][:, None])
+        Pr = np.abs(P) / phi_Pn
+        Mr = Mx / cap["phi_Mnx"][:, None] + My / cap["phi_Mny"][:, None]
+        ratio = np.where(Pr >= 0.2, Pr + (8 / 9) * Mr, Pr / 2 + Mr)
+        batch.results = _records(batch, "combined", ratio, ratio <= 1.0)
+        return batch
+
+    def connections(self, batch):
+        if batch.kind != "connection":
+            return batch
+        ratio = np.empty((len(batch.items), len(batch.combinations)))
+        ok = np.empty_like(ratio, dtype=bool)
+        checks = []
+        groups = {}
+        for i, it in enumerate(batch.items):
+            check = "base_plate" if it["kind"] == "support" else it.get("type")
+            if check not in CONNECTION_TYPES and check != "base_plate":
+                raise ValueError(f"Unknown connection type '{check}' for {it['id']}")
+            checks.append(check)
+            groups.setdefault(check, []).append(i)
+
+        for check, idx in groups.items():
+            items = [batch.items[i] for i in idx]
+            k = len(batch.combinations)
+            rep = lambda a: np.repeat(a, k)  # one row per (item, combination)
+            if check == "base_plate":
+                profiles = [batch.profiles[i] for i in idx]
+                P = factored(items, batch.combinations, ("P",))[..., 0].ravel()
+                table = base_plate_batch(
+                    np.maximum(P, 0.0), rep(_param(items, "fc", 25.0)), rep(_param(items, "B")), rep(_param(items, "N")),
+                    rep(np.array([p.d for p in profiles])), rep(np.array([p.bf for p in profiles]))
+                )
+                r = table["bearing_ratio"]
+                t = rep(_param(items, "t", np.nan))
+                r = np.where(np.isnan(t), r, np.maximum(r, table["t_req"] / t))
+                good = r <= 1.0
+            elif check == "moment_plate":
+                profiles = [batch.profiles[i] for i in idx]
+                M = np.abs(factored(items, batch.combinations, ("M",))[..., 0].ravel())
+                table = moment_plate_batch(
+                    M / 1e6, rep(_param(items, "d_bolt")), rep(_param(items, "n_bolts")),
+                    rep(_param(items, "thick_plate")), [p for p in profiles for _ in range(k)],
+                    rep(_param(items, "Fnt", 620.0))
+                )
+                r = table["bolt_ratio"]
+                good = table["status"] == "OK"
+            else:
+                V = np.abs(factored(items, batch.combinations, ("V",))[..., 0].ravel())
+                if check == "bolt_shear":
+                    table = bolt_shear_batch(rep(_param(items, "db")), rep(_param(items, "n")), rep(_param(items, "Fnv", 372.0)))
+                else:
+                    table = weld_batch(
+                        np.repeat([it.get("params", {}).get("weld_type", "Fillet") for it in items], k),
+                        rep(_param(items, "Fexx", 490.0)), rep(_param(items, "size")), rep(_param(items, "length"))
+                    )
+                r = V / table["phi_Rn"]
+                good = r <= 1.0
+            ratio[idx] = r.reshape(len(idx), k)
+            ok[idx] = good.reshape(len(idx), k)
+
+        batch.results = _records(batch, checks, ratio, ok)
+        return batch
+
+    # --- driver -----------------------------------------------------------------
+
+    def _parse(self, records, outbox, stop):
+        combinations = {}
+        pending = {"member": [], "connection": []}
+
+        def flush(kind):
+            if pending[kind]:
+                if not combinations:
+                    raise ValueError("No load combinations defined before the first item")
+                outbox.put(Batch(kind, pending[kind], dict(combinations)))
+                pending[kind] = []
+
+        for rec in records:
+            if stop.is_set():
+                return
+            kind = rec.get("kind")
+            if kind == "combination":
+                # New combinations apply to items read after them
+                flush("member")
+                flush("connection")
+                combinations[rec["name"]] = rec["factors"]
+            elif kind in ("member", "connection", "support"):
+                key = "member" if kind == "member" else "connection"
+                pending[key].append(rec)
+                if len(pending[key]) >= self.batch_size:
+                    flush(key)
+            else:
+                raise ValueError(f"Unknown record kind '{kind}'")
+        flush("member")
+        flush("connection")
+
+    def run(self, structure, sink=None):
+        """
+        Check a whole structure.
+
+        Args:
+            structure: See read_structure().
+            sink (callable): Optional; called with each batch's list of result records
+                (e.g. to write JSON Lines or fill a ResultStore) from the report stage.
+
+        Returns:
+            PipelineSummary
+        """
+        summary = PipelineSummary()
+        worst = []  # min-heap of (ratio, seq, record)
+        seq = [0]
+
+        def report(batch):
+            for rec in batch.results:
+                key = (rec["kind"], rec["status"])
+                summary.counts[key] = summary.counts.get(key, 0) + 1
+                entry = (rec["ratio"], seq[0], rec)
+                seq[0] += 1
+                if len(worst) < self.top_n:
+                    heapq.heappush(worst, entry)
+                elif entry[0] > worst[0][0]:
+                    heapq.heapreplace(worst, entry)
+            summary.items += len(batch.results)
+            count("pipeline.items", len(batch.results))
+            if sink is not None:
+                sink(batch.results)
+
+        stages = [("resolve", self.resolve), ("capacities", self.capacities), ("interactions", self.interactions),
+                  ("connections", self.connections), ("report", report)]
+        queues = [queue.Queue(self.queue_size) for _ in stages]
+        errors = []
+        stop = threading.Event()
+
+        def source():
+            try:
+                with timer("pipeline", "parse"):
+                    self._parse(read_structure(structure), queues[0], stop)
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                queues[0].put(_END)
+
+        def worker(name, func, inbox, outbox):
+            try:
+                while True:
+                    batch = inbox.get()
+                    if batch is _END:
+                        break
+                    if stop.is_set():
+                        continue  # drain so upstream never blocks
+                    with timer("pipeline", name):
+                        out = func(batch)
+                    if outbox is not None:
+                        outbox.put(out)
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+                while inbox.get() is not _END:
+                    pass
+            finally:
+                if outbox is not None:
+                    outbox.put(_END)
+
+        threads = [threading.Thread(target=source, name="pipeline-parse", daemon=True)]
+        for i, (name, func) in enumerate(stages):
+            outbox = queues[i + 1] if i + 1 < len(stages) else None
+            threads.append(threading.Thread(target=worker, args=(name, func, queues[i], outbox),
+                                            name=f"pipeline-{name}", daemon=True))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        if errors:
+            raise errors[0]
+        summary.worst = [rec for _, _, rec in sorted(worst, key=lambda e: (-e[0], e[1]))]
+        return summary
+
+
+def run_pipeline(structure, db, sink=None, **options):
+    """Shortcut for DesignPipeline(db, **options).run(structure, sink)."""
+    return DesignPipeline(db, **options).run(structure, sink)
@@ -1,7 +1,11 @@
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.patches import Rectangle
 from matplotlib.figure import Figure
 
+from core.instrumentation import instrumented
+
+@instrumented("plot", "section")
 def create_section_plot(profile):
     """
     Create a matplotlib Figure of the I-Section profile.
@@ -21,8 +25,7 @@ def create_section_plot(profile):
     fig = Figure(figsize=(5, 5), dpi=100)
     ax = fig.add_subplot(111)
     
-    # Determine type based on name
-    is_hss = "HSS" in profile.name
+    is_hss = profile.section_type == "HSS"
     
     if is_hss:
         # Draw Box Section
@@ -80,3 +83,58 @@ def create_section_plot(profile):
     ax.grid(True, linestyle='--', alpha=0.5)
     
     return fig
+
+
+@instrumented("plot", "heatmap")
+def create_heatmap_plot(x_values, y_values, data, x_label, y_label, title, limit=None):
+    """
+    Heat map of a 2-D sweep slice.
+
+    Args:
+        x_values, y_values (array): Axis values (length = data columns / rows).
+        data (2-D array): Values of shape (len(y_values), len(x_values)).
+        x_label, y_label, title (str): Labels.
+        limit (float): Optional value to outline with a contour (e.g. ratio = 1.0).
+    """
+    fig = Figure(figsize=(6, 5), dpi=100)
+    ax = fig.add_subplot(111)
+
+    mesh = ax.pcolormesh(x_values, y_values, data, shading='nearest', cmap='RdYlGn_r')
+    fig.colorbar(mesh, ax=ax)
+    if limit is not None and len(x_values) > 1 and len(y_values) > 1 and data.min() < limit < data.max():
+        contour = ax.contour(x_values, y_values, data, levels=[limit], colors='black', linewidths=1.5)
+        ax.clabel(contour, fmt=f"{limit:g}")
+
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+    ax.set_title(title)
+    return fig
+
+
+@instrumented("plot", "interaction")
+def create_interaction_plot(surface, Pu=None, Mux=None, Muy=None, n=25):
+    """
+    3-D P-Mx-My interaction surface (kN, kNm) with optional demand points.
+
+    Args:
+        surface (InteractionSurface): Surface to draw (see core.interaction).
+        Pu, Mux, Muy (array): Demand points in N and N-mm; drawn green inside the surface, red outside.
+        n (int): Mesh resolution.
+    """
+    fig = Figure(figsize=(6, 5), dpi=100)
+    ax = fig.add_subplot(111, projection='3d')
+
+    P, Mx, My = surface.mesh(n)
+    ax.plot_surface(Mx / 1e6, My / 1e6, P / 1e3, color='#1f538d', alpha=0.35, edgecolor='#1f538d', linewidth=0.3)
+
+    if Pu is not None:
+        Pu, Mux, Muy = (np.atleast_1d(np.asarray(v, dtype=float)) for v in (Pu, Mux, Muy))
+        inside = surface.contains(Pu, Mux, Muy)
+        ax.scatter(np.abs(Mux[inside]) / 1e6, np.abs(Muy[inside]) / 1e6, Pu[inside] / 1e3, color='green', s=12)
+        ax.scatter(np.abs(Mux[~inside]) / 1e6, np.abs(Muy[~inside]) / 1e6, Pu[~inside] / 1e3, color='red', s=12)
+
+    ax.set_xlabel("Mux (kNm)")
+    ax.set_ylabel("Muy (kNm)")
+    ax.set_zlabel("Pu (kN)")
+    ax.set_title(f"Interaction Surface: {surface.key[0]}")
+    return fig
@@ -1,9 +1,19 @@
 import csv
+import hashlib
+import io
 import os
 
+import numpy as np
+
+from core.instrumentation import instrumented, count
+from core.section_properties import DERIVED, compute_properties, catalogue_properties
+
 class SteelProfile:
-    def __init__(self, name, weight, depth, width, web_thick, flange_thick, area, ix, iy, rx, ry, zx, zy):
+    @instrumented("derive", "SteelProfile")
+    def __init__(self, name, weight, depth, width, web_thick, flange_thick, area, ix, iy, rx, ry, zx, zy,
+                 section_type="WF", derived=None):
         self.name = name
+        self.section_type = section_type
         self.weight = float(weight)  # kg/m
         self.d = float(depth)        # mm
         self.bf = float(width)       # mm
@@ -21,54 +31,148 @@ class SteelProfile:
         self.Sx = self.Ix / (self.d / 2)
         self.Sy = self.Iy / (self.bf / 2)
         
-        # Torsion Properties (Approximate)
-        # h0 = distance between flange centroids
-        self.h0 = self.d - self.tf
-        
-        # J = Sum(b*t^3/3)
-        # 2 Flanges + 1 Web
-        self.J = (2 * self.bf * self.tf**3 + (self.d - 2*self.tf) * self.tw**3) / 3
-        
-        # Cw (Warping Constant) approx for I-shape = Iy * h0^2 / 4
-        self.Cw = (self.Iy * self.h0**2) / 4
-        
-        # rts used for LTB = sqrt(sqrt(Iy * Cw) / Sx)
-        # Simplified approximate: rts ~ ry / sqrt(1 + 1/6 * (h * tw) / (bf * tf)) ?
-        # Or exact formula: rts^2 = sqrt(Iy * Cw) / Sx
-        import math
-        try:
-           self.rts = math.sqrt(math.sqrt(self.Iy * self.Cw) / self.Sx)
-        except ValueError:
-           self.rts = self.ry # Fallback
+        # Torsion Properties (see core.section_properties)
+        # r = fillet / corner radius, h0 = distance between flange centroids,
+        # J = torsion constant, Cw = warping constant, rts = effective radius for LTB.
+        # ProfileDatabase passes them precomputed for the whole catalogue.
+        if derived is None:
+            derived = compute_properties(section_type, {
+                "d": self.d, "bf": self.bf, "tw": self.tw, "tf": self.tf,
+                "Ag": self.Ag, "Iy": self.Iy, "Sx": self.Sx
+            })
+        self.r = float(derived["r"])
+        self.h0 = float(derived["h0"])
+        self.J = float(derived["J"])
+        self.Cw = float(derived["Cw"])
+        self.rts = float(derived["rts"])
 
     def __repr__(self):
         return f"<SteelProfile {self.name}>"
 
+def _mm_columns(rows):
+    """Catalogue rows -> arrays in mm units, as needed by core.section_properties."""
+    def col(key, scale=1.0):
+        return np.array([row[key] for row in rows], dtype=float) * scale
+    d = col('depth_mm')
+    return {
+        "d": d, "bf": col('width_mm'), "tw": col('web_thick_mm'), "tf": col('flange_thick_mm'),
+        "Ag": col('area_cm2', 100), "Iy": col('iy_cm4', 10000), "Sx": col('ix_cm4', 10000) / (d / 2)
+    }
+
 class ProfileDatabase:
+    """
+    Profile catalogue. Rows of every section type are kept, partitioned per type;
+    a partition is parsed and its derived properties computed on first access, so
+    only the families actually used pay the load cost.
+    """
     def __init__(self, csv_path):
-        self.profiles = []
+        self.csv_path = csv_path
+        self.version = None  # SHA-1 of the catalogue file, changes whenever the data changes
+        self._header = None
+        self._raw = {}         # section type -> unparsed CSV records (raw text, one or more lines each)
+        self._names = {}       # section type -> profile names in file order
+        self._type_of = {}     # profile name -> section type
+        self._partitions = {}  # section type -> {name: SteelProfile}, built lazily
         self._load_data(csv_path)
 
+    @instrumented("parse", "profiles_csv")
     def _load_data(self, csv_path):
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"Database file not found: {csv_path}")
         
-        with open(csv_path, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['type'] == 'WF':
-                    self.profiles.append(SteelProfile(
-                        row['name'], row['weight_kg_m'], row['depth_mm'], row['width_mm'],
-                        row['web_thick_mm'], row['flange_thick_mm'], row['area_cm2'],
-                        row['ix_cm4'], row['iy_cm4'], row['rx_cm'], row['ry_cm'],
-                        row['zx_cm3'], row['zy_cm3']
-                    ))
-
-    def get_all_names(self):
-        return [p.name for p in self.profiles]
+        with open(csv_path, 'rb') as f:
+            data = f.read()
+        self.version = hashlib.sha1(data).hexdigest()
+
+        # Only the type and name are read here; the rest of each record waits for its partition.
+        # The reader pulls lines one at a time, so the lines it consumed for a record are its
+        # raw text (a quoted field may span several lines).
+        consumed = []
+
+        def lines():
+            for line in io.StringIO(data.decode('utf-8'), newline=''):
+                consumed.append(line)
+                yield line
+
+        reader = csv.reader(lines())
+        header = next(reader, None)
+        if header is None:
+            return
+        try:
+            type_col, name_col = header.index('type'), header.index('name')
+        except ValueError:
+            raise ValueError(f"Catalogue header must have 'type' and 'name' columns: {csv_path}") from None
+        self._header = "".join(consumed)
+        consumed.clear()
+        rows = 0
+        for record in reader:
+            raw = "".join(consumed)
+            consumed.clear()
+            if not record:
+                continue
+            section_type, name = record[type_col], record[name_col]
+            self._raw.setdefault(section_type, []).append(raw if raw.endswith("\n") else raw + "\n")
+            self._names.setdefault(section_type, []).append(name)
+            self._type_of[name] = section_type
+            rows += 1
+        count("parse.rows", rows)
+
+    @instrumented("parse", "partition")
+    def _build_partition(self, section_type):
+        rows = list(csv.DictReader(io.StringIO(self._header + "".join(self._raw[section_type]), newline='')))
+        # Derived properties for the whole family in one vectorized pass (cached on disk)
+        derived = catalogue_properties(self.csv_path, self.version, section_type, _mm_columns(rows))
+        partition = {}
+        for i, row in enumerate(rows):
+            partition[row['name']] = SteelProfile(
+                row['name'], row['weight_kg_m'], row['depth_mm'], row['width_mm'],
+                row['web_thick_mm'], row['flange_thick_mm'], row['area_cm2'],
+                row['ix_cm4'], row['iy_cm4'], row['rx_cm'], row['ry_cm'],
+                row['zx_cm3'], row['zy_cm3'],
+                section_type=section_type, derived={k: derived[k][i] for k in DERIVED}
+            )
+        return partition
+
+    def _partition(self, section_type):
+        partition = self._partitions.get(section_type)
+        if partition is None:
+            partition = self._partitions[section_type] = self._build_partition(section_type)
+        return partition
+
+    @property
+    def section_types(self):
+        """Section types present in the catalogue, in file order."""
+        return list(self._names)
+
+    @property
+    def loaded_types(self):
+        """Section types whose partition has been built."""
+        return list(self._partitions)
+
+    @property
+    def profiles(self):
+        """Every profile of every type (builds all partitions)."""
+        return [p for t in self._names for p in self._partition(t).values()]
+
+    def get_profiles(self, section_type=None):
+        """
+        Profiles of one section type (every type when None), in file order; empty for an
+        unknown type. Same accessor as FederatedCatalogue.get_profiles.
+        """
+        if section_type is None:
+            return self.profiles
+        if section_type not in self._names:
+            return []
+        return list(self._partition(section_type).values())
+
+    def get_all_names(self, section_type=None):
+        """Profile names, optionally of one type only. Does not build any partition."""
+        if section_type is not None:
+            return list(self._names.get(section_type, []))
+        return [name for names in self._names.values() for name in names]
 
     def get_profile(self, name):
-        for p in self.profiles:
-            if p.name == name:
-                return p
-        return None
+        section_type = self._type_of.get(name)
+        if section_type is None:
+            return None
+        return self._partition(section_type)[name]
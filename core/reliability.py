@@ -0,0 +1,202 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+
+from core.batch import section_compression_batch, flexure_batch, combined_batch
+from core.classification import classify
+from core.instrumentation import instrumented, count
+
+# Monte Carlo reliability of member capacity. Inputs are random variables (or plain
+# numbers); samples are drawn in NumPy and evaluated through the batch kernels with
+# nominal strengths (no resistance factors). The limit state is g = R - S for
+# compression and flexure and g = 1 - (interaction ratio) for combined actions;
+# failure is g < 0.
+#
+# Samples are split into fixed-size chunks, each with its own seed spawned from the
+# run seed, so results are identical in serial and parallel mode and for any number
+# of workers.
+
+CHUNK_SIZE = 100000
+
+# Resistance factor used by every kernel evaluated here (E3, F2 and H1 all use 0.9)
+PHI = 0.9
+
+EULER_GAMMA = 0.5772156649015329
+
+CHECKS = ("compression", "flexure", "combined")
+
+# Section properties scaled by the "section" variable (geometry / thickness variation)
+SCALED_PROPERTIES = {"Ag", "Sx", "Zx", "Zy"}
+
+
+@dataclass
+class RandomVariable:
+    """
+    Args:
+        dist (str): "normal", "lognormal" or "gumbel" (largest values, e.g. live or wind load).
+        mean (float): Mean value.
+        cov (float): Coefficient of variation (standard deviation / mean).
+    """
+    dist: str
+    mean: float
+    cov: float
+
+    def sample(self, rng, n):
+        sd = abs(self.mean) * self.cov
+        if sd == 0:
+            return np.full(n, float(self.mean))
+        if self.dist == "normal":
+            return rng.normal(self.mean, sd, n)
+        if self.dist == "lognormal":
+            sigma = math.sqrt(math.log(1 + self.cov**2))
+            return rng.lognormal(math.log(self.mean) - sigma**2 / 2, sigma, n)
+        if self.dist == "gumbel":
+            scale = sd * math.sqrt(6) / math.pi
+            return rng.gumbel(self.mean - EULER_GAMMA * scale, scale, n)
+        raise ValueError(f"Unknown distribution '{self.dist}'")
+
+
+def Normal(mean, cov):
+    return RandomVariable("normal", mean, cov)
+
+
+def Lognormal(mean, cov):
+    return RandomVariable("lognormal", mean, cov)
+
+
+def Gumbel(mean, cov):
+    return RandomVariable("gumbel", mean, cov)
+
+
+@dataclass
+class ReliabilityResult:
+    """
+    Attributes:
+        pf (float): Estimated probability of failure.
+        beta (float): Reliability index, -inverse normal CDF of pf (inf when no failures).
+        n_samples (int): Samples evaluated.
+        n_failures (int): Samples with g < 0.
+        cov_pf (float): Coefficient of variation of the pf estimate (inf when no failures).
+        mean_g (float), std_g (float): Moments of the limit-state function.
+    """
+    pf: float
+    beta: float
+    n_samples: int
+    n_failures: int
+    cov_pf: float
+    mean_g: float
+    std_g: float
+
+
+class _SampledSection:
+    """A profile whose scaled properties are arrays (one value per sample); kernels broadcast it."""
+    def __init__(self, profile, factor):
+        self.name = profile.name
+        self._profile = profile
+        self._factor = factor
+
+    def __getattr__(self, attr):
+        value = getattr(self._profile, attr)
+        return value * self._factor if attr in SCALED_PROPERTIES else value
+
+
+def _draw(value, rng, n):
+    if isinstance(value, RandomVariable):
+        return value.sample(rng, n)
+    if isinstance(value, (list, tuple)):
+        # Several load components acting together, e.g. [dead, live]
+        return sum(_draw(v, rng, n) for v in value)
+    return np.full(n, float(value))
+
+
+def limit_state(check, profile, variables, rng, n):
+    """
+    Draw n samples and evaluate the limit-state function.
+
+    Args:
+        check (str): One of CHECKS.
+        profile (SteelProfile): Section.
+        variables (dict): Check inputs (numbers, RandomVariables, or lists of them for
+            summed load components). Keys as in the calculate_* functions; loads are
+            Pu (compression, combined), Mu (flexure), Mux / Muy (combined). "section"
+            is an optional factor on Ag, Sx, Zx and Zy (default 1).
+        rng (numpy.random.Generator): Random source.
+        n (int): Number of samples.
+
+    Returns:
+        ndarray: g for every sample (failure when g < 0).
+    """
+    v = {k: _draw(val, rng, n) for k, val in sorted(variables.items())}
+    # Local buckling data come from the nominal section; they are fractions of Mp, so they
+    # still apply when the section factor scales Sx and Zx alike
+    classify([profile])
+    section = _SampledSection(profile, v.get("section", 1.0))
+    K = v.get("K", 1.0)
+    Fy = v["Fy"]
+    if check == "compression":
+        L = v["L"]
+        Pn = section_compression_batch(section, K, L, K, L, Fy)["Pn"]
+        return Pn - v["Pu"]
+    if check == "flexure":
+        Mn = flexure_batch(section, v.get("Lb", v.get("L")), v.get("Cb", 1.0), Fy)["Mn"]
+        return Mn - v["Mu"]
+    if check == "combined":
+        # All resistance factors in H1 are PHI, so scaling the demands by PHI gives the nominal interaction
+        ratio = combined_batch(section, PHI * v["Pu"], PHI * v.get("Mux", 0.0), PHI * v.get("Muy", 0.0),
+                               v["L"], K, v.get("Cb", 1.0), Fy)["ratio"]
+        return 1.0 - ratio
+    raise ValueError(f"Unknown check '{check}'")
+
+
+def _run_chunk(check, profile, variables, seed, n):
+    """Failures and g moments of one chunk (module-level so it can run in a pool worker)."""
+    g = limit_state(check, profile, variables, np.random.default_rng(seed), n)
+    return int(np.count_nonzero(g < 0)), float(g.sum()), float(np.square(g).sum())
+
+
+@instrumented("reliability", "monte_carlo")
+def monte_carlo(check, profile, variables, n_samples=1000000, seed=None, workers=0, chunk_size=CHUNK_SIZE):
+    """
+    Estimate the failure probability of a member by Monte Carlo simulation.
+
+    Args:
+        check (str): "compression", "flexure" or "combined".
+        profile (SteelProfile): Section.
+        variables (dict): See limit_state().
+        n_samples (int): Total number of samples.
+        seed (int): Seed for reproducible results (None for a fresh one).
+        workers (int): Processes for parallel evaluation; 0 runs in this process.
+        chunk_size (int): Samples per chunk (bounds memory).
+
+    Returns:
+        ReliabilityResult
+    """
+    if check not in CHECKS:
+        raise ValueError(f"Unknown check '{check}'")
+    sizes = [min(chunk_size, n_samples - start) for start in range(0, n_samples, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(check, profile, variables, s, n) for s, n in zip(seeds, sizes)]
+
+    if workers:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_run_chunk, *zip(*args)))
+    else:
+        parts = [_run_chunk(*a) for a in args]
+
+    failures = sum(p[0] for p in parts)
+    mean_g = sum(p[1] for p in parts) / n_samples
+    std_g = math.sqrt(max(sum(p[2] for p in parts) / n_samples - mean_g**2, 0.0))
+    count("reliability.samples", n_samples)
+
+    pf = failures / n_samples
+    if failures == 0:
+        beta, cov_pf = math.inf, math.inf
+    elif failures == n_samples:
+        beta, cov_pf = -math.inf, 0.0
+    else:
+        beta = -NormalDist().inv_cdf(pf)
+        cov_pf = math.sqrt((1 - pf) / (n_samples * pf))
+    return ReliabilityResult(pf, beta, n_samples, failures, cov_pf, mean_g, std_g)
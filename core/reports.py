@@ -1,106 +1,494 @@
+import csv
+import functools
+import html
+import json
+import os
+from datetime import datetime
+
+import numpy as np
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from datetime import datetime
 
-class PDFReport:
-    @staticmethod
-    def generate(filepath, title, inputs, results):
+from core.instrumentation import instrumented, count
+
+# Report output. A backend writes one file holding one or more calculations (title,
+# inputs, results), added one at a time:
+#
+#     with HTMLBackend("review.html") as out:
+#         for title, inputs, results in reports:
+#             out.add(title, inputs, results)
+#
+# HTML, CSV and JSONL stream each calculation to the file as it is added; PDF collects
+# flowables and lays them out on close, so it is best kept for the final issue.
+#
+# Large result tables (schedules with thousands of rows) go through add_table(). Rows are
+# formatted and written TABLE_CHUNK_ROWS at a time, so the streaming backends hold one
+# chunk of cell strings; in PDF the rows are laid out as a run of LongTables of
+# TABLE_CHUNK_ROWS rows with a repeated header, fixed column widths and row heights and
+# one shared TableStyle. Each page split then only touches one chunk, so layout time per
+# row stays constant instead of growing with the table.
+
+TABLE_CHUNK_ROWS = 250
+TABLE_ROW_HEIGHT = 14  # pt
+
+
+def _format_value(v):
+    # Format numbers if possible
+    return f"{v:.3f}" if isinstance(v, (float, np.floating)) else str(v)
+
+
+def format_column(values):
+    """Cell strings of a whole column (floats with 3 decimals, as in the calculation reports)."""
+    a = np.asarray(values)
+    if a.dtype.kind == "f":
+        return np.char.mod("%.3f", a).tolist()
+    if a.dtype.kind in "iub":
+        return a.astype(str).tolist()
+    return [_format_value(v) for v in a.tolist()]
+
+
+def _table_columns(columns):
+    """Column name -> values of a dict of columns or a ResultTable."""
+    return dict(columns.columns if hasattr(columns, "columns") else columns)
+
+
+def _table_chunks(columns, n_rows):
+    """Slices of every column, TABLE_CHUNK_ROWS rows at a time."""
+    values = list(columns.values())
+    for start in range(0, n_rows, TABLE_CHUNK_ROWS):
+        yield [v[start:start + TABLE_CHUNK_ROWS] for v in values]
+
+
+def _split_status(results):
+    """Result items without the status, and the status ("UNKNOWN" if absent)."""
+    return [(k, v) for k, v in results.items() if k != "status"], results.get("status", "UNKNOWN")
+
+
+# Statuses shown as passing; anything else (NOT SAFE, NOT OK, Plate Area Too Small, ...) is a failure
+PASSING_STATUSES = ("OK", "SAFE")
+
+
+def _is_ok(status):
+    return str(status).strip().upper() in PASSING_STATUSES
+
+
+def _timestamp():
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+class ReportBackend:
+    """
+    Base class of report writers.
+
+    Args:
+        filepath (str): Output path.
+    """
+    extension = None
+    label = None
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.count = 0
+
+    def add(self, title, inputs, results):
         """
-        Generate a PDF report.
-        
+        Add one calculation.
+
         Args:
-            filepath (str): Output path.
             title (str): Report title (e.g., "Tension Member Check")
             inputs (dict): Dictionary of input parameters.
-            results (dict): Dictionary of calculation results.
+            results (dict): Dictionary of calculation results ("status" is shown separately).
+        """
+        self._write(title, inputs, results)
+        self.count += 1
+
+    def _write(self, title, inputs, results):
+        raise NotImplementedError
+
+    def add_table(self, title, columns):
+        """
+        Add a large table (e.g. a member schedule).
+
+        Args:
+            title (str): Table heading.
+            columns (dict or ResultTable): Column name -> values, all of the same length.
         """
-        doc = SimpleDocTemplate(filepath, pagesize=A4)
-        elements = []
-        styles = getSampleStyleSheet()
-
-        # Custom Styles
-        title_style = ParagraphStyle(
-            'ReportTitle',
-            parent=styles['Heading1'],
-            fontSize=18,
-            textColor=colors.HexColor("#1f538d"),
-            spaceAfter=20
-        )
-        
-        header_style = ParagraphStyle(
-            'SectionHeader',
-            parent=styles['Heading2'],
-            fontSize=14,
-            textColor=colors.HexColor("#2b2b2b"),
-            spaceBefore=15,
-            spaceAfter=10
-        )
+        columns = _table_columns(columns)
+        n_rows = len(next(iter(columns.values()))) if columns else 0
+        self._write_table(title, columns, n_rows)
+        count("report.table_rows", n_rows)
+
+    def _write_table(self, title, columns, n_rows):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _pdf_styles():
+    styles = getSampleStyleSheet()
+    # Custom Styles
+    title_style = ParagraphStyle(
+        'ReportTitle',
+        parent=styles['Heading1'],
+        fontSize=18,
+        textColor=colors.HexColor("#1f538d"),
+        spaceAfter=20
+    )
+    header_style = ParagraphStyle(
+        'SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor=colors.HexColor("#2b2b2b"),
+        spaceBefore=15,
+        spaceAfter=10
+    )
+    table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (1, 0), colors.HexColor("#e1e1e1")),
+        ('TEXTCOLOR', (0, 0), (1, 0), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#dcdcdc")),
+    ])
+    status_styles = {ok: ParagraphStyle('Status', parent=styles['Normal'], fontSize=14,
+                                        textColor=colors.green if ok else colors.red, alignment=1)
+                     for ok in (True, False)}
+    return styles, title_style, header_style, table_style, status_styles
+
+
+@functools.lru_cache(maxsize=1)
+def _long_table_style():
+    # Shared by every chunk of every large table
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#e1e1e1")),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 1),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor("#dcdcdc")),
+    ])
+
+
+class PDFBackend(ReportBackend):
+    """ReportLab PDF, one calculation per page group; laid out on close."""
+    extension = ".pdf"
+    label = "PDF Files"
+
+    def __init__(self, filepath):
+        super().__init__(filepath)
+        self.elements = []
+
+    def _write(self, title, inputs, results):
+        styles, title_style, header_style, table_style, status_styles = _pdf_styles()
+        elements = self.elements
+        if elements:
+            elements.append(PageBreak())
 
         # 1. Header
         elements.append(Paragraph("Civil Engineering - Calculation Report", title_style))
         elements.append(Paragraph(f"<b>Type:</b> {title}", styles["Normal"]))
-        elements.append(Paragraph(f"<b>Date:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles["Normal"]))
+        elements.append(Paragraph(f"<b>Date:</b> {_timestamp()}", styles["Normal"]))
         elements.append(Spacer(1, 20))
 
         # 2. Inputs
         elements.append(Paragraph("Input Parameters", header_style))
-        
-        input_data = [["Parameter", "Value"]]
-        for k, v in inputs.items():
-            input_data.append([k, str(v)])
-            
+        input_data = [["Parameter", "Value"]] + [[k, str(v)] for k, v in inputs.items()]
         t_input = Table(input_data, colWidths=[200, 200])
-        t_input.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (1, 0), colors.HexColor("#e1e1e1")),
-            ('TEXTCOLOR', (0, 0), (1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#dcdcdc")),
-        ]))
+        t_input.setStyle(table_style)
         elements.append(t_input)
         elements.append(Spacer(1, 20))
 
         # 3. Results
         elements.append(Paragraph("Calculation Results", header_style))
-        
-        res_data = [["Item", "Result"]]
-        status = "UNKNOWN"
-        
-        for k, v in results.items():
-            if k == "status":
-                status = v
-                continue
-            # Format numbers if possible
-            val_str = str(v)
-            if isinstance(v, float):
-                val_str = f"{v:.3f}"
-            res_data.append([k, val_str])
-            
+        items, status = _split_status(results)
+        res_data = [["Item", "Result"]] + [[k, _format_value(v)] for k, v in items]
         t_res = Table(res_data, colWidths=[200, 200])
-        t_res.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (1, 0), colors.HexColor("#e1e1e1")),
-            ('TEXTCOLOR', (0, 0), (1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#dcdcdc")),
-        ]))
+        t_res.setStyle(table_style)
         elements.append(t_res)
         elements.append(Spacer(1, 20))
 
         # 4. Status Box
-        status_color = colors.green if "SAFE" in status or "OK" in status else colors.red
-        status_text = f"<b>STATUS: {status}</b>"
-        
-        p_status = Paragraph(status_text, ParagraphStyle(
-            'Status', parent=styles['Normal'], fontSize=14, textColor=status_color, alignment=1
-        ))
-        elements.append(p_status)
+        elements.append(Paragraph(f"<b>STATUS: {status}</b>", status_styles[_is_ok(status)]))
+
+    def _write_table(self, title, columns, n_rows):
+        _, _, header_style, _, _ = _pdf_styles()
+        style = _long_table_style()
+        header = [str(k) for k in columns]
+        widths = [(A4[0] - 2 * inch) / max(len(header), 1)] * len(header)
+        self.elements.append(Paragraph(str(title), header_style))
+        chunks = [[format_column(c) for c in chunk] for chunk in _table_chunks(columns, n_rows)] or [[]]
+        for cells in chunks:
+            rows = [header] + [list(r) for r in zip(*cells)]
+            self.elements.append(LongTable(rows, colWidths=widths, rowHeights=TABLE_ROW_HEIGHT,
+                                           repeatRows=1, style=style))
 
+    def close(self):
         # Build PDF
-        doc.build(elements)
+        SimpleDocTemplate(self.filepath, pagesize=A4).build(self.elements)
+
+
+# HTML templates, formatted once per row / section
+_HTML_HEAD = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Civil Engineering - Calculation Report</title>
+<style>
+body {{ font-family: Helvetica, Arial, sans-serif; margin: 2em; color: #2b2b2b; }}
+h1 {{ color: #1f538d; }}
+section {{ margin-bottom: 2.5em; }}
+table {{ border-collapse: collapse; min-width: 400px; margin-bottom: 1em; }}
+th, td {{ border: 1px solid #dcdcdc; padding: 4px 8px; text-align: left; }}
+th {{ background: #e1e1e1; }}
+.status {{ font-size: 1.2em; font-weight: bold; }}
+.ok {{ color: green; }} .fail {{ color: red; }}
+</style></head><body>
+<h1>Civil Engineering - Calculation Report</h1>
+<p><b>Date:</b> {date}</p>
+""".format
+_HTML_SECTION = """<section>
+<h2>{title}</h2>
+<h3>Input Parameters</h3>
+<table><tr><th>Parameter</th><th>Value</th></tr>
+{inputs}</table>
+<h3>Calculation Results</h3>
+<table><tr><th>Item</th><th>Result</th></tr>
+{results}</table>
+<p class="status {css}">STATUS: {status}</p>
+</section>
+""".format
+_HTML_ROW = "<tr><td>{}</td><td>{}</td></tr>\n".format
+_HTML_FOOT = "</body></html>\n"
+
+
+class HTMLBackend(ReportBackend):
+    """Single HTML page, written section by section."""
+    extension = ".html"
+    label = "HTML Files"
+
+    def __init__(self, filepath):
+        super().__init__(filepath)
+        self._file = open(filepath, "w", encoding="utf-8")
+        self._file.write(_HTML_HEAD(date=_timestamp()))
+
+    def _write(self, title, inputs, results):
+        esc = html.escape
+        items, status = _split_status(results)
+        self._file.write(_HTML_SECTION(
+            title=esc(str(title)),
+            inputs="".join(_HTML_ROW(esc(str(k)), esc(str(v))) for k, v in inputs.items()),
+            results="".join(_HTML_ROW(esc(str(k)), esc(_format_value(v))) for k, v in items),
+            css="ok" if _is_ok(status) else "fail",
+            status=esc(str(status)),
+        ))
+
+    def _write_table(self, title, columns, n_rows):
+        esc = html.escape
+        write = self._file.write
+        write(f"<section>\n<h2>{esc(str(title))}</h2>\n<table><tr>")
+        write("".join(f"<th>{esc(str(k))}</th>" for k in columns))
+        write("</tr>\n")
+        row = ("<tr>" + "<td>{}</td>" * len(columns) + "</tr>\n").format
+        for chunk in _table_chunks(columns, n_rows):
+            cells = [[esc(v) for v in format_column(c)] for c in chunk]
+            write("".join(row(*r) for r in zip(*cells)))
+        write("</table>\n</section>\n")
+
+    def close(self):
+        if not self._file.closed:
+            self._file.write(_HTML_FOOT)
+            self._file.close()
+
+
+class CSVBackend(ReportBackend):
+    """
+    Long-format summary: one row per input or result item of every calculation. A file
+    holds either calculations or one table (written wide, one column per table column).
+    """
+    extension = ".csv"
+    label = "CSV Files"
+    HEADER = ("report", "title", "section", "item", "value")
+
+    def __init__(self, filepath):
+        super().__init__(filepath)
+        self._file = open(filepath, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._layout = None  # "calculations" or "table", fixed by the first write
+
+    def _start(self, layout):
+        if self._layout is not None:
+            raise ValueError("A CSV report holds either calculations or a single table")
+        self._layout = layout
+
+    def _write(self, title, inputs, results):
+        if self._layout != "calculations":
+            self._start("calculations")
+            self._writer.writerow(self.HEADER)
+        n = self.count + 1
+        items, status = _split_status(results)
+        self._writer.writerows([(n, title, "input", k, v) for k, v in inputs.items()])
+        self._writer.writerows([(n, title, "result", k, _format_value(v)) for k, v in items])
+        self._writer.writerow((n, title, "result", "status", status))
+
+    def _write_table(self, title, columns, n_rows):
+        self._start("table")
+        self._writer.writerow(list(columns))
+        # Full precision: the CSV is for further processing
+        for chunk in _table_chunks(columns, n_rows):
+            self._writer.writerows(zip(*(np.asarray(c).astype(str).tolist() for c in chunk)))
+
+    def close(self):
+        self._file.close()
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+class JSONLBackend(ReportBackend):
+    """One JSON object per calculation and line (values unformatted)."""
+    extension = ".jsonl"
+    label = "JSON Lines"
+
+    def __init__(self, filepath):
+        super().__init__(filepath)
+        self._file = open(filepath, "w", encoding="utf-8")
+        self._date = _timestamp()
+
+    def _write(self, title, inputs, results):
+        items, status = _split_status(results)
+        record = {"title": title, "date": self._date, "status": status, "inputs": inputs, "results": dict(items)}
+        self._file.write(json.dumps(record, default=_json_default) + "\n")
+
+    def _write_table(self, title, columns, n_rows):
+        names = list(columns)
+        dumps = json.JSONEncoder(default=_json_default).encode
+        for chunk in _table_chunks(columns, n_rows):
+            values = [np.asarray(c).tolist() for c in chunk]
+            self._file.write("".join(dumps({"table": title, **dict(zip(names, r))}) + "\n" for r in zip(*values)))
+
+    def close(self):
+        self._file.close()
+
+
+BACKENDS = {"pdf": PDFBackend, "html": HTMLBackend, "csv": CSVBackend, "jsonl": JSONLBackend}
+
+
+def backend_for(filepath, backend=None):
+    """Backend class by name, or from the file extension."""
+    if backend is None:
+        backend = os.path.splitext(filepath)[1].lstrip(".").lower()
+        backend = {"htm": "html", "json": "jsonl"}.get(backend, backend)
+    try:
+        return BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown report format '{backend}'; expected one of {list(BACKENDS)}") from None
+
+
+def generate_report(filepath, title, inputs, results, backend=None):
+    """Write one calculation with the backend of the file extension (or the named backend)."""
+    with backend_for(filepath, backend)(filepath) as out:
+        out.add(title, inputs, results)
+
+
+@instrumented("report", "batch")
+def write_reports(filepath, reports, backend=None):
+    """
+    Write many calculations into one file.
+
+    Args:
+        reports (iterable): (title, inputs, results) tuples, consumed lazily.
+        backend (str): Backend name (default: from the file extension).
+
+    Returns:
+        int: Number of calculations written.
+    """
+    with backend_for(filepath, backend)(filepath) as out:
+        for title, inputs, results in reports:
+            out.add(title, inputs, results)
+    count("report.calculations", out.count)
+    return out.count
+
+
+def _flatten(d, prefix=""):
+    out = {}
+    for k, v in d.items():
+        if isinstance(v, dict):
+            out.update(_flatten(v, f"{prefix}{k}."))
+        else:
+            out[f"{prefix}{k}"] = v
+    return out
+
+
+def member_reports(members, results):
+    """
+    (title, inputs, results) of member checks, for write_reports.
+
+    Args:
+        members (list of Member): Checked members.
+        results (list of MemberResult): Output of evaluate_members, same order.
+    """
+    for m, r in zip(members, results):
+        inputs = {"Member": m.id, "Check": m.check, "Profile": m.profile, **m.params}
+        if m.level is not None:
+            inputs["Level"] = m.level
+        values = {"ratio": r.ratio, **_flatten(r.result.to_dict()), "status": r.status}
+        yield f"{m.check.capitalize()} check - {m.id}", inputs, values
+
+
+@instrumented("report", "table")
+def write_table(filepath, title, columns, backend=None):
+    """
+    Write one large table (see ReportBackend.add_table) to a file.
+
+    Returns:
+        int: Number of rows written.
+    """
+    with backend_for(filepath, backend)(filepath) as out:
+        out.add_table(title, columns)
+    columns = _table_columns(columns)
+    return len(next(iter(columns.values()))) if columns else 0
+
+
+def member_schedule(members, results):
+    """
+    Summary schedule columns of member checks (one row per member), for add_table / write_table.
+    """
+    return {
+        "Member": [m.id for m in members],
+        "Level": ["" if m.level is None else m.level for m in members],
+        "Check": [m.check for m in members],
+        "Profile": [m.profile for m in members],
+        "Ratio": np.array([r.ratio for r in results], dtype=float),
+        "Status": [r.status for r in results],
+    }
+
+
+class PDFReport:
+    @staticmethod
+    @instrumented("report", "pdf")
+    def generate(filepath, title, inputs, results):
+        """
+        Generate a PDF report.
+
+        Args:
+            filepath (str): Output path.
+            title (str): Report title (e.g., "Tension Member Check")
+            inputs (dict): Dictionary of input parameters.
+            results (dict): Dictionary of calculation results.
+        """
+        with PDFBackend(filepath) as out:
+            out.add(title, inputs, results)
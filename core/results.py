@@ -0,0 +1,289 @@
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+
+def result_type(aliases=None):
+    """
+    Class decorator turning a class into a slots dataclass with read-only dict-style access,
+    so `res['phi_Pn']`, `res.get(...)`, `res.keys()` and `res.items()` keep working.
+
+    Args:
+        aliases (dict): Dict key -> attribute name, for keys that are not valid
+            identifiers (e.g. "yield").
+    """
+    aliases = aliases or {}
+
+    def decorator(cls):
+        cls = dataclass(slots=True)(cls)
+        reverse = {attr: key for key, attr in aliases.items()}
+        cls._attr_by_key = {reverse.get(f.name, f.name): f.name for f in fields(cls)}
+        cls._keys = tuple(cls._attr_by_key)
+        return cls
+    return decorator
+
+
+class ResultMixin:
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self._attr_by_key[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        attr = self._attr_by_key.get(key)
+        return default if attr is None else getattr(self, attr)
+
+    def __contains__(self, key):
+        return key in self._attr_by_key
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def keys(self):
+        return self._keys
+
+    def values(self):
+        return [getattr(self, a) for a in self._attr_by_key.values()]
+
+    def items(self):
+        return [(k, getattr(self, a)) for k, a in self._attr_by_key.items()]
+
+    def to_dict(self):
+        """Plain (nested) dict copy of the result."""
+        return {k: v.to_dict() if isinstance(v, ResultMixin) else v for k, v in self.items()}
+
+    @classmethod
+    def from_columns(cls, columns, i):
+        """Build the result for row i of a columnar table."""
+        return cls(*(_scalar(columns[f.name][i]) for f in fields(cls)))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Inverse of to_dict(): nested result fields are rebuilt as their result type."""
+        types = {f.name: f.type for f in fields(cls)}
+        values = {}
+        for key, attr in cls._attr_by_key.items():
+            value = data[key]
+            t = types[attr]
+            if isinstance(value, dict) and isinstance(t, type) and issubclass(t, ResultMixin):
+                value = t.from_dict(value)
+            values[attr] = value
+        return cls(**values)
+
+
+def _scalar(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+@result_type()
+class LimitState(ResultMixin):
+    Pn: float
+    phi_Pn: float
+
+
+@result_type(aliases={"yield": "yield_"})
+class TensionResult(ResultMixin):
+    phi_Pn: float
+    yield_: LimitState
+    rupture: LimitState
+
+    @classmethod
+    def from_columns(cls, columns, i):
+        return cls(
+            _scalar(columns["phi_Pn"][i]),
+            LimitState(_scalar(columns["yield.Pn"][i]), _scalar(columns["yield.phi_Pn"][i])),
+            LimitState(_scalar(columns["rupture.Pn"][i]), _scalar(columns["rupture.phi_Pn"][i]))
+        )
+
+
+@result_type()
+class CompressionResult(ResultMixin):
+    phi_Pn: float
+    Pn: float
+    Fcr: float
+    KL_r: float
+    Fe: float
+
+
+@result_type()
+class BoltShearResult(ResultMixin):
+    phi_Rn: float
+    Rn: float
+    Ab: float
+
+
+# Flexure limit-state zones used by the columnar tables
+ZONE_CLOSED = 0  # closed section (HSS): LTB does not apply
+ZONE_YIELDING = 1
+ZONE_INELASTIC_LTB = 2
+ZONE_ELASTIC_LTB = 3
+ZONE_FLB = 4  # flange local buckling governs (core.classification)
+ZONE_WLB = 5  # web local buckling governs
+
+
+def flexure_state(zone, Fcr):
+    if zone == ZONE_CLOSED:
+        return "Yielding (closed section, no LTB)"
+    if zone == ZONE_YIELDING:
+        return "Yielding (Lb <= Lp)"
+    if zone == ZONE_INELASTIC_LTB:
+        return "Inelastic LTB (Lp < Lb <= Lr)"
+    if zone == ZONE_FLB:
+        return "Flange local buckling"
+    if zone == ZONE_WLB:
+        return "Web local buckling"
+    return f"Elastic LTB (Lb > Lr), Fcr={Fcr:.2f} MPa"
+
+
+@result_type()
+class FlexureResult(ResultMixin):
+    phi_Mn: float
+    Mn: float
+    Mp: float
+    Lp: float
+    Lr: float
+    Lb: float
+    state: str
+
+    @classmethod
+    def from_columns(cls, columns, i):
+        return cls(
+            *(_scalar(columns[k][i]) for k in ("phi_Mn", "Mn", "Mp", "Lp", "Lr", "Lb")),
+            flexure_state(columns["zone"][i], columns["Fcr"][i])
+        )
+
+
+@result_type()
+class WeldResult(ResultMixin):
+    phi_Rn: float
+    Rn: float
+    Awe: float
+    Fnw: float
+    phi: float
+
+
+@result_type()
+class CombinedResult(ResultMixin):
+    ratio: float
+    eq: str
+    Pr: float
+    Mrx: float
+    Mry: float
+    phi_Pn: float
+    phi_Mnx: float
+    phi_Mny: float
+    status: str
+
+
+@result_type()
+class BasePlateResult(ResultMixin):
+    phi_Pp: float
+    bearing_ratio: float
+    t_req: float
+    m: float
+    n: float
+    A1: float
+    status: str
+
+
+@result_type()
+class MomentPlateResult(ResultMixin):
+    Tu_total: float
+    Tu_bolt: float
+    phi_Rn_bolt: float
+    bolt_ratio: float
+    plate_check: str
+    status: str
+
+
+@result_type()
+class BoltGroupResult(ResultMixin):
+    phi_Rn: float
+    Rn: float
+    C: float
+    C_elastic: float
+    rn: float
+
+
+@result_type()
+class WeldGroupResult(ResultMixin):
+    phi_Rn: float
+    Rn: float
+    C: float
+    C_elastic: float
+    Fnw: float
+    te: float
+
+
+@result_type()
+class SecondOrderResult(ResultMixin):
+    Pr: float
+    Mrx: float
+    Mry: float
+    B1x: float
+    B1y: float
+    B2x: float
+    B2y: float
+    Pe1x: float
+    Pe1y: float
+
+
+@result_type()
+class ServiceabilityResult(ResultMixin):
+    ratio: float
+    delta: float
+    delta_limit: float
+    deflection_ratio: float
+    f1: float
+    frequency_ratio: float
+    status: str
+
+
+class ResultTable:
+    """
+    Columnar results of a batch evaluation: one NumPy array per quantity.
+    `table['ratio']` returns a column, `table[i]` materializes row i as the
+    scalar result type, and `len(table)` is the number of rows.
+    """
+    __slots__ = ("result_cls", "columns")
+
+    def __init__(self, result_cls, columns):
+        self.result_cls = result_cls
+        n = max(np.size(c) for c in columns.values())
+        self.columns = {k: np.broadcast_to(np.asarray(v), (n,)) for k, v in columns.items()}
+
+    def __len__(self):
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.columns[key]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError(key)
+        return self.result_cls.from_columns(self.columns, key)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __contains__(self, key):
+        return key in self.columns
+
+    def keys(self):
+        return self.columns.keys()
+
+    @property
+    def nbytes(self):
+        return sum(c.nbytes for c in self.columns.values())
+
+    def to_dicts(self):
+        """All rows as plain dicts (for JSON / reports)."""
+        return [row.to_dict() for row in self]
@@ -0,0 +1,163 @@
+import re
+
+import numpy as np
+
+from core.instrumentation import instrumented, count
+
+# Incremental profile name search for large catalogues.
+#
+# Names are matched on a normalized key (lower case, letters and digits only, so
+# "wf300x15" and "WF 300x150" line up). Every whitespace-separated query token must occur
+# in the key. Tokens of three or more characters are looked up in a trigram index (the
+# intersection of the posting lists of their trigrams, then verified); shorter tokens
+# filter by substring. When a query extends the previous one (the user typed more), only
+# the previous matches are filtered again.
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]")
+
+_cache = {}  # catalogue version -> ProfileIndex
+
+
+def normalize(text):
+    """Search key of a name or query token."""
+    return _NON_ALNUM.sub("", text.lower())
+
+
+class ProfileIndex:
+    """
+    Name index over a profile catalogue.
+
+    Args:
+        names (list of str): Profile names, in catalogue order.
+        types (list of str): Section type of each name.
+        columns (callable): attr -> array of that property for every name (N/mm units),
+            called on the first dimension filter on attr.
+    """
+    @instrumented("search", "build_index")
+    def __init__(self, names, types, columns=None):
+        self.names = list(names)
+        self.keys = [normalize(n) for n in self.names]
+        self.types = list(dict.fromkeys(types))
+        self.type_codes = np.array([self.types.index(t) for t in types] if len(types) else [], dtype=np.intp)
+        self._columns = columns
+        self._column_cache = {}
+        postings = {}
+        for i, key in enumerate(self.keys):
+            for j in range(len(key) - 2):
+                ids = postings.setdefault(key[j:j + 3], [])
+                if not ids or ids[-1] != i:
+                    ids.append(i)
+        self._trigrams = {t: np.array(ids, dtype=np.intp) for t, ids in postings.items()}
+        self._last = None  # (query, filter key, result) of the previous search
+        count("search.names", len(self.names))
+
+    @classmethod
+    def from_catalogue(cls, db):
+        """Index of a ProfileDatabase or FederatedCatalogue (no partition is built until a dimension filter is used)."""
+        section_types = db.section_types if hasattr(db, "section_types") else db.types
+        names, types = [], []
+        for t in section_types:
+            batch = db.get_all_names(section_type=t)
+            names.extend(batch)
+            types.extend([t] * len(batch))
+        return cls(names, types, lambda attr: np.array([getattr(db.get_profile(n), attr) for n in names], dtype=float))
+
+    def __len__(self):
+        return len(self.names)
+
+    def column(self, attr):
+        """Property of every indexed profile (loaded on first use)."""
+        if attr not in self._column_cache:
+            if self._columns is None:
+                raise ValueError(f"No dimension data for '{attr}' in this index")
+            self._column_cache[attr] = self._columns(attr)
+        return self._column_cache[attr]
+
+    def _token_matches(self, token, ids):
+        """Ids (sorted) among `ids` (None for all) whose key contains token."""
+        keys = self.keys
+        if len(token) >= 3:
+            postings = []
+            for j in range(len(token) - 2):
+                p = self._trigrams.get(token[j:j + 3])
+                if p is None:
+                    return np.empty(0, dtype=np.intp)
+                postings.append(p)
+            postings.sort(key=len)
+            hits = postings[0]
+            for p in postings[1:]:
+                hits = np.intersect1d(hits, p, assume_unique=True)
+                if not len(hits):
+                    return hits
+            if ids is not None:
+                hits = np.intersect1d(hits, ids, assume_unique=True)
+            candidates = hits
+        else:
+            candidates = np.arange(len(keys)) if ids is None else ids
+        count("search.verified", len(candidates))
+        return np.fromiter((i for i in candidates if token in keys[i]), dtype=np.intp)
+
+    @instrumented("search", "search")
+    def search(self, query="", section_type=None, limit=None, **bounds):
+        """
+        Profiles matching a query and filters.
+
+        Args:
+            query (str): Space-separated tokens, each matched anywhere in the name.
+            section_type (str or list): Section type(s), None for all.
+            limit (int): Return at most this many ids.
+            **bounds: attr=(low, high) property ranges (N/mm units), either end may be None,
+                e.g. d=(200, 400).
+
+        Returns:
+            ndarray: Matching ids; names starting with the first token come first, then
+                catalogue order.
+        """
+        raw = query.lower()
+        tokens = [t for t in (normalize(t) for t in raw.split()) if t]
+        filters = (section_type if isinstance(section_type, (str, type(None))) else tuple(section_type),
+                   tuple(sorted(bounds.items())))
+
+        ids = None
+        if self._last is not None and self._last[1] == filters and raw.startswith(self._last[0]):
+            ids = self._last[2]  # the previous matches already satisfy the filters
+        else:
+            mask = np.ones(len(self.names), dtype=bool)
+            if section_type is not None:
+                wanted = [section_type] if isinstance(section_type, str) else section_type
+                mask &= np.isin(self.type_codes, [self.types.index(t) for t in wanted if t in self.types])
+            for attr, (low, high) in bounds.items():
+                values = self.column(attr)
+                if low is not None:
+                    mask &= values >= low
+                if high is not None:
+                    mask &= values <= high
+            if section_type is not None or bounds:
+                ids = np.flatnonzero(mask)
+        for token in tokens:
+            ids = self._token_matches(token, ids)
+        if ids is None:
+            ids = np.arange(len(self.names))
+        self._last = (raw, filters, ids)
+
+        if tokens:
+            first = tokens[0]
+            prefix = np.fromiter((self.keys[i].startswith(first) for i in ids), dtype=bool, count=len(ids))
+            ids = np.concatenate([ids[prefix], ids[~prefix]])
+        return ids if limit is None else ids[:limit]
+
+    def search_names(self, query="", section_type=None, limit=None, **bounds):
+        """Names of the matches of search()."""
+        return [self.names[i] for i in self.search(query, section_type, limit, **bounds)]
+
+
+def catalogue_index(db):
+    """ProfileIndex of a catalogue, built once per catalogue version."""
+    key = db.version
+    if key not in _cache:
+        _cache[key] = ProfileIndex.from_catalogue(db)
+    return _cache[key]
+
+
+def clear_cache():
+    _cache.clear()
@@ -0,0 +1,141 @@
+import math
+
+import numpy as np
+
+from core.batch import combined_batch, profile_columns
+from core.classification import E_STEEL
+from core.instrumentation import instrumented, count
+from core.results import ResultTable, SecondOrderResult
+
+# Approximate second-order analysis by amplified first-order analysis (SNI 1729 /
+# AISC 360 Appendix 8). First-order forces are split into a no-translation part (nt)
+# and a lateral-translation part (lt):
+#
+#   Mr = B1 Mnt + B2 Mlt,  Pr = Pnt + B2 Plt
+#   B1 = Cm / (1 - Pr / Pe1) >= 1            per member, Pe1 = pi^2 EI* / (K1 L)^2 (A-8-3)
+#   B2 = 1 / (1 - P_story / Pe_story) >= 1   per storey (A-8-6), P_story = sum Pnt,
+#                                            Pe_story = sum Pe2 of the lateral system columns
+#
+# Pr in B1 is the first-order estimate Pnt + Plt (A-8.2.1). Storey sums are grouped
+# reductions (np.bincount over the storey index of each member), so any number of
+# members and storeys is handled in one pass. Amplification is unbounded (inf) once
+# the axial load reaches the elastic buckling load.
+
+
+def equivalent_moment_factor(M1, M2):
+    """
+    Cm for members without transverse loading between supports (A-8-4).
+
+    Args:
+        M1, M2 (float or array): Smaller and larger end moments; M1 / M2 is positive
+            in reverse curvature, negative in single curvature.
+    """
+    M1, M2 = np.asarray(M1, dtype=float), np.asarray(M2, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(M2 == 0, 1.0, 0.6 - 0.4 * M1 / M2)
+
+
+def _amplifier(numerator, P, Pe):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(P < Pe, np.maximum(numerator / (1 - P / Pe), 1.0), np.inf)
+
+
+def _amplified(B, M):
+    # An unbounded amplifier still leaves a zero force at zero
+    with np.errstate(invalid="ignore"):
+        return np.where(M == 0, 0.0, B * M)
+
+
+@instrumented("second_order", "storeys")
+def storey_amplifiers(storey, P, Pe2x, Pe2y, lateral=True):
+    """
+    B2 per storey.
+
+    Args:
+        storey (array): Storey label of each member (any sortable labels).
+        P (array): Gravity axial load of each member (N), summed into P_story.
+        Pe2x, Pe2y (array): Sway buckling loads of each member (N).
+        lateral (bool or array): Whether each member is part of the lateral system
+            (leaning columns add to P_story but not to Pe_story).
+
+    Returns:
+        tuple: (labels, index of each member's storey, dict of per-storey arrays
+            P_story, Pe_story_x, Pe_story_y, B2x, B2y).
+    """
+    labels, index = np.unique(np.asarray(storey), return_inverse=True)
+    n = len(index)
+    lateral = np.broadcast_to(np.asarray(lateral, dtype=float), (n,))
+    P_story = np.bincount(index, weights=np.broadcast_to(np.asarray(P, dtype=float), (n,)), minlength=len(labels))
+    Pe_x = np.bincount(index, weights=lateral * Pe2x, minlength=len(labels))
+    Pe_y = np.bincount(index, weights=lateral * Pe2y, minlength=len(labels))
+    count("second_order.storeys", len(labels))
+    return labels, index, {
+        "P_story": P_story, "Pe_story_x": Pe_x, "Pe_story_y": Pe_y,
+        "B2x": _amplifier(1.0, P_story, Pe_x), "B2y": _amplifier(1.0, P_story, Pe_y),
+    }
+
+
+@instrumented("second_order", "amplify")
+def second_order_batch(profiles, storey, Pnt, Plt, Mntx, Mltx, Mnty, Mlty, L,
+                       Cmx=1.0, Cmy=1.0, K1=1.0, K2=1.0, lateral=True, stiffness=1.0):
+    """
+    Amplified required strengths of many members.
+
+    Args:
+        profiles (SteelProfile or sequence of SteelProfile): See profile_columns.
+        storey (array): Storey label of each member.
+        Pnt, Plt (float or array): Axial loads, no-translation and lateral-translation (N, compression positive).
+        Mntx, Mltx, Mnty, Mlty (float or array): First-order moments (N-mm).
+        L (float or array): Member length (mm).
+        Cmx, Cmy (float or array): Equivalent moment factors (see equivalent_moment_factor;
+            1.0 with transverse loading).
+        K1, K2 (float or array): Effective length factors without / with sidesway.
+        lateral (bool or array): Member is part of the lateral force resisting system.
+        stiffness (float): EI* / EI (1.0 for the effective length method, 0.8 for direct analysis).
+
+    Returns:
+        ResultTable: Columns Pr, Mrx, Mry, B1x, B1y, B2x, B2y, Pe1x, Pe1y
+    """
+    n = len(storey)
+    props = profile_columns(profiles, ("Ix", "Iy"))
+    Pnt, Plt, Mntx, Mltx, Mnty, Mlty, L, Cmx, Cmy, K1, K2 = (
+        np.broadcast_to(np.asarray(x, dtype=float), (n,))
+        for x in (Pnt, Plt, Mntx, Mltx, Mnty, Mlty, L, Cmx, Cmy, K1, K2))
+    EIx = stiffness * E_STEEL * np.asarray(props["Ix"], dtype=float)
+    EIy = stiffness * E_STEEL * np.asarray(props["Iy"], dtype=float)
+
+    _, index, storeys = storey_amplifiers(
+        storey, Pnt, math.pi**2 * EIx / (K2 * L)**2, math.pi**2 * EIy / (K2 * L)**2, lateral)
+    B2x, B2y = storeys["B2x"][index], storeys["B2y"][index]
+
+    Pe1x = math.pi**2 * EIx / (K1 * L)**2
+    Pe1y = math.pi**2 * EIy / (K1 * L)**2
+    B1x = _amplifier(Cmx, Pnt + Plt, Pe1x)
+    B1y = _amplifier(Cmy, Pnt + Plt, Pe1y)
+    count("second_order.members", n)
+    return ResultTable(SecondOrderResult, {
+        # Sway axial forces grow with the larger of the storey amplifiers
+        "Pr": Pnt + _amplified(np.maximum(B2x, B2y), Plt),
+        "Mrx": _amplified(B1x, Mntx) + _amplified(B2x, Mltx),
+        "Mry": _amplified(B1y, Mnty) + _amplified(B2y, Mlty),
+        "B1x": B1x, "B1y": B1y, "B2x": B2x, "B2y": B2y, "Pe1x": Pe1x, "Pe1y": Pe1y,
+    })
+
+
+def second_order_combined(profiles, storey, Pnt, Plt, Mntx, Mltx, Mnty, Mlty, L, K, Cb, Fy, **options):
+    """
+    Amplify first-order forces and check the members for combined actions (H1-1).
+
+    Args:
+        K (float or array): Effective length factor of the compression capacity; also K2
+            unless given in options.
+        **options: Further arguments of second_order_batch (Cmx, Cmy, K1, K2, lateral, stiffness).
+
+    Returns:
+        tuple: (second-order ResultTable, combined ResultTable)
+    """
+    options.setdefault("K2", K)
+    amplified = second_order_batch(profiles, storey, Pnt, Plt, Mntx, Mltx, Mnty, Mlty, L, **options)
+    combined = combined_batch(profiles, amplified["Pr"], np.abs(amplified["Mrx"]), np.abs(amplified["Mry"]),
+                              L, K, Cb, Fy)
+    return amplified, combined
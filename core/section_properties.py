@@ -0,0 +1,124 @@
+import math
+import os
+import zipfile
+
+import numpy as np
+
+from core.instrumentation import instrumented
+
+# Derived section properties computed per shape family over whole catalogue columns.
+# Inputs are in mm / mm2 / mm4 / mm3 (already converted from catalogue units).
+#
+# I-shapes (WF, H-Beam): fillet radius recovered from the catalogue area,
+#   J by El Darwish & Johnston including the web-flange fillets (AISC Design Guide 9),
+#   Cw = tf * bf^3 * h0^2 / 24 (doubly symmetric I), rts^2 = sqrt(Iy * Cw) / Sx (F2-7).
+# Box HSS: thin-walled closed-section J with rounded corners (mean corner radius 1.5t),
+#   Cw = 0; rts is not defined (LTB does not apply to square HSS), stored as NaN.
+
+DERIVED = ("r", "h0", "J", "Cw", "rts")
+
+FAMILY_BY_TYPE = {"WF": "I", "H-Beam": "I", "HSS": "BOX"}
+
+# Bump when a formula changes so stale caches are recomputed
+ENGINE_VERSION = 1
+
+
+def i_shape_properties(d, bf, tw, tf, Ag, Iy, Sx):
+    """
+    Exact torsion/warping properties of rolled doubly symmetric I-shapes.
+
+    Returns:
+        dict: r (fillet radius), h0, J, Cw, rts as arrays.
+    """
+    d, bf, tw, tf, Ag, Iy, Sx = (np.asarray(x, dtype=float) for x in (d, bf, tw, tf, Ag, Iy, Sx))
+    plates = 2 * bf * tf + (d - 2 * tf) * tw
+    r = np.sqrt(np.maximum(Ag - plates, 0.0) / (4 - math.pi))
+
+    h0 = d - tf
+    J1 = bf * tf**3 * (1 / 3 - 0.21 * (tf / bf) * (1 - tf**4 / (12 * bf**4)))
+    J2 = (d - 2 * tf) * tw**3 / 3
+    t1 = np.minimum(tw, tf)
+    t2 = np.maximum(tw, tf)
+    alpha = (t1 / t2) * (0.15 + 0.10 * r / t1)
+    D = ((tf + r)**2 + tw * (r + tw / 4)) / (2 * r + tf)
+    J = 2 * J1 + J2 + 2 * alpha * D**4
+
+    Cw = tf * bf**3 * h0**2 / 24
+    rts = np.sqrt(np.sqrt(Iy * Cw) / Sx)
+    return {"r": r, "h0": h0, "J": J, "Cw": Cw, "rts": rts}
+
+
+def box_properties(H, B, t):
+    """
+    Torsion properties of rectangular/square hollow sections with rounded corners.
+
+    Returns:
+        dict: r (mean corner radius), h0, J, Cw, rts as arrays.
+    """
+    H, B, t = (np.asarray(x, dtype=float) for x in (H, B, t))
+    Rc = 1.5 * t
+    p = 2 * ((B - t) + (H - t)) - 2 * Rc * (4 - math.pi)
+    Ap = (B - t) * (H - t) - Rc**2 * (4 - math.pi)
+    K = 2 * Ap * t / p
+    J = t**3 * p / 3 + 2 * K * Ap
+    return {"r": Rc, "h0": H - t, "J": J, "Cw": np.zeros_like(J), "rts": np.full_like(J, np.nan)}
+
+
+@instrumented("derive", "section_properties")
+def compute_properties(section_type, columns):
+    """
+    Derived properties for every section of one type.
+
+    Args:
+        section_type (str): Catalogue type ("WF", "H-Beam", "HSS", ...).
+        columns (dict): Arrays d, bf, tw, tf, Ag, Iy, Sx in mm units.
+
+    Returns:
+        dict: Name in DERIVED -> array.
+    """
+    family = FAMILY_BY_TYPE.get(section_type, "I")
+    if family == "BOX":
+        return box_properties(columns["d"], columns["bf"], columns["tw"])
+    return i_shape_properties(*(columns[k] for k in ("d", "bf", "tw", "tf", "Ag", "Iy", "Sx")))
+
+
+def cache_path(csv_path):
+    """Cache file stored next to the catalogue."""
+    return csv_path + ".props.npz"
+
+
+def catalogue_properties(csv_path, version, section_type, columns):
+    """
+    Derived properties for one section type, read from the cache next to the catalogue
+    when it matches the catalogue version, otherwise computed and written back.
+    """
+    path = cache_path(csv_path)
+    tag = f"{version}:{ENGINE_VERSION}"
+    cached = {}
+    if os.path.exists(path):
+        try:
+            with np.load(path) as data:
+                cached = {k: data[k] for k in data.files}
+        except (OSError, ValueError, EOFError, KeyError, zipfile.BadZipFile):
+            cached = {}  # Truncated or corrupt cache: treat as a miss and rewrite it
+        if cached.get("version") is None or str(cached["version"]) != tag:
+            cached = {}
+
+    keys = [f"{section_type}__{name}" for name in DERIVED]
+    if all(k in cached for k in keys):
+        return {name: cached[k] for name, k in zip(DERIVED, keys)}
+
+    props = compute_properties(section_type, columns)
+    cached.update({k: props[name] for name, k in zip(DERIVED, keys)})
+    cached["version"] = np.array(tag)
+    # Write to a temporary file and rename, so readers never see a partial cache
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            np.savez(f, **cached)
+        os.replace(tmp, path)
+    except OSError:
+        # Read-only data directory: work without the cache
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return props
@@ -0,0 +1,311 @@
+import asyncio
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from core import batch
+from core.checks import Member, evaluate_members
+from core.profiles import ProfileDatabase
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+# Single-check requests arriving within this window are evaluated as one vectorized batch
+COALESCE_WINDOW = 0.002  # s
+MAX_BATCH = 4096
+# Batches at least this large run in the process pool instead of on the event loop
+POOL_THRESHOLD = 2000
+KEEPALIVE_TIMEOUT = 30.0  # s
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+# Served checks: the registry shared with core.sweep
+CHECKS = batch.CHECKS
+
+# Process-local catalogue (main process and each pool worker)
+_db = None
+
+
+def _init_worker(csv_path):
+    global _db
+    _db = ProfileDatabase(csv_path)
+
+
+class RequestError(Exception):
+    """Invalid request; reported to the client as 400."""
+
+
+# Parameters passed to the kernels as text; every other parameter is a number
+_TEXT_PARAMS = ("profile", "weld_type")
+
+
+def _value(name, value):
+    if name in _TEXT_PARAMS:
+        if not isinstance(value, str):
+            raise RequestError(f"Parameter '{name}' must be a string")
+        return value
+    if isinstance(value, bool):
+        raise RequestError(f"Parameter '{name}' must be a number")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise RequestError(f"Parameter '{name}' must be a number, got {value!r}") from None
+
+
+def _json_safe(obj):
+    """Copy of a payload with inf/NaN replaced by None (JSON has no non-finite numbers)."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _json_safe(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_safe(v) for v in obj]
+    return obj
+
+
+def normalize(check, params, db):
+    """
+    Validate one request's parameters and fill gaps (defaults, and section properties
+    when a profile name is given, see batch.PROFILE_INPUTS). Numeric parameters are
+    converted to float here, so one bad request cannot fail a whole coalesced batch.
+
+    Returns:
+        dict: Parameters in kernel order.
+    """
+    if check not in CHECKS:
+        raise RequestError(f"Unknown check '{check}'")
+    if not isinstance(params, dict):
+        raise RequestError("Request body must be a JSON object")
+    names, defaults = batch.kernel_inputs(check)
+    params = dict(params)
+
+    if "profile" in params:
+        profile = db.get_profile(params["profile"])
+        if profile is None:
+            raise RequestError(f"Unknown profile '{params['profile']}'")
+        for name, value in batch.profile_inputs(check, profile).items():
+            params.setdefault(name, value)
+
+    out = {}
+    for name in names:
+        if name in params:
+            out[name] = _value(name, params[name])
+        elif name in defaults:
+            out[name] = defaults[name]
+        else:
+            raise RequestError(f"Missing parameter '{name}' for {check}")
+    return out
+
+
+def run_batch(check, rows):
+    """
+    Evaluate many normalized requests of one check type with the batch kernel.
+    Module-level so it can run in a pool worker.
+
+    Returns:
+        list of dict: One result per row.
+    """
+    names, _ = batch.kernel_inputs(check)
+    kernel = CHECKS[check][1]
+    args = []
+    for name in names:
+        if name == "profile":
+            args.append([_db.get_profile(r["profile"]) for r in rows])
+        else:
+            args.append(np.array([r[name] for r in rows]))
+    table = kernel(*args)
+    return table.to_dicts()
+
+
+def run_members(members):
+    """Evaluate Member dicts through core.checks (pool-safe)."""
+    members = [Member(**m) for m in members]
+    return [r.to_dict() for r in evaluate_members(members, _db)]
+
+
+class _Coalescer:
+    """Collects single-check requests for a short window and evaluates them together."""
+    def __init__(self, service, check):
+        self.service = service
+        self.check = check
+        self.pending = []
+        self.handle = None
+
+    def submit(self, row):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((row, future))
+        if len(self.pending) >= self.service.max_batch:
+            self.flush()
+        elif self.handle is None:
+            self.handle = loop.call_later(self.service.window, self.flush)
+        return future
+
+    def flush(self):
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        pending, self.pending = self.pending, []
+        if pending:
+            self.service._spawn(self._evaluate(pending))
+
+    async def _evaluate(self, pending):
+        try:
+            results = await self.service.evaluate(self.check, [row for row, _ in pending])
+        except Exception as e:
+            if len(pending) == 1:
+                if not pending[0][1].done():
+                    pending[0][1].set_exception(e)
+                return
+            # Isolate the failing request(s): the others still get their results
+            for item in pending:
+                await self._evaluate([item])
+            return
+        for (_, future), res in zip(pending, results):
+            if not future.done():
+                future.set_result(res)
+
+
+class CalculationService:
+    """
+    Local HTTP/JSON calculation service.
+
+    Endpoints:
+        GET  /health                -> status and catalogue version
+        GET  /profiles              -> profile names
+        POST /check/<name>          -> one check; body = parameters (coalesced into batches)
+        POST /batch/<name>          -> list of parameter objects -> list of results
+        POST /members               -> list of Member objects -> list of member results
+    """
+    def __init__(self, csv_path=DEFAULT_DB_PATH, workers=None, window=COALESCE_WINDOW,
+                 max_batch=MAX_BATCH, pool_threshold=POOL_THRESHOLD):
+        _init_worker(csv_path)
+        self.db = _db
+        self.window = window
+        self.max_batch = max_batch
+        self.pool_threshold = pool_threshold
+        self.pool = None
+        if workers != 0:
+            self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(csv_path,))
+        self.server = None
+        self._coalescers = {check: _Coalescer(self, check) for check in CHECKS}
+        self._tasks = set()
+
+    def _spawn(self, coro):
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _offload(self, func, *args):
+        if self.pool is None:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self.pool, func, *args)
+
+    async def evaluate(self, check, rows):
+        if len(rows) >= self.pool_threshold:
+            return await self._offload(run_batch, check, rows)
+        return run_batch(check, rows)
+
+    async def start(self, host="127.0.0.1", port=8765):
+        self.server = await asyncio.start_server(self._handle, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    def close(self):
+        if self.server is not None:
+            self.server.close()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+    async def dispatch(self, method, path, body):
+        """
+        Route one request.
+
+        Returns:
+            tuple: (HTTP status, JSON-serializable payload)
+        """
+        parts = [p for p in urlsplit(path).path.split("/") if p]
+        try:
+            if method == "GET" and parts == ["health"]:
+                return 200, {"status": "ok", "catalogue_version": self.db.version}
+            if method == "GET" and parts == ["profiles"]:
+                return 200, self.db.get_all_names()
+            if len(parts) == 2 and parts[0] in ("check", "batch") and parts[1] in CHECKS or parts == ["members"]:
+                if method != "POST":
+                    return 405, {"error": "Use POST"}
+                data = json.loads(body or b"null")
+                if parts[0] == "check":
+                    row = normalize(parts[1], data, self.db)
+                    return 200, await self._coalescers[parts[1]].submit(row)
+                if not isinstance(data, list):
+                    raise RequestError("Request body must be a JSON list")
+                if not data:
+                    return 200, []
+                if parts[0] == "batch":
+                    rows = [normalize(parts[1], d, self.db) for d in data]
+                    return 200, await self.evaluate(parts[1], rows)
+                if len(data) >= self.pool_threshold:
+                    return 200, await self._offload(run_members, data)
+                return 200, run_members(data)
+            return 404, {"error": f"No route for {method} {path}"}
+        except (RequestError, ValueError, TypeError, KeyError) as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": str(e)}
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await asyncio.wait_for(reader.readline(), KEEPALIVE_TIMEOUT)
+                if not request_line:
+                    break
+                method, path, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+
+                status, payload = await self.dispatch(method, path, body)
+                data = json.dumps(_json_safe(payload), allow_nan=False).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+def run(host="127.0.0.1", port=8765, csv_path=DEFAULT_DB_PATH, workers=None):
+    """Run the service until interrupted."""
+    async def main():
+        service = CalculationService(csv_path, workers=workers)
+        bound = await service.start(host, port)
+        print(f"Steel calculation service on http://{host}:{bound}")
+        try:
+            await service.serve_forever()
+        finally:
+            service.close()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
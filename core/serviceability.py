@@ -0,0 +1,182 @@
+import math
+
+import numpy as np
+
+from core.batch import flexure_batch
+from core.classification import E_STEEL, section_key
+from core.instrumentation import instrumented, count
+from core.results import ResultTable, ServiceabilityResult
+
+# Serviceability of beams: deflection against span / limit and the fundamental natural
+# frequency, for standard support conditions under a uniform load w (N/mm) and a point
+# load P (N) at midspan (at the tip for cantilevers). Deflections of the two loads are
+# superposed, which is exact or slightly conservative where their maxima do not coincide.
+#
+# Natural frequency of a uniform beam carrying a mass per length m = w / g:
+#     f1 = K sqrt(E I / (m L^4)),  K = (beta L)^2 / (2 pi)
+#
+# EI and self-weight of each section come from a table computed once per section, so
+# checks over many members and load cases reduce to broadcasting arithmetic.
+
+G = 9810.0  # mm/s2
+
+SUPPORTS = {
+    # support: (delta per w L^4/EI, delta per P L^3/EI, M per w L^2, M per P L, frequency constant K)
+    "simple": (5 / 384, 1 / 48, 1 / 8, 1 / 4, math.pi / 2),
+    "cantilever": (1 / 8, 1 / 3, 1 / 2, 1.0, 1.875104**2 / (2 * math.pi)),
+    "fixed": (1 / 384, 1 / 192, 1 / 12, 1 / 8, 4.730041**2 / (2 * math.pi)),
+    "propped": (1 / 185, 1 / (48 * math.sqrt(5)), 1 / 8, 3 / 16, 3.926602**2 / (2 * math.pi)),
+}
+_SUPPORT_NAMES = tuple(SUPPORTS)
+_COEFFICIENTS = np.array(list(SUPPORTS.values()))
+
+_cache = {}  # section key -> (Ix, self-weight)
+
+
+def _f(x):
+    return np.asarray(x, dtype=float)
+
+
+def support_coefficients(support):
+    """
+    Coefficients of one or many support conditions.
+
+    Returns:
+        ndarray: (..., 5) rows of SUPPORTS.
+    """
+    if isinstance(support, str):
+        return _COEFFICIENTS[_SUPPORT_NAMES.index(support)]
+    try:
+        index = np.array([_SUPPORT_NAMES.index(s) for s in support], dtype=np.intp)
+    except ValueError:
+        raise ValueError(f"Unknown support condition in {sorted(set(support))}; expected one of {_SUPPORT_NAMES}") from None
+    return _COEFFICIENTS[index]
+
+
+@instrumented("serviceability", "stiffness_table")
+def stiffness_table(profiles, E=E_STEEL):
+    """
+    EI (N-mm2) and self-weight (N/mm) of every profile; sections not seen before are
+    added to the module table.
+
+    Returns:
+        tuple: (EI, self_weight) arrays, or floats for a single profile.
+    """
+    single = hasattr(profiles, "name")
+    profiles = [profiles] if single else profiles
+    keys = [section_key(p) for p in profiles]
+    new = 0
+    for key, p in zip(keys, profiles):
+        if key not in _cache:
+            _cache[key] = (p.Ix, p.weight * G / 1e6)
+            new += 1
+    count("serviceability.sections", new)
+    Ix, weight = np.array([_cache[k] for k in keys], dtype=float).reshape(-1, 2).T
+    EI, w_self = E * Ix, weight
+    return (float(EI[0]), float(w_self[0])) if single else (EI, w_self)
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def _deflection_columns(EI, w_self, c, L, w, P, limit, w_mass, f_min, self_weight):
+    L, w, P = _f(L), _f(w), _f(P)
+    w_total = w + w_self if self_weight else w
+    delta = (c[..., 0] * w_total * L**4 + c[..., 1] * P * L**3) / EI
+    delta_limit = L / _f(limit)
+    mass = (w_total if w_mass is None else _f(w_mass) + (w_self if self_weight else 0.0)) / G
+    with np.errstate(divide="ignore"):
+        f1 = c[..., 4] * np.sqrt(EI / (mass * L**4))
+    deflection_ratio = delta / delta_limit
+    frequency_ratio = _f(f_min) / f1
+    ratio = np.maximum(deflection_ratio, frequency_ratio)
+    return {
+        "ratio": ratio,
+        "delta": delta,
+        "delta_limit": delta_limit,
+        "deflection_ratio": deflection_ratio,
+        "f1": f1,
+        "frequency_ratio": frequency_ratio,
+        "status": np.where(ratio <= 1.0, "OK", "NOT OK"),
+    }
+
+
+@instrumented("batch", "serviceability")
+def serviceability_batch(profiles, L, w=0.0, P=0.0, support="simple", limit=360.0, w_mass=None, f_min=0.0,
+                         self_weight=True):
+    """
+    Deflection and natural frequency of beams, vectorized over members and load cases.
+
+    Args:
+        profiles (SteelProfile or sequence of SteelProfile): Beams.
+        L (float or array): Span (mm).
+        w (float or array): Service uniform load (N/mm).
+        P (float or array): Service point load (N), at midspan or cantilever tip.
+        support (str or sequence of str): Support condition, see SUPPORTS.
+        limit (float or array): Deflection limit as span / limit (e.g. 240, 360).
+        w_mass (float or array): Load whose mass vibrates (N/mm), default w.
+        f_min (float or array): Required natural frequency (Hz), 0 to skip.
+        self_weight (bool): Add the beam's own weight to w and w_mass.
+
+    Returns:
+        ResultTable: Columns ratio, delta, delta_limit, deflection_ratio, f1, frequency_ratio, status
+    """
+    EI, w_self = stiffness_table(profiles)
+    return ResultTable(ServiceabilityResult,
+                       _deflection_columns(EI, w_self, support_coefficients(support), L, w, P, limit,
+                                           w_mass, f_min, self_weight))
+
+
+def calculate_serviceability(profile, L, w=0.0, P=0.0, support="simple", limit=360.0, w_mass=None, f_min=0.0,
+                             self_weight=True):
+    """
+    Scalar form of serviceability_batch.
+
+    Returns:
+        ServiceabilityResult
+    """
+    return serviceability_batch(profile, L, w, P, support, limit, w_mass, f_min, self_weight)[0]
+
+
+@instrumented("serviceability", "lightest_sections")
+def lightest_sections(candidates, L, w, wu, P=0.0, Pu=0.0, support="simple", limit=360.0, Lb=None, Cb=1.0,
+                      Fy=240.0, w_mass=None, f_min=0.0, dead_factor=1.2):
+    """
+    Lightest candidate section of every member satisfying strength and serviceability,
+    evaluated as one (members x candidates) pass.
+
+    Args:
+        candidates (sequence of SteelProfile): Sections to choose from.
+        L (float or array): Span per member (mm).
+        w, P: Service loads (N/mm, N), see serviceability_batch.
+        wu, Pu: Factored loads (N/mm, N) for the flexural strength check.
+        Lb (float or array): Unbraced length (default: the span).
+        dead_factor (float): Load factor on the beam's own weight in the strength check.
+
+    Returns:
+        tuple: (list of SteelProfile or None per member, (members, candidates) governing ratio).
+    """
+    order = np.argsort([p.weight for p in candidates], kind="stable")
+    candidates = [candidates[i] for i in order]
+    n_members = max(np.size(x) for x in (L, w, wu, P, Pu, Lb if Lb is not None else 0.0, Cb, Fy, limit))
+    if not isinstance(support, str):
+        n_members = max(n_members, len(support))
+    col = lambda x: np.broadcast_to(_f(x), (n_members,))[:, None]
+
+    EI, w_self = stiffness_table(candidates)
+    c = np.broadcast_to(support_coefficients(support), (n_members, _COEFFICIENTS.shape[1]))[:, None, :]
+    service = _deflection_columns(EI[None, :], w_self[None, :], c, col(L), col(w), col(P), col(limit),
+                                  None if w_mass is None else col(w_mass), col(f_min), True)
+
+    Mu = c[..., 2] * (col(wu) + dead_factor * w_self[None, :]) * col(L)**2 + c[..., 3] * col(Pu) * col(L)
+    rows = np.repeat(np.arange(n_members), len(candidates))
+    phi_Mn = flexure_batch([candidates[j] for j in np.tile(np.arange(len(candidates)), n_members)],
+                           col(L if Lb is None else Lb)[rows, 0], col(Cb)[rows, 0], col(Fy)[rows, 0])["phi_Mn"]
+    ratio = np.maximum(service["ratio"], Mu / phi_Mn.reshape(n_members, -1))
+
+    ok = ratio <= 1.0
+    first = np.argmax(ok, axis=1)
+    count("serviceability.selections", n_members)
+    choice = [candidates[j] if ok[i, j] else None for i, j in enumerate(first)]
+    return choice, ratio[:, np.argsort(order)]
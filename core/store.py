@@ -0,0 +1,162 @@
+import json
+import sqlite3
+from datetime import datetime
+from itertools import islice
+
+from core.instrumentation import instrumented
+
+# Rows per executemany() call when bulk inserting
+INSERT_CHUNK = 20000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created TEXT NOT NULL,
+    label TEXT,
+    catalogue_version TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    member_id TEXT NOT NULL,
+    check_type TEXT NOT NULL,
+    profile TEXT,
+    level TEXT,
+    status TEXT NOT NULL,
+    ratio REAL,
+    payload TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_member ON results(member_id, run_id);
+CREATE INDEX IF NOT EXISTS idx_results_check ON results(run_id, check_type);
+CREATE INDEX IF NOT EXISTS idx_results_status ON results(run_id, status, level);
+CREATE INDEX IF NOT EXISTS idx_results_ratio ON results(run_id, ratio DESC);
+"""
+
+_COLUMNS = ("run_id", "member_id", "check_type", "profile", "level", "status", "ratio", "payload")
+
+
+class ResultStore:
+    """
+    SQLite-backed store of member check results, so results survive the session
+    and can be queried (worst ratios, failing members per level, history of a
+    member) without re-running calculations.
+    """
+    def __init__(self, db_path):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def start_run(self, label=None, catalogue_version=None):
+        """
+        Register a new run.
+
+        Returns:
+            int: run_id for add_results().
+        """
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO runs (created, label, catalogue_version) VALUES (?, ?, ?)",
+                (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), label, catalogue_version)
+            )
+        return cur.lastrowid
+
+    def latest_run_id(self):
+        row = self.conn.execute("SELECT MAX(run_id) FROM runs").fetchone()
+        return row[0]
+
+    @instrumented("store", "insert")
+    def add_results(self, run_id, results, members, store_payload=True):
+        """
+        Bulk insert results in one transaction, in chunks of INSERT_CHUNK rows.
+
+        Args:
+            run_id (int): Run from start_run().
+            results (iterable of MemberResult): Results, e.g. from evaluate_members().
+            members (iterable of Member): Matching members (same order), for profile and level.
+            store_payload (bool): Also store the full result as JSON (slower, larger file).
+
+        Returns:
+            int: Number of rows written.
+        """
+        def rows():
+            for res, m in zip(results, members):
+                payload = json.dumps(res.result.to_dict()) if store_payload else None
+                yield (run_id, res.member_id, res.check, m.profile, m.level, res.status, res.ratio, payload)
+
+        sql = f"INSERT INTO results ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+        written = 0
+        it = rows()
+        with self.conn:
+            while True:
+                chunk = list(islice(it, INSERT_CHUNK))
+                if not chunk:
+                    break
+                self.conn.executemany(sql, chunk)
+                written += len(chunk)
+        return written
+
+    def query(self, run_id=None, member_id=None, check=None, status=None, level=None,
+              min_ratio=None, order_by_ratio=False, limit=None):
+        """
+        Query stored results. Unset filters are ignored; run_id defaults to the latest run.
+
+        Returns:
+            list of dict: Rows with payload decoded to a dict (or None).
+        """
+        if run_id is None and member_id is None:
+            run_id = self.latest_run_id()
+        clauses, params = [], []
+        for column, value in (("run_id", run_id), ("member_id", member_id), ("check_type", check),
+                              ("status", status), ("level", level)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if min_ratio is not None:
+            clauses.append("ratio >= ?")
+            params.append(min_ratio)
+
+        sql = "SELECT * FROM results"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if order_by_ratio:
+            sql += " ORDER BY ratio DESC"
+        elif member_id is not None:
+            sql += " ORDER BY run_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        out = []
+        for row in self.conn.execute(sql, params):
+            rec = dict(row)
+            rec["payload"] = json.loads(rec["payload"]) if rec["payload"] else None
+            out.append(rec)
+        return out
+
+    def top_ratios(self, n=100, run_id=None, check=None):
+        """The n highest utilisation ratios of a run (latest by default)."""
+        return self.query(run_id=run_id, check=check, order_by_ratio=True, limit=n)
+
+    def failing(self, level=None, run_id=None):
+        """All NOT SAFE members of a run, optionally on one level."""
+        return self.query(run_id=run_id, status="NOT SAFE", level=level, order_by_ratio=True)
+
+    def status_counts(self, run_id=None):
+        """
+        Returns:
+            dict: status -> number of members in the run.
+        """
+        if run_id is None:
+            run_id = self.latest_run_id()
+        rows = self.conn.execute("SELECT status, COUNT(*) FROM results WHERE run_id = ? GROUP BY status", (run_id,))
+        return {status: n for status, n in rows}
@@ -0,0 +1,172 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from core import batch
+from core.instrumentation import instrumented, count
+
+# Parametric sweeps: evaluate a check over the Cartesian product of input ranges
+# through its batch kernel. The grid is never materialized; flat grid indices are
+# unravelled chunk by chunk, so memory is bounded by the chunk and the output arrays.
+
+CHUNK_SIZE = 65536
+
+# Convenience inputs expanding to several kernel arguments
+ALIASES = {
+    "compression": {"K": ("Kx", "Ky"), "L": ("Lx", "Ly")},
+    "flexure": {"L": ("Lb",)},
+}
+
+@dataclass
+class SweepResult:
+    """
+    Outputs of a sweep as N-d arrays, one axis per swept input.
+
+    Attributes:
+        check (str): Check name.
+        dims (tuple): Swept input names, in axis order.
+        coords (dict): Input name -> axis values (profile axes hold profile names).
+        outputs (dict): Output column -> ndarray of shape `shape`.
+        fixed (dict): Inputs held constant.
+    """
+    check: str
+    dims: tuple
+    coords: dict
+    outputs: dict
+    fixed: dict
+
+    @property
+    def shape(self):
+        return tuple(len(self.coords[d]) for d in self.dims)
+
+    def __getitem__(self, column):
+        return self.outputs[column]
+
+    def slice2d(self, column, x, y, **at):
+        """
+        2-D slice of one output for plotting.
+
+        Args:
+            column (str): Output column, e.g. "ratio".
+            x (str), y (str): Swept inputs for the horizontal and vertical axes.
+            **at: Value for each other swept input (nearest grid value); defaults to the first.
+
+        Returns:
+            tuple: (x values, y values, array of shape (len(y), len(x))).
+        """
+        index = []
+        for d in self.dims:
+            if d in (x, y):
+                index.append(slice(None))
+            elif d in at:
+                values = self.coords[d]
+                if values.dtype.kind in "US":
+                    index.append(int(np.flatnonzero(values == at[d])[0]))
+                else:
+                    index.append(int(np.argmin(np.abs(values - at[d]))))
+            else:
+                index.append(0)
+        data = self.outputs[column][tuple(index)]
+        remaining = [d for d in self.dims if d in (x, y)]
+        if remaining == [x, y]:
+            data = data.T
+        return self.coords[x], self.coords[y], data
+
+
+@instrumented("sweep", "run")
+def sweep(check, ranges, fixed=None, outputs=None, chunk_size=CHUNK_SIZE):
+    """
+    Evaluate a check over the Cartesian product of input ranges.
+
+    Args:
+        check (str): One of batch.CHECKS.
+        ranges (dict): Swept input -> sequence of values, in axis order, e.g.
+            {"Fy": np.linspace(240, 410, 18), "L": [3000, 4000, 5000]}. A "profile"
+            axis takes SteelProfile objects.
+        fixed (dict): Inputs held constant (the rest of the kernel arguments, or
+            aliases such as K and L; a "profile" fills the section properties).
+        outputs (list): Result columns to keep (default: every numeric column).
+        chunk_size (int): Grid points evaluated per kernel call.
+
+    Returns:
+        SweepResult
+    """
+    if check not in batch.CHECKS:
+        raise ValueError(f"Unknown check '{check}'")
+    if not ranges:
+        raise ValueError("At least one input range is required")
+    fixed = dict(fixed or {})
+    names, defaults = batch.kernel_inputs(check)
+    aliases = ALIASES.get(check, {})
+    profile_inputs = batch.PROFILE_INPUTS.get(check, {})
+
+    for d in list(ranges) + list(fixed):
+        if d not in names and d not in aliases and d != "profile":
+            raise ValueError(f"'{d}' is not an input of {check}")
+
+    dims = tuple(ranges)
+    axes = {}
+    for d in dims:
+        axes[d] = list(ranges[d]) if d == "profile" else np.asarray(ranges[d], dtype=float)
+    shape = tuple(len(axes[d]) for d in dims)
+    total = int(np.prod(shape))
+
+    # Where each kernel argument comes from: ("axis", dim, attr) or ("value", value)
+    sources = {}
+    for name in names:
+        dim = next((d for d in dims if d == name or name in aliases.get(d, ())), None)
+        if dim is not None:
+            sources[name] = ("axis", dim, None)
+        elif name in fixed:
+            sources[name] = ("value", fixed[name])
+        elif any(name in targets and alias in fixed for alias, targets in aliases.items()):
+            alias = next(a for a, t in aliases.items() if name in t and a in fixed)
+            sources[name] = ("value", fixed[alias])
+        elif name in profile_inputs and ("profile" in dims or "profile" in fixed):
+            attr = profile_inputs[name]
+            if "profile" in dims:
+                sources[name] = ("axis", "profile", attr)
+            else:
+                sources[name] = ("value", getattr(fixed["profile"], attr))
+        elif name in defaults:
+            sources[name] = ("value", defaults[name])
+        else:
+            raise ValueError(f"Missing input '{name}' for {check}")
+
+    # Per-axis attribute arrays of a profile axis, e.g. Ag of every swept profile
+    attr_values = {}
+    for src in sources.values():
+        if src[0] == "axis" and src[1] == "profile" and src[2] is not None:
+            attr_values[src[2]] = np.array([getattr(p, src[2]) for p in axes["profile"]])
+
+    out = None
+    for start in range(0, total, chunk_size):
+        flat = np.arange(start, min(start + chunk_size, total))
+        index = dict(zip(dims, np.unravel_index(flat, shape)))
+        args = []
+        for name in names:
+            src = sources[name]
+            if src[0] == "value":
+                args.append(src[1])
+            elif src[1] == "profile":
+                if src[2] is None:
+                    profiles = axes["profile"]
+                    args.append([profiles[i] for i in index["profile"]])
+                else:
+                    args.append(attr_values[src[2]][index["profile"]])
+            else:
+                args.append(axes[src[1]][index[src[1]]])
+        table = batch.CHECKS[check][1](*args)
+
+        if out is None:
+            columns = outputs or [c for c in table.columns if table[c].dtype.kind in "fiub"]
+            # Text columns (status, eq) are stored as objects: later chunks may hold longer strings
+            out = {c: np.empty(total, dtype=object if table[c].dtype.kind == "U" else table[c].dtype)
+                   for c in columns}
+        for c in out:
+            out[c][flat] = np.broadcast_to(table[c], flat.shape)
+    count("sweep.points", total)
+
+    coords = {d: (np.array([p.name for p in axes[d]]) if d == "profile" else axes[d]) for d in dims}
+    fixed_out = {k: (v.name if k == "profile" else v) for k, v in fixed.items()}
+    return SweepResult(check, dims, coords, {c: v.reshape(shape) for c, v in out.items()}, fixed_out)
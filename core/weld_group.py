@@ -0,0 +1,272 @@
+import functools
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.bolt_group import CoefficientCache, load_line, solve_ic, elastic_ic
+from core.instrumentation import instrumented, count
+from core.results import ResultTable, WeldGroupResult
+
+# Eccentrically loaded fillet weld groups (SNI 1729 / AISC 360 J2.4, AISC Manual Part 8).
+#
+# Weld lines are cut into short elements; a group is then a set of arrays (element
+# midpoints, lengths, axis directions) and every method is array arithmetic over them.
+#
+# Elastic method: direct shear plus torsion about the centroid, strength 0.6 Fexx per
+# unit throat area with no directional increase.
+#
+# IC method (J2.4b): the element force acts perpendicular to its radius from the IC,
+#     Rn_i = 0.60 Fexx (1 + 0.5 sin^1.5 theta) [p (1.9 - 0.9 p)]^0.3 Aw_i,
+#     p = delta_i / delta_m,  delta_m = 0.209 (theta + 2)^-0.32 w,
+#     delta_u = 1.087 (theta + 6)^-0.65 w <= 0.17 w,
+# theta (degrees) being the angle between the force and the element axis. The element
+# with the smallest delta_u / r reaches its limit first; the others deform in proportion
+# to their radius. Deformations scale with the leg size w, so the coefficient
+# C = P / (0.60 Fexx te) (a length, mm) only depends on the shape and the load.
+# The IC is found with the batched Newton iteration of core.bolt_group.
+#
+# Load geometry as for bolt groups: angle from vertical, e from the weld group centroid.
+
+ELEMENTS_PER_SEGMENT = 20
+
+_cache = CoefficientCache()  # (group, e, angle) -> (C, C_elastic), bounded LRU
+
+
+@dataclass(frozen=True)
+class WeldGroup:
+    """
+    Straight weld lines ((x1, y1), (x2, y2)) in mm, any origin.
+    """
+    segments: tuple
+
+    def __post_init__(self):
+        # Tuples keep the group hashable for the coefficient cache
+        object.__setattr__(self, "segments", tuple(
+            ((float(a[0]), float(a[1])), (float(b[0]), float(b[1]))) for a, b in self.segments))
+
+    @classmethod
+    def line(cls, d):
+        """Single vertical line of length d."""
+        return cls([((0, 0), (0, d))])
+
+    @classmethod
+    def parallel(cls, b, d):
+        """Two vertical lines of length d, b apart."""
+        return cls([((0, 0), (0, d)), ((b, 0), (b, d))])
+
+    @classmethod
+    def c_shape(cls, b, d):
+        """Vertical line of length d with horizontal returns of length b at both ends (open to +x)."""
+        return cls([((0, 0), (0, d)), ((0, 0), (b, 0)), ((0, d), (b, d))])
+
+    @classmethod
+    def box(cls, b, d):
+        """All-around weld of a b x d rectangle."""
+        return cls([((0, 0), (b, 0)), ((b, 0), (b, d)), ((b, d), (0, d)), ((0, d), (0, 0))])
+
+    @property
+    def length(self):
+        return float(sum(np.hypot(b[0] - a[0], b[1] - a[1]) for a, b in self.segments))
+
+
+@functools.lru_cache(maxsize=1024)
+def discretize(group, n=ELEMENTS_PER_SEGMENT):
+    """
+    Elements of a weld group, relative to its centroid; memoized per group.
+
+    Returns:
+        tuple: (midpoints (k, 2), lengths (k,), unit axis directions (k, 2)).
+    """
+    seg = np.array(group.segments)                     # (s, 2, 2)
+    start, vec = seg[:, 0], seg[:, 1] - seg[:, 0]
+    frac = (np.arange(n) + 0.5) / n
+    mid = (start[:, None, :] + frac[None, :, None] * vec[:, None, :]).reshape(-1, 2)
+    seg_len = np.hypot(vec[:, 0], vec[:, 1])
+    lengths = np.repeat(seg_len / n, n)
+    axis = np.repeat(vec / seg_len[:, None], n, axis=0)
+    mid = mid - (lengths[:, None] * mid).sum(axis=0) / lengths.sum()
+    return mid, lengths, axis
+
+
+def polar_moment(group):
+    """Polar moment of inertia of the weld lines about their centroid (mm3, unit throat)."""
+    mid, lengths, _ = discretize(group)
+    return float(np.sum(lengths * np.sum(mid**2, axis=1) + lengths**3 / 12))
+
+
+def elastic_coefficient(group, e, angle=0.0):
+    """
+    Elastic-method coefficient C (mm): load per unit 0.6 Fexx te at which the most
+    stressed point of the weld reaches its strength.
+    """
+    mid, lengths, _ = discretize(group)
+    u, A = load_line(e, angle)
+    M = A[0] * u[1] - A[1] * u[0]  # moment of a unit load about the centroid
+    force = u / lengths.sum() + M / polar_moment(group) * np.stack([-mid[:, 1], mid[:, 0]], axis=1)
+    return 1.0 / np.max(np.hypot(force[:, 0], force[:, 1]))
+
+
+def _deformation_limits(theta):
+    """delta_u and delta_m per unit leg size for load angles theta (degrees)."""
+    delta_u = np.minimum(1.087 * (theta + 6) ** -0.65, 0.17)
+    delta_m = 0.209 * (theta + 2) ** -0.32
+    return delta_u, delta_m
+
+
+def _element_strength(theta, p):
+    """Strength per unit length and unit 0.6 Fexx te of elements at angle theta and deformation ratio p."""
+    return (1 + 0.5 * np.sin(np.radians(theta)) ** 1.5) * np.maximum(p * (1.9 - 0.9 * p), 0.0) ** 0.3
+
+
+def _residual(c, mid, lengths, axis, u, A):
+    """
+    Force imbalance and load for trial ICs (unit 0.6 Fexx te).
+
+    Args:
+        c (ndarray): (m, 2) trial IC locations.
+        mid, lengths, axis (ndarray): (m, k, 2), (m, k), (m, k, 2) weld elements.
+        u, A (ndarray): (m, 2) load direction and a point on its line.
+
+    Returns:
+        tuple: (residual (m, 2), P (m,)).
+    """
+    r = mid - c[:, None, :]
+    d = np.hypot(r[..., 0], r[..., 1])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Element force direction is perpendicular to the radius; theta is its angle to the weld axis
+        cos = np.abs(axis[..., 0] * -r[..., 1] + axis[..., 1] * r[..., 0]) / d
+        theta = np.degrees(np.arccos(np.clip(np.where(d > 0, cos, 1.0), 0.0, 1.0)))
+        delta_u, delta_m = _deformation_limits(theta)
+        # The element with the smallest delta_u / r governs the rotation
+        rotation = np.min(np.where(d > 0, delta_u / d, np.inf), axis=1, keepdims=True)
+        R = _element_strength(theta, d * rotation / delta_m) * lengths
+        scale = np.where(d > 0, R / d, 0.0)
+    arm = (A[:, 0] - c[:, 0]) * u[:, 1] - (A[:, 1] - c[:, 1]) * u[:, 0]
+    sense = np.where(arm >= 0, 1.0, -1.0)
+    P = np.sum(R * d, axis=1) / np.abs(arm)
+    # Weld forces on the plate oppose the rotation caused by the load
+    Fx = np.sum(sense[:, None] * scale * r[..., 1], axis=1)
+    Fy = -np.sum(sense[:, None] * scale * r[..., 0], axis=1)
+    return np.stack([Fx + P * u[:, 0], Fy + P * u[:, 1]], axis=1), P
+
+
+def concentric_coefficient(group, angle=0.0):
+    """
+    IC-method coefficient (mm) of a load through the centroid: every element deforms
+    equally, up to the limit of the least ductile one.
+    """
+    _, lengths, axis = discretize(group)
+    u, _ = load_line(0.0, angle)
+    theta = np.degrees(np.arccos(np.clip(np.abs(axis @ u), 0.0, 1.0)))
+    delta_u, delta_m = _deformation_limits(theta)
+    return float(np.sum(_element_strength(theta, delta_u.min() / delta_m) * lengths))
+
+
+def _solve_stack(groups, e, angle):
+    """IC coefficients for a stack of groups with the same number of elements."""
+    mid, lengths, axis = (np.stack(a) for a in zip(*(discretize(g) for g in groups)))
+    u, A = load_line(e, angle)
+    total = lengths.sum(axis=1)
+    Ip = np.sum(lengths * np.sum(mid**2, axis=2) + lengths**3 / 12, axis=1)
+    P = solve_ic(lambda c, rows: _residual(c, mid[rows], lengths[rows], axis[rows], u[rows], A[rows]),
+                 elastic_ic(Ip, total, e, angle), np.maximum(np.sqrt(Ip / total), 1.0))
+    count("weld_group.solved", len(groups))
+    return P
+
+
+@instrumented("weld_group", "ic_coefficients")
+def ic_coefficients(groups, e, angle=0.0):
+    """
+    IC-method coefficients C (mm) for many (group, e, angle) cases. Cases already solved
+    are taken from the cache; the rest are solved together, stacked by element count.
+
+    Args:
+        groups (WeldGroup or sequence of WeldGroup): Weld groups.
+        e (float or array): Eccentricity of the load line from the centroid (mm).
+        angle (float or array): Load angle from vertical (degrees).
+
+    Returns:
+        tuple: (C, C_elastic) arrays; the design strength is phi * C * 0.6 Fexx * te.
+    """
+    if isinstance(groups, WeldGroup):
+        groups = [groups]
+    n_cases = max(len(groups), np.size(e), np.size(angle))
+    groups = groups * n_cases if len(groups) == 1 else groups
+    e = np.broadcast_to(np.asarray(e, dtype=float), (n_cases,))
+    angle = np.broadcast_to(np.asarray(angle, dtype=float), (n_cases,))
+    keys = [(g, round(float(ei), 9), round(float(ai), 9)) for g, ei, ai in zip(groups, e, angle)]
+
+    found = {}  # this call's cases, independent of what the bounded cache evicts
+    pending = {}
+    for k in dict.fromkeys(keys):
+        found[k] = _cache.get(k)
+        if found[k] is not None:
+            continue
+        group, ek, ak = k
+        if ek == 0:
+            found[k] = (concentric_coefficient(group, ak), float(elastic_coefficient(group, ek, ak)))
+            _cache.put(k, found[k])
+        else:
+            pending.setdefault(len(discretize(group)[1]), []).append(k)
+
+    for stack in pending.values():
+        P = _solve_stack([k[0] for k in stack], np.array([k[1] for k in stack]), np.array([k[2] for k in stack]))
+        for k, C in zip(stack, P):
+            found[k] = (float(C), float(elastic_coefficient(k[0], k[1], k[2])))
+            _cache.put(k, found[k])
+
+    C = np.array([found[k][0] for k in keys])
+    C_elastic = np.array([found[k][1] for k in keys])
+    return C, C_elastic
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def ic_coefficient(group, e, angle=0.0):
+    """IC-method coefficient C (mm) of one weld group (cached)."""
+    return float(ic_coefficients(group, e, angle)[0][0])
+
+
+def coefficient_table(group, eccentricities, angles=(0, 15, 30, 45, 60, 75)):
+    """
+    Coefficient table of one shape in the layout of the AISC Manual tables.
+
+    Returns:
+        ndarray: C (mm) of shape (len(angles), len(eccentricities)).
+    """
+    e, a = np.meshgrid(np.asarray(eccentricities, dtype=float), np.asarray(angles, dtype=float))
+    return ic_coefficients(group, e.ravel(), a.ravel())[0].reshape(e.shape)
+
+
+def weld_group_batch(groups, e, angle, Fexx, size, phi=0.75):
+    """
+    Design strength of eccentrically loaded fillet weld groups (IC method).
+
+    Args:
+        groups (WeldGroup or sequence of WeldGroup): Weld groups.
+        e (float or array): Load eccentricity from the centroid (mm).
+        angle (float or array): Load angle from vertical (degrees).
+        Fexx (float or array): Electrode strength (MPa).
+        size (float or array): Fillet leg size (mm).
+
+    Returns:
+        ResultTable: Columns phi_Rn, Rn, C, C_elastic, Fnw, te
+    """
+    C, C_elastic = ic_coefficients(groups, e, angle)
+    Fnw = 0.6 * np.asarray(Fexx, dtype=float)
+    te = 0.707 * np.asarray(size, dtype=float)
+    Rn = C * Fnw * te
+    return ResultTable(WeldGroupResult, {"phi_Rn": phi * Rn, "Rn": Rn, "C": C, "C_elastic": C_elastic,
+                                         "Fnw": Fnw, "te": te})
+
+
+def calculate_weld_group(group, e, angle, Fexx, size, phi=0.75):
+    """
+    Scalar form of weld_group_batch.
+
+    Returns:
+        WeldGroupResult
+    """
+    return weld_group_batch(group, e, angle, Fexx, size, phi)[0]
@@ -1,5 +1,5 @@
 import customtkinter as ctk
-from gui.views import TensionView, CompressionView, ConnectionView, FlexureView, WeldView, CombinedView, SectionView, BasePlateView, MomentConnectionView
+from gui.views import TensionView, CompressionView, ConnectionView, FlexureView, WeldView, CombinedView, SectionView, BasePlateView, MomentConnectionView, SweepView
 
 ctk.set_appearance_mode("System")  # Modes: "System" (standard), "Dark", "Light"
 ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
@@ -51,6 +51,9 @@ class App(ctk.CTk):
         
         self.btn_section = ctk.CTkButton(self.sidebar_frame, text="Profile Visualizer", command=self.show_section)
         self.btn_section.grid(row=9, column=0, padx=20, pady=10)
+
+        self.btn_sweep = ctk.CTkButton(self.sidebar_frame, text="Parametric Sweep", command=self.show_sweep)
+        self.btn_sweep.grid(row=10, column=0, padx=20, pady=10)
         
         # Appearance Mode
         self.appearance_mode_label = ctk.CTkLabel(self.sidebar_frame, text="Appearance Mode:", anchor="w")
@@ -96,6 +99,9 @@ class App(ctk.CTk):
     def show_moment(self):
         self.show_view(MomentConnectionView)
 
+    def show_sweep(self):
+        self.show_view(SweepView)
+
     def change_appearance_mode_event(self, new_appearance_mode: str):
         ctk.set_appearance_mode(new_appearance_mode)
 
@@ -1,4 +1,5 @@
 import customtkinter as ctk
+import numpy as np
 import sys
 import os
 
@@ -6,9 +7,14 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from core.calculations import calculate_tension, calculate_compression, calculate_bolt_shear
+from core.net_section import HolePattern, effective_hole, net_area, shear_lag_factor
 from core.profiles import ProfileDatabase
-from core.reports import PDFReport
-from tkinter import filedialog
+from core.reports import BACKENDS, generate_report
+from gui.widgets import ProfilePicker
+from tkinter import filedialog, messagebox
+
+# Delay after the last keystroke before a live recalculation runs
+LIVE_DEBOUNCE_MS = 300
 
 class BaseView(ctk.CTkScrollableFrame):
     def __init__(self, master, title, **kwargs):
@@ -25,15 +31,77 @@ class BaseView(ctk.CTkScrollableFrame):
         self.last_inputs = {}
         self.last_results = {}
         
-        self.export_btn = ctk.CTkButton(self, text="Export PDF Report", command=self.export_pdf, state="disabled", fg_color="green")
+        self.export_btn = ctk.CTkButton(self, text="Export Report", command=self.export_report, state="disabled", fg_color="green")
         self.export_btn.grid(row=30, column=0, padx=20, pady=(0, 20), sticky="ew")
 
-    def export_pdf(self):
+        # Live recalculation state
+        self._live_job = None
+        self._live_generation = 0
+        self._shown_lines = []
+
+    def enable_live_update(self, entries, variables=()):
+        """
+        Recalculate automatically while the user edits inputs.
+        Keystrokes are debounced so only the last edit in a burst triggers calculate().
+
+        Args:
+            entries (list): Entry widgets to watch.
+            variables (list): Tk variables (e.g. combo box selections) to watch.
+        """
+        for entry in entries:
+            entry.bind("<KeyRelease>", self.schedule_recalculate, add="+")
+        for var in variables:
+            var.trace_add("write", lambda *args: self.schedule_recalculate())
+
+    def schedule_recalculate(self, event=None):
+        # A newer edit supersedes any pending recalculation
+        self._live_generation += 1
+        if self._live_job is not None:
+            self.after_cancel(self._live_job)
+        generation = self._live_generation
+        self._live_job = self.after(LIVE_DEBOUNCE_MS, lambda: self._live_recalculate(generation))
+
+    def _live_recalculate(self, generation):
+        self._live_job = None
+        if generation != self._live_generation:
+            return
+        self.calculate()
+
+    def show_output(self, output):
+        """
+        Show text in result_text, redrawing only the lines that differ from what is displayed.
+        """
+        lines = output.split("\n")
+        shown = self._shown_lines
+        for i, line in enumerate(lines):
+            if i < len(shown):
+                if shown[i] != line:
+                    self.result_text.delete(f"{i + 1}.0", f"{i + 1}.end")
+                    self.result_text.insert(f"{i + 1}.0", line)
+            else:
+                self.result_text.insert("end-1c", line if i == 0 else "\n" + line)
+        if len(shown) > len(lines):
+            self.result_text.delete(f"{len(lines)}.end", "end-1c")
+        self._shown_lines = lines
+
+    def destroy(self):
+        if self._live_job is not None:
+            self.after_cancel(self._live_job)
+            self._live_job = None
+        super().destroy()
+
+    def export_report(self):
         if not self.last_results:
             return
-        filename = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF Files", "*.pdf")])
+        # PDF first (the default); the format follows the chosen extension
+        filetypes = [(b.label, "*" + b.extension) for b in BACKENDS.values()]
+        filename = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=filetypes)
         if filename:
-            PDFReport.generate(filename, self.title_label.cget("text"), self.last_inputs, self.last_results)
+            try:
+                generate_report(filename, self.title_label.cget("text"), self.last_inputs, self.last_results)
+            except ValueError as e:
+                # Unknown extension typed into the dialog (e.g. .txt)
+                messagebox.showerror("Export Report", str(e))
 
 class TensionView(BaseView):
     def __init__(self, master, **kwargs):
@@ -43,8 +111,8 @@ class TensionView(BaseView):
         self.profile_label = ctk.CTkLabel(self, text="Select Profile:")
         self.profile_label.grid(row=1, column=0, padx=20, pady=(10, 0), sticky="w")
         self.profile_var = ctk.StringVar(value=self.profiles[0])
-        self.profile_combo = ctk.CTkComboBox(self, values=self.profiles, variable=self.profile_var)
-        self.profile_combo.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self.profile_picker = ProfilePicker(self, self.db, self.profile_var)
+        self.profile_picker.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
 
         # Material Properties
         self.fy_label = ctk.CTkLabel(self, text="Yield Strength, Fy (MPa):")
@@ -59,13 +127,36 @@ class TensionView(BaseView):
         self.fu_entry.insert(0, "370")
         self.fu_entry.grid(row=6, column=0, padx=20, pady=(0, 10), sticky="ew")
 
+        # Bolted end connection (net section and shear lag)
+        self.bolt_label = ctk.CTkLabel(self, text="Bolt Diameter (mm) [0 = no holes]:")
+        self.bolt_label.grid(row=7, column=0, padx=20, pady=(10, 0), sticky="w")
+        self.bolt_entry = ctk.CTkEntry(self, placeholder_text="0")
+        self.bolt_entry.insert(0, "0")
+        self.bolt_entry.grid(row=8, column=0, padx=20, pady=(0, 10), sticky="ew")
+
+        self.holes_label = ctk.CTkLabel(self, text="Holes per Flange (in one cross-section):")
+        self.holes_label.grid(row=9, column=0, padx=20, pady=(10, 0), sticky="w")
+        self.holes_entry = ctk.CTkEntry(self, placeholder_text="2")
+        self.holes_entry.insert(0, "2")
+        self.holes_entry.grid(row=10, column=0, padx=20, pady=(0, 10), sticky="ew")
+
+        self.u_label = ctk.CTkLabel(self, text="Shear Lag Factor U [blank = Table D3.1, 3 bolts per line]:")
+        self.u_label.grid(row=11, column=0, padx=20, pady=(10, 0), sticky="w")
+        self.u_entry = ctk.CTkEntry(self, placeholder_text="1.0")
+        self.u_entry.insert(0, "1.0")
+        self.u_entry.grid(row=12, column=0, padx=20, pady=(0, 10), sticky="ew")
+
         # Calculate Button
         self.calc_btn = ctk.CTkButton(self, text="Calculate Capacity", command=self.calculate)
-        self.calc_btn.grid(row=7, column=0, padx=20, pady=20, sticky="ew")
+        self.calc_btn.grid(row=13, column=0, padx=20, pady=20, sticky="ew")
 
         # Result Display
         self.result_text = ctk.CTkTextbox(self, height=150)
-        self.result_text.grid(row=8, column=0, padx=20, pady=10, sticky="nsew")
+        self.result_text.grid(row=14, column=0, padx=20, pady=10, sticky="nsew")
+
+        # Live recalculation
+        self.enable_live_update([self.fy_entry, self.fu_entry, self.bolt_entry, self.holes_entry, self.u_entry],
+                                [self.profile_var])
 
     def calculate(self):
         try:
@@ -73,14 +164,25 @@ class TensionView(BaseView):
             profile = self.db.get_profile(profile_name)
             fy = float(self.fy_entry.get())
             fu = float(self.fu_entry.get())
-
-            # Simplification: Ae = Ag (no shear lag deduction yet)
-            res = calculate_tension(profile.Ag, profile.Ag, fy, fu)
+            d_bolt = float(self.bolt_entry.get())
+            n_holes = int(self.holes_entry.get())
+            U_text = self.u_entry.get().strip()
+
+            pattern = None
+            if d_bolt > 0 and n_holes > 0:
+                # Holes in one cross-section of each flange (no stagger)
+                pattern = HolePattern.grid(range(n_holes), 1, 0.0, effective_hole(d_bolt))
+            An = net_area(profile.Ag, profile.tf, pattern, elements=2)
+            U = float(U_text) if U_text else shear_lag_factor(profile, "flanges", bolts_per_line=3)
+            Ae = U * An
+            res = calculate_tension(profile.Ag, Ae, fy, fu)
             
             self.last_inputs = {
                 "Profile": profile_name,
                 "Yield Strength (Fy)": f"{fy} MPa",
-                "Ultimate Strength (Fu)": f"{fu} MPa"
+                "Ultimate Strength (Fu)": f"{fu} MPa",
+                "Bolt Holes": f"{n_holes} x M{d_bolt:g} per flange" if pattern else "None",
+                "Shear Lag Factor (U)": f"{U:.3f}"
             }
             self.last_results = {
                 "Yield Capacity": f"{res['yield']['phi_Pn']/1000:.2f} kN",
@@ -92,17 +194,17 @@ class TensionView(BaseView):
             
             output = f"Profile: {profile.name}\n"
             output += f"Area (Ag): {profile.Ag} mm2\n"
+            output += f"Net Area (An): {An:.1f} mm2\n"
+            output += f"Effective Net Area (Ae = U An): {Ae:.1f} mm2 (U = {U:.3f})\n"
             output += "-"*30 + "\n"
             output += f"Yield Capacity (Phi_Pn): {res['yield']['phi_Pn']/1000:.2f} kN\n"
             output += f"Rupture Capacity (Phi_Pn): {res['rupture']['phi_Pn']/1000:.2f} kN\n"
             output += "-"*30 + "\n"
             output += f"DESIGN STRENGTH: {res['phi_Pn']/1000:.2f} kN\n"
             
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", output)
-        except ValueError:
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", "Error: Invalid input values.")
+            self.show_output(output)
+        except (ValueError, ZeroDivisionError):
+            self.show_output("Error: Invalid input values.")
 
 class CompressionView(BaseView):
     def __init__(self, master, **kwargs):
@@ -112,8 +214,8 @@ class CompressionView(BaseView):
         self.profile_label = ctk.CTkLabel(self, text="Select Profile:")
         self.profile_label.grid(row=1, column=0, padx=20, pady=(10, 0), sticky="w")
         self.profile_var = ctk.StringVar(value=self.profiles[0])
-        self.profile_combo = ctk.CTkComboBox(self, values=self.profiles, variable=self.profile_var)
-        self.profile_combo.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self.profile_picker = ProfilePicker(self, self.db, self.profile_var)
+        self.profile_picker.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
 
         # Length Input
         self.len_label = ctk.CTkLabel(self, text="Unbraced Length, L (mm):")
@@ -144,6 +246,9 @@ class CompressionView(BaseView):
         self.result_text = ctk.CTkTextbox(self, height=150)
         self.result_text.grid(row=10, column=0, padx=20, pady=10, sticky="nsew")
 
+        # Live recalculation
+        self.enable_live_update([self.len_entry, self.k_entry, self.fy_entry], [self.profile_var])
+
     def calculate(self):
         try:
             profile_name = self.profile_var.get()
@@ -176,11 +281,9 @@ class CompressionView(BaseView):
             output += "-"*30 + "\n"
             output += f"DESIGN STRENGTH (Phi_Pn): {res['phi_Pn']/1000:.2f} kN\n"
 
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", output)
-        except ValueError:
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", "Error: Invalid input values.")
+            self.show_output(output)
+        except (ValueError, ZeroDivisionError):
+            self.show_output("Error: Invalid input values.")
 
 class ConnectionView(BaseView):
     def __init__(self, master, **kwargs):
@@ -215,6 +318,9 @@ class ConnectionView(BaseView):
         self.result_text = ctk.CTkTextbox(self, height=150)
         self.result_text.grid(row=8, column=0, padx=20, pady=10, sticky="nsew")
 
+        # Live recalculation
+        self.enable_live_update([self.db_entry, self.n_entry, self.fnv_entry])
+
     def calculate(self):
         try:
             db = float(self.db_entry.get())
@@ -245,11 +351,9 @@ class ConnectionView(BaseView):
             output += "-"*30 + "\n"
             output += f"DESIGN STRENGTH (Phi_Rn): {res['phi_Rn']/1000:.2f} kN\n"
 
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", output)
-        except ValueError:
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", "Error: Invalid input values.")
+            self.show_output(output)
+        except (ValueError, ZeroDivisionError):
+            self.show_output("Error: Invalid input values.")
 
 class FlexureView(BaseView):
     def __init__(self, master, **kwargs):
@@ -259,8 +363,8 @@ class FlexureView(BaseView):
         self.profile_label = ctk.CTkLabel(self, text="Select Profile:")
         self.profile_label.grid(row=1, column=0, padx=20, pady=(10, 0), sticky="w")
         self.profile_var = ctk.StringVar(value=self.profiles[0])
-        self.profile_combo = ctk.CTkComboBox(self, values=self.profiles, variable=self.profile_var)
-        self.profile_combo.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self.profile_picker = ProfilePicker(self, self.db, self.profile_var)
+        self.profile_picker.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
 
         # Unbraced Length
         self.lb_label = ctk.CTkLabel(self, text="Unbraced Length, Lb (mm):")
@@ -291,6 +395,9 @@ class FlexureView(BaseView):
         self.result_text = ctk.CTkTextbox(self, height=150)
         self.result_text.grid(row=10, column=0, padx=20, pady=10, sticky="nsew")
 
+        # Live recalculation
+        self.enable_live_update([self.lb_entry, self.cb_entry, self.fy_entry], [self.profile_var])
+
     def calculate(self):
         try:
             profile_name = self.profile_var.get()
@@ -326,11 +433,9 @@ class FlexureView(BaseView):
             output += "-"*30 + "\n"
             output += f"DESIGN STRENGTH (Phi_Mn): {res['phi_Mn']/1000000:.2f} kNm\n"
 
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", output)
-        except ValueError:
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", "Error: Invalid input values.")
+            self.show_output(output)
+        except (ValueError, ZeroDivisionError):
+            self.show_output("Error: Invalid input values.")
 
 class WeldView(BaseView):
     def __init__(self, master, **kwargs):
@@ -372,6 +477,9 @@ class WeldView(BaseView):
         self.result_text = ctk.CTkTextbox(self, height=150)
         self.result_text.grid(row=10, column=0, padx=20, pady=10, sticky="nsew")
 
+        # Live recalculation
+        self.enable_live_update([self.elec_entry, self.size_entry, self.len_entry], [self.type_var])
+
     def calculate(self):
         try:
             weld_type = self.type_var.get()
@@ -407,11 +515,9 @@ class WeldView(BaseView):
             output += "-"*30 + "\n"
             output += f"DESIGN STRENGTH (Phi_Rn): {res['phi_Rn']/1000:.2f} kN\n"
 
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", output)
-        except ValueError:
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", "Error: Invalid input values.")
+            self.show_output(output)
+        except (ValueError, ZeroDivisionError):
+            self.show_output("Error: Invalid input values.")
 
 class CombinedView(BaseView):
     def __init__(self, master, **kwargs):
@@ -421,8 +527,8 @@ class CombinedView(BaseView):
         self.profile_label = ctk.CTkLabel(self, text="Select Profile:")
         self.profile_label.grid(row=1, column=0, padx=20, pady=(10, 0), sticky="w")
         self.profile_var = ctk.StringVar(value=self.profiles[0])
-        self.profile_combo = ctk.CTkComboBox(self, values=self.profiles, variable=self.profile_var)
-        self.profile_combo.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self.profile_picker = ProfilePicker(self, self.db, self.profile_var)
+        self.profile_picker.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
 
         # Loads
         self.pu_label = ctk.CTkLabel(self, text="Required Axial Strength, Pu (kN):")
@@ -463,6 +569,9 @@ class CombinedView(BaseView):
         self.result_text = ctk.CTkTextbox(self, height=150)
         self.result_text.grid(row=14, column=0, padx=20, pady=10, sticky="nsew")
 
+        # Live recalculation
+        self.enable_live_update([self.pu_entry, self.mux_entry, self.muy_entry, self.len_entry, self.fy_entry], [self.profile_var])
+
     def calculate(self):
         try:
             profile_name = self.profile_var.get()
@@ -509,11 +618,9 @@ class CombinedView(BaseView):
             output += f"Phi Pn: {res['phi_Pn']/1000:.2f} kN\n"
             output += f"Phi Mnx: {res['phi_Mnx']/1000000:.2f} kNm\n"
 
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", output)
-        except ValueError:
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", "Error: Invalid input values.")
+            self.show_output(output)
+        except (ValueError, ZeroDivisionError):
+            self.show_output("Error: Invalid input values.")
 
 class SectionView(BaseView):
     def __init__(self, master, **kwargs):
@@ -526,8 +633,8 @@ class SectionView(BaseView):
         self.profile_label = ctk.CTkLabel(self, text="Select Profile:")
         self.profile_label.grid(row=1, column=0, padx=20, pady=(10, 0), sticky="w")
         self.profile_var = ctk.StringVar(value=self.profiles[0])
-        self.profile_combo = ctk.CTkComboBox(self, values=self.profiles, variable=self.profile_var, command=self.update_plot)
-        self.profile_combo.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self.profile_picker = ProfilePicker(self, self.db, self.profile_var, command=self.update_plot)
+        self.profile_picker.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
 
         # Plot Frame
         self.plot_frame = ctk.CTkFrame(self)
@@ -554,6 +661,136 @@ class SectionView(BaseView):
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(side="top", fill="both", expand=True)
 
+class SweepView(BaseView):
+    # Inputs that can be swept: label -> (sweep name, unit scale to N/mm, default range)
+    PARAMETERS = {
+        "Length L (mm)": ("L", 1.0, "1000, 8000, 36"),
+        "K Factor": ("K", 1.0, "0.5, 2.0, 16"),
+        "Cb": ("Cb", 1.0, "1.0, 2.3, 14"),
+        "Fy (MPa)": ("Fy", 1.0, "240, 410, 18"),
+    }
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, "Parametric Sweep (Beam-Column)", **kwargs)
+
+        # Profile Selection
+        self.profile_label = ctk.CTkLabel(self, text="Select Profile:")
+        self.profile_label.grid(row=1, column=0, padx=20, pady=(10, 0), sticky="w")
+        self.profile_var = ctk.StringVar(value=self.profiles[0])
+        self.profile_picker = ProfilePicker(self, self.db, self.profile_var)
+        self.profile_picker.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
+
+        # Loads
+        self.loads_label = ctk.CTkLabel(self, text="Pu (kN), Mux (kNm), Muy (kNm):")
+        self.loads_label.grid(row=3, column=0, padx=20, pady=(10, 0), sticky="w")
+        self.loads_entry = ctk.CTkEntry(self, placeholder_text="100, 20, 0")
+        self.loads_entry.insert(0, "100, 20, 0")
+        self.loads_entry.grid(row=4, column=0, padx=20, pady=(0, 10), sticky="ew")
+
+        # Fixed values for the inputs that are not swept
+        self.fixed_label = ctk.CTkLabel(self, text="Fixed L (mm), K, Cb, Fy (MPa):")
+        self.fixed_label.grid(row=5, column=0, padx=20, pady=(10, 0), sticky="w")
+        self.fixed_entry = ctk.CTkEntry(self, placeholder_text="3000, 1.0, 1.0, 240")
+        self.fixed_entry.insert(0, "3000, 1.0, 1.0, 240")
+        self.fixed_entry.grid(row=6, column=0, padx=20, pady=(0, 10), sticky="ew")
+
+        # Swept axes: parameter and "from, to, steps"
+        labels = list(self.PARAMETERS)
+        self.x_var = ctk.StringVar(value=labels[0])
+        self.x_menu = ctk.CTkOptionMenu(self, values=labels, variable=self.x_var,
+                                        command=lambda v: self._reset_range(self.x_entry, v))
+        self.x_menu.grid(row=7, column=0, padx=20, pady=(10, 0), sticky="w")
+        self.x_entry = ctk.CTkEntry(self)
+        self.x_entry.insert(0, self.PARAMETERS[labels[0]][2])
+        self.x_entry.grid(row=8, column=0, padx=20, pady=(0, 10), sticky="ew")
+
+        self.y_var = ctk.StringVar(value=labels[3])
+        self.y_menu = ctk.CTkOptionMenu(self, values=labels, variable=self.y_var,
+                                        command=lambda v: self._reset_range(self.y_entry, v))
+        self.y_menu.grid(row=9, column=0, padx=20, pady=(10, 0), sticky="w")
+        self.y_entry = ctk.CTkEntry(self)
+        self.y_entry.insert(0, self.PARAMETERS[labels[3]][2])
+        self.y_entry.grid(row=10, column=0, padx=20, pady=(0, 10), sticky="ew")
+
+        # Calculate
+        self.calc_btn = ctk.CTkButton(self, text="Run Sweep", command=self.calculate)
+        self.calc_btn.grid(row=11, column=0, padx=20, pady=20, sticky="ew")
+
+        # Result
+        self.result_text = ctk.CTkTextbox(self, height=80)
+        self.result_text.grid(row=12, column=0, padx=20, pady=10, sticky="nsew")
+
+        self.plot_frame = ctk.CTkFrame(self, height=400)
+        self.plot_frame.grid(row=13, column=0, padx=20, pady=10, sticky="nsew")
+        self.canvas = None
+
+    def _reset_range(self, entry, label):
+        entry.delete(0, "end")
+        entry.insert(0, self.PARAMETERS[label][2])
+
+    @staticmethod
+    def _parse_range(text):
+        start, stop, steps = [v.strip() for v in text.split(",")]
+        return np.linspace(float(start), float(stop), int(steps))
+
+    def calculate(self):
+        try:
+            x_label, y_label = self.x_var.get(), self.y_var.get()
+            if x_label == y_label:
+                self.show_output("Error: Choose two different parameters.")
+                return
+            profile_name = self.profile_var.get()
+            profile = self.db.get_profile(profile_name)
+
+            Pu, Mux, Muy = [float(v) for v in self.loads_entry.get().split(",")]
+            L, K, Cb, Fy = [float(v) for v in self.fixed_entry.get().split(",")]
+            x_name, y_name = self.PARAMETERS[x_label][0], self.PARAMETERS[y_label][0]
+            fixed = {"profile": profile, "Pu": Pu * 1000, "Mux": Mux * 1000000, "Muy": Muy * 1000000,
+                     "L": L, "K": K, "Cb": Cb, "Fy": Fy}
+            del fixed[x_name], fixed[y_name]
+
+            from core.sweep import sweep
+            result = sweep("combined", {x_name: self._parse_range(self.x_entry.get()),
+                                        y_name: self._parse_range(self.y_entry.get())},
+                           fixed=fixed, outputs=["ratio"])
+            x, y, ratio = result.slice2d("ratio", x_name, y_name)
+
+            safe = np.count_nonzero(ratio <= 1.0)
+            self.last_inputs = {
+                "Profile": profile_name,
+                "Loads": f"Pu={Pu} kN, Mux={Mux} kNm, Muy={Muy} kNm",
+                "X Axis": f"{x_label}: {x[0]:g} to {x[-1]:g}",
+                "Y Axis": f"{y_label}: {y[0]:g} to {y[-1]:g}"
+            }
+            self.last_results = {
+                "Grid Points": str(ratio.size),
+                "Safe Points": str(safe),
+                "Ratio Range": f"{ratio.min():.3f} - {ratio.max():.3f}",
+                "status": "OK" if safe == ratio.size else "NOT SAFE"
+            }
+            self.export_btn.configure(state="normal")
+
+            output = f"Sweep of {profile_name}: {ratio.shape[1]} x {ratio.shape[0]} points\n"
+            output += f"Interaction ratio from {ratio.min():.3f} to {ratio.max():.3f}\n"
+            output += f"Safe (ratio <= 1.0): {safe} of {ratio.size} points\n"
+            self.show_output(output)
+            self.update_plot(x, y, ratio, x_label, y_label, profile_name)
+        except (ValueError, ZeroDivisionError):
+            self.show_output("Error: Invalid input values. Ranges are 'from, to, steps'.")
+
+    def update_plot(self, x, y, ratio, x_label, y_label, profile_name):
+        for widget in self.plot_frame.winfo_children():
+            widget.destroy()
+
+        from core.plotting import create_heatmap_plot
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        fig = create_heatmap_plot(x, y, ratio, x_label, y_label, f"Interaction Ratio: {profile_name}", limit=1.0)
+
+        self.canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
+        self.canvas.draw()
+        self.canvas.get_tk_widget().pack(side="top", fill="both", expand=True)
+
 class BasePlateView(BaseView):
     def __init__(self, master, **kwargs):
         super().__init__(master, "Column Base Plate Design", **kwargs)
@@ -562,8 +799,8 @@ class BasePlateView(BaseView):
         self.profile_label = ctk.CTkLabel(self, text="Select Column Profile:")
         self.profile_label.grid(row=1, column=0, padx=20, pady=(10, 0), sticky="w")
         self.profile_var = ctk.StringVar(value=self.profiles[0])
-        self.profile_combo = ctk.CTkComboBox(self, values=self.profiles, variable=self.profile_var)
-        self.profile_combo.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self.profile_picker = ProfilePicker(self, self.db, self.profile_var)
+        self.profile_picker.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
 
         # Load
         self.pu_label = ctk.CTkLabel(self, text="Factored Axial Load, Pu (kN):")
@@ -599,6 +836,9 @@ class BasePlateView(BaseView):
         self.result_text = ctk.CTkTextbox(self, height=200)
         self.result_text.grid(row=20, column=0, padx=20, pady=10, sticky="nsew")
 
+        # Live recalculation
+        self.enable_live_update([self.pu_entry, self.fc_entry, self.n_entry, self.b_entry], [self.profile_var])
+
     def calculate(self):
         try:
             profile_name = self.profile_var.get()
@@ -638,11 +878,9 @@ class BasePlateView(BaseView):
             output += f"Cantilever n: {res['n']:.2f} mm\n"
             output += f"REQUIRED THICKNESS (tp): {res['t_req']:.2f} mm\n"
 
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", output)
-        except ValueError:
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", "Error: Invalid input values.")
+            self.show_output(output)
+        except (ValueError, ZeroDivisionError):
+            self.show_output("Error: Invalid input values.")
 
 class MomentConnectionView(BaseView):
     def __init__(self, master, **kwargs):
@@ -652,8 +890,8 @@ class MomentConnectionView(BaseView):
         self.profile_label = ctk.CTkLabel(self, text="Select Beam Profile:")
         self.profile_label.grid(row=1, column=0, padx=20, pady=(10, 0), sticky="w")
         self.profile_var = ctk.StringVar(value=self.profiles[0])
-        self.profile_combo = ctk.CTkComboBox(self, values=self.profiles, variable=self.profile_var)
-        self.profile_combo.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self.profile_picker = ProfilePicker(self, self.db, self.profile_var)
+        self.profile_picker.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="ew")
 
         # Load
         self.mu_label = ctk.CTkLabel(self, text="Factored Moment, Mu (kNm):")
@@ -689,6 +927,9 @@ class MomentConnectionView(BaseView):
         self.result_text = ctk.CTkTextbox(self, height=200)
         self.result_text.grid(row=20, column=0, padx=20, pady=10, sticky="nsew")
 
+        # Live recalculation
+        self.enable_live_update([self.mu_entry, self.bolt_entry, self.n_bolts_entry, self.tp_entry], [self.profile_var])
+
     def calculate(self):
         try:
             profile_name = self.profile_var.get()
@@ -729,8 +970,6 @@ class MomentConnectionView(BaseView):
             output += f"Plate Thickness Check: {res['plate_check']}\n"
             output += f"STATUS: {res['status']}\n"
 
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", output)
-        except ValueError:
-            self.result_text.delete("0.0", "end")
-            self.result_text.insert("0.0", "Error: Invalid input values.")
+            self.show_output(output)
+        except (ValueError, ZeroDivisionError):
+            self.show_output("Error: Invalid input values.")
@@ -0,0 +1,171 @@
+import tkinter as tk
+
+import customtkinter as ctk
+
+from core.search import catalogue_index
+
+ALL_TYPES = "All types"
+
+
+def parse_range(text):
+    """
+    "200-400", "200-" or "-400" -> (low, high) with None for an open end; "" -> None.
+    """
+    text = text.replace(" ", "")
+    if not text:
+        return None
+    low, sep, high = text.partition("-")
+    if not sep:
+        value = float(low)
+        return (value, value)
+    return (float(low) if low else None, float(high) if high else None)
+
+
+class ProfilePicker(ctk.CTkFrame):
+    """
+    Searchable profile list for large catalogues.
+
+    Only the rows in view are drawn: a fixed pool of canvas items is re-labelled as the
+    list scrolls, so opening, scrolling and filtering cost the same for 50 profiles or
+    50,000. Typing filters incrementally through core.search; the list can also be
+    restricted to one section type and a depth range.
+
+    Args:
+        master: Parent widget.
+        db (ProfileDatabase or FederatedCatalogue): Catalogue to pick from.
+        variable (StringVar): Receives the selected profile name.
+        command (callable): Called with the name after each selection.
+    """
+    ROW_HEIGHT = 22
+    VISIBLE_ROWS = 8
+
+    def __init__(self, master, db, variable, command=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.index = catalogue_index(db)
+        self.variable = variable
+        self.command = command
+        self.grid_columnconfigure(0, weight=1)
+
+        self.query_entry = ctk.CTkEntry(self, placeholder_text="Search profiles (e.g. WF 300)")
+        self.query_entry.grid(row=0, column=0, padx=(0, 5), pady=(0, 5), sticky="ew")
+        self.query_entry.bind("<KeyRelease>", self._on_key, add="+")
+        self.query_entry.bind("<Return>", lambda e: self._select_row(self._cursor))
+        self.query_entry.bind("<Down>", lambda e: self._move_cursor(1))
+        self.query_entry.bind("<Up>", lambda e: self._move_cursor(-1))
+
+        self.type_var = ctk.StringVar(value=ALL_TYPES)
+        self.type_menu = ctk.CTkOptionMenu(self, values=[ALL_TYPES] + self.index.types, variable=self.type_var,
+                                           width=110, command=lambda v: self.refresh())
+        self.type_menu.grid(row=0, column=1, padx=(0, 5), pady=(0, 5))
+
+        self.depth_entry = ctk.CTkEntry(self, placeholder_text="d (mm) 200-400", width=120)
+        self.depth_entry.grid(row=0, column=2, pady=(0, 5))
+        self.depth_entry.bind("<KeyRelease>", lambda e: self.refresh(), add="+")
+
+        self.canvas = tk.Canvas(self, height=self.VISIBLE_ROWS * self.ROW_HEIGHT, highlightthickness=0, borderwidth=0)
+        self.canvas.grid(row=1, column=0, columnspan=3, sticky="ew")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=3, sticky="ns")
+
+        self.count_label = ctk.CTkLabel(self, text="", anchor="w")
+        self.count_label.grid(row=2, column=0, columnspan=3, sticky="w")
+
+        # Row pool: one background rectangle and one text item per visible row
+        self._rows = []
+        for k in range(self.VISIBLE_ROWS):
+            y = k * self.ROW_HEIGHT
+            rect = self.canvas.create_rectangle(0, y, 10000, y + self.ROW_HEIGHT, width=0)
+            text = self.canvas.create_text(8, y + self.ROW_HEIGHT / 2, anchor="w")
+            self._rows.append((rect, text))
+        self.canvas.bind("<Button-1>", lambda e: self._select_row(self._top + int(e.y // self.ROW_HEIGHT)))
+        self.canvas.bind("<MouseWheel>", lambda e: self._scroll_to(self._top - int(e.delta / 120) * 3))
+        self.canvas.bind("<Button-4>", lambda e: self._scroll_to(self._top - 3))
+        self.canvas.bind("<Button-5>", lambda e: self._scroll_to(self._top + 3))
+
+        self._ids = self.index.search("")
+        self._top = 0
+        self._cursor = 0
+        self._apply_colors()
+        self.refresh()
+
+    def _apply_colors(self):
+        theme = ctk.ThemeManager.theme
+        self._bg = self._apply_appearance_mode(theme["CTkEntry"]["fg_color"])
+        self._fg = self._apply_appearance_mode(theme["CTkLabel"]["text_color"])
+        self._selected_bg = self._apply_appearance_mode(theme["CTkButton"]["fg_color"])
+        self._cursor_bg = self._apply_appearance_mode(theme["CTkButton"]["hover_color"])
+        self.canvas.configure(background=self._bg)
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self._apply_colors()
+        self._render()
+
+    def _on_key(self, event):
+        if event.keysym in ("Up", "Down", "Return"):
+            return
+        self.refresh()
+
+    def refresh(self):
+        """Re-run the search with the current query and filters."""
+        section_type = self.type_var.get()
+        bounds = {}
+        try:
+            depth = parse_range(self.depth_entry.get())
+        except ValueError:
+            depth = None
+        if depth is not None:
+            bounds["d"] = depth
+        self._ids = self.index.search(self.query_entry.get(),
+                                      None if section_type == ALL_TYPES else section_type, **bounds)
+        self._top = 0
+        self._cursor = 0
+        self.count_label.configure(text=f"{len(self._ids)} of {len(self.index)} profiles")
+        self._render()
+
+    def _render(self):
+        selected = self.variable.get()
+        names = self.index.names
+        for k, (rect, text) in enumerate(self._rows):
+            row = self._top + k
+            if row < len(self._ids):
+                name = names[self._ids[row]]
+                fill = self._selected_bg if name == selected else self._cursor_bg if row == self._cursor else self._bg
+                self.canvas.itemconfigure(text, text=name, fill=self._fg)
+                self.canvas.itemconfigure(rect, fill=fill)
+            else:
+                self.canvas.itemconfigure(text, text="")
+                self.canvas.itemconfigure(rect, fill=self._bg)
+        n = max(len(self._ids), 1)
+        self.scrollbar.set(self._top / n, min(self._top + self.VISIBLE_ROWS, n) / n)
+
+    def _scroll_to(self, top):
+        self._top = max(0, min(int(top), len(self._ids) - self.VISIBLE_ROWS))
+        self._render()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._scroll_to(float(amount) * len(self._ids))
+        elif action == "scroll":
+            step = self.VISIBLE_ROWS if unit == "pages" else 1
+            self._scroll_to(self._top + int(amount) * step)
+
+    def _move_cursor(self, step):
+        if not len(self._ids):
+            return
+        self._cursor = max(0, min(self._cursor + step, len(self._ids) - 1))
+        if self._cursor < self._top:
+            self._top = self._cursor
+        elif self._cursor >= self._top + self.VISIBLE_ROWS:
+            self._top = self._cursor - self.VISIBLE_ROWS + 1
+        self._render()
+
+    def _select_row(self, row):
+        if not 0 <= row < len(self._ids):
+            return
+        name = self.index.names[self._ids[row]]
+        self._cursor = row
+        self.variable.set(name)
+        self._render()
+        if self.command is not None:
+            self.command(name)
@@ -0,0 +1,12 @@
+import argparse
+
+from core.service import run, DEFAULT_DB_PATH
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON steel calculation service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Profile catalogue CSV.")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (0 = no pool).")
+    args = parser.parse_args()
+    run(args.host, args.port, args.db, args.workers)
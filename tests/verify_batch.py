@@ -0,0 +1,85 @@
+import unittest
+import os
+import sys
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from core.calculations import (
+    calculate_tension, calculate_compression, calculate_bolt_shear, calculate_flexure,
+    calculate_weld, calculate_combined, calculate_base_plate, calculate_moment_plate
+)
+from core.batch import (
+    tension_batch, compression_batch, bolt_shear_batch, flexure_batch, weld_batch,
+    combined_batch, base_plate_batch, moment_plate_batch
+)
+from core.profiles import ProfileDatabase
+
+class TestResultTypes(unittest.TestCase):
+    def test_dict_style_access(self):
+        res = calculate_tension(1000, 800, 250, 400)
+        self.assertEqual(res['yield']['Pn'], 250000)
+        self.assertEqual(set(res.keys()), {"phi_Pn", "yield", "rupture"})
+        self.assertEqual(res.to_dict()["rupture"], {"Pn": 320000, "phi_Pn": 240000})
+        self.assertIsNone(res.get("missing"))
+        with self.assertRaises(KeyError):
+            res["missing"]
+        self.assertFalse(hasattr(res, "__dict__"))
+
+    def test_base_plate_keys_unique(self):
+        res = calculate_base_plate(500000, 25, 400, 400, 200, 200)
+        self.assertEqual(list(res.keys()), ["phi_Pp", "bearing_ratio", "t_req", "m", "n", "A1", "status"])
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        db = ProfileDatabase(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv'))
+        self.profiles = db.profiles
+        self.lengths = np.array([0, 500, 1500, 3000, 6000, 12000], dtype=float)
+
+    def assertRowsMatch(self, table, expected):
+        self.assertEqual(len(table), len(expected))
+        for row, exp in zip(table, expected):
+            for key, value in exp.items():
+                if isinstance(value, (float, int)):
+                    self.assertAlmostEqual(row[key], value, places=6, msg=key)
+                elif isinstance(value, str):
+                    self.assertEqual(row[key], value)
+
+    def test_tension(self):
+        table = tension_batch([1000, 2000], [800, 2000], 250, 400)
+        self.assertEqual(table[1]['yield']['phi_Pn'], calculate_tension(2000, 2000, 250, 400)['yield']['phi_Pn'])
+        self.assertAlmostEqual(table['phi_Pn'][0], calculate_tension(1000, 800, 250, 400)['phi_Pn'])
+
+    def test_compression(self):
+        p = self.profiles[3]
+        table = compression_batch(p.Ag, p.rx, p.ry, 1.0, self.lengths[1:], 1.0, self.lengths[1:], 240)
+        self.assertRowsMatch(table, [calculate_compression(p.Ag, p.rx, p.ry, 1.0, L, 1.0, L, 240) for L in self.lengths[1:]])
+
+    def test_flexure_all_zones(self):
+        for p in self.profiles:
+            table = flexure_batch(p, self.lengths, 1.0, 240)
+            self.assertRowsMatch(table, [calculate_flexure(p, L, 1.0, 240).to_dict() for L in self.lengths])
+
+    def test_flexure_profile_per_row(self):
+        table = flexure_batch(self.profiles, 4000, 1.14, 250)
+        self.assertRowsMatch(table, [calculate_flexure(p, 4000, 1.14, 250).to_dict() for p in self.profiles])
+
+    def test_combined(self):
+        Pu = np.array([1000, 50000, 400000])
+        table = combined_batch(self.profiles[5], Pu, 10e6, 1e6, 3000, 1.0, 1.0, 250)
+        self.assertRowsMatch(table, [calculate_combined(self.profiles[5], P, 10e6, 1e6, 3000, 1.0, 1.0, 250).to_dict() for P in Pu])
+
+    def test_connections(self):
+        self.assertRowsMatch(bolt_shear_batch([16, 20], 4, 372), [calculate_bolt_shear(d, 4, 372).to_dict() for d in (16, 20)])
+        self.assertRowsMatch(weld_batch(["Fillet", "Groove"], 490, 6, 100),
+                             [calculate_weld(t, 490, 6, 100).to_dict() for t in ("Fillet", "Groove")])
+        self.assertRowsMatch(base_plate_batch([500000, -1000], 25, 400, 400, 200, 200),
+                             [calculate_base_plate(P, 25, 400, 400, 200, 200).to_dict() for P in (500000, -1000)])
+        p = self.profiles[5]
+        self.assertRowsMatch(moment_plate_batch([40, 400], 16, 4, [20, 10], p),
+                             [calculate_moment_plate(40, 16, 4, 20, p).to_dict(), calculate_moment_plate(400, 16, 4, 10, p).to_dict()])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+import os
+import sys
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.bench_core import compare, write_synthetic_catalogue
+from core.profiles import ProfileDatabase
+from core.section_properties import cache_path
+
+class TestBenchmarks(unittest.TestCase):
+    def test_compare_flags_regression(self):
+        baseline = {"calc.tension.scalar": 1.0e-6, "calc.weld.scalar": 1.0e-6}
+        metrics = {"calc.tension.scalar": 1.5e-6, "calc.weld.scalar": 1.1e-6}
+        regressions = compare(metrics, baseline, threshold=25)
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(regressions[0][0], "calc.tension.scalar")
+
+    def test_compare_ignores_missing_metrics(self):
+        self.assertEqual(compare({}, {"db.load.100": 0.01}, threshold=25), [])
+
+    def test_synthetic_catalogue(self):
+        path = "test_catalogue.csv"
+        write_synthetic_catalogue(path, 50)
+        try:
+            db = ProfileDatabase(path)
+            self.assertEqual(len(db.profiles), 50)
+        finally:
+            os.remove(path)
+            os.remove(cache_path(path))
+
+if __name__ == '__main__':
+    unittest.main()
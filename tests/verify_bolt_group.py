@@ -0,0 +1,87 @@
+import unittest
+import math
+import os
+import sys
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import core.bolt_group as bolt_group
+from core.bolt_group import (
+    BoltGroup, elastic_coefficient, ic_coefficient, ic_coefficients,
+    eccentric_bolt_batch, calculate_eccentric_bolts, clear_cache
+)
+
+class TestBoltGroup(unittest.TestCase):
+    def setUp(self):
+        clear_cache()
+
+    def test_concentric_load(self):
+        group = BoltGroup.grid(4, 2, 75, 75)
+        self.assertEqual(ic_coefficient(group, 0.0), 8.0)
+        # A small eccentricity approaches n times the strength at the deformation limit
+        self.assertAlmostEqual(ic_coefficient(group, 0.1), 8 * (1 - math.exp(-3.4))**0.55, places=3)
+
+    def test_table_values(self):
+        # AISC Manual Table 7-6: one row of 6 bolts at 3 in, ex = 12 in -> C = 2.00
+        self.assertAlmostEqual(ic_coefficient(BoltGroup.grid(6, 1, 76.2), 12 * 25.4), 2.00, places=2)
+
+    def test_ic_exceeds_elastic(self):
+        group = BoltGroup.grid(4, 2, 75, 75)
+        for e in (50, 150, 400):
+            for angle in (0, 30, 75):
+                C = ic_coefficient(group, e, angle)
+                self.assertGreater(C, elastic_coefficient(group, e, angle))
+                self.assertLess(C, 8.0)
+
+    def test_converged(self):
+        group = BoltGroup.grid(5, 2, 80, 100)
+        C = ic_coefficient(group, 250, 20)
+        clear_cache()
+        bolt_group.MAX_ITER, bolt_group.TOLERANCE = 400, 1e-14
+        try:
+            self.assertAlmostEqual(ic_coefficient(group, 250, 20), C, places=9)
+        finally:
+            bolt_group.MAX_ITER, bolt_group.TOLERANCE = 60, 1e-10
+
+    def test_decreases_with_eccentricity(self):
+        C, _ = ic_coefficients(BoltGroup.grid(4, 2, 75, 75), np.linspace(10, 1000, 50))
+        self.assertTrue(np.all(np.diff(C) < 0))
+
+    def test_origin_independent(self):
+        group = BoltGroup.grid(3, 2, 75, 75)
+        shifted = BoltGroup([(x + 500, y - 200) for x, y in group.points])
+        self.assertAlmostEqual(ic_coefficient(group, 200, 45), ic_coefficient(shifted, 200, 45))
+
+    def test_batch_matches_scalar_and_uses_cache(self):
+        groups = [BoltGroup.grid(n, 2, 75, 75) for n in (2, 3, 4)] * 100
+        e = np.repeat([100.0, 200.0, 300.0], 100)
+        table = eccentric_bolt_batch(groups, e, 15, 20, 457)
+        self.assertEqual(len(table), 300)
+        # 3 groups x 3 eccentricities distinct cases
+        self.assertEqual(len(bolt_group._cache), 9)
+        for i in (0, 101, 299):
+            result = calculate_eccentric_bolts(groups[i], e[i], 15, 20, 457)
+            self.assertAlmostEqual(table["phi_Rn"][i], result.phi_Rn)
+        rn = 457 * math.pi * 20**2 / 4
+        self.assertAlmostEqual(table[0].rn, rn)
+        self.assertAlmostEqual(table[0].phi_Rn, 0.75 * table[0].C * rn)
+
+    def test_cache_is_bounded(self):
+        group = BoltGroup.grid(3, 2, 75, 75)
+        e = np.linspace(50, 400, 12)
+        expected = np.array([ic_coefficient(group, ei, 15) for ei in e])
+        clear_cache()
+        maxsize = bolt_group._cache.maxsize
+        bolt_group._cache.maxsize = 5
+        try:
+            C, _ = ic_coefficients(group, e, 15)
+            self.assertEqual(len(bolt_group._cache), 5)
+        finally:
+            bolt_group._cache.maxsize = maxsize
+        np.testing.assert_allclose(C, expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import os
+import shutil
+import sys
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.catalogue import FederatedCatalogue
+from core.checks import Member, evaluate_members
+from core.classification import classify_catalogue
+from core.profiles import ProfileDatabase
+from core.section_properties import cache_path
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+class TestFederatedCatalogue(unittest.TestCase):
+    def setUp(self):
+        # Two sources sharing section names
+        self.paths = {"SNI": "test_sni.csv", "JIS": "test_jis.csv"}
+        for path in self.paths.values():
+            shutil.copy(DB_PATH, path)
+        self.cat = FederatedCatalogue(self.paths)
+
+    def tearDown(self):
+        for path in self.paths.values():
+            for f in (path, cache_path(path)):
+                if os.path.exists(f):
+                    os.remove(f)
+
+    def test_profiles_match_profile_database(self):
+        db = ProfileDatabase(DB_PATH)
+        self.assertEqual(len(self.cat), 30)
+        for name in ("WF 200x100", "H-Beam 150x150", "HSS 100x100x4.5"):
+            expected = vars(db.get_profile(name))
+            actual = vars(self.cat.get_profile(name, standard="JIS"))
+            self.assertEqual(expected.keys(), actual.keys())
+            for key, value in expected.items():
+                if isinstance(value, float) and value != value:
+                    self.assertNotEqual(actual[key], actual[key])  # NaN rts of closed sections
+                else:
+                    self.assertEqual(value, actual[key], key)
+
+    def test_query_by_standard_type_and_dimension(self):
+        rows = self.cat.query(standard="JIS", section_type="WF", d=(200, 300))
+        self.assertEqual(self.cat.names(rows), ["WF 200x100", "WF 250x125", "WF 300x150"])
+        self.assertTrue(all(self.cat.standard(i) == "JIS" for i in rows))
+        self.assertEqual(len(self.cat.query(section_type=["HSS", "H-Beam"])), 12)
+        self.assertEqual(len(self.cat.query(standard="EN")), 0)
+        self.assertEqual(len(self.cat.get_all_names()), 15)
+
+    def test_names_interned_and_profiles_shared(self):
+        names = self.cat.names()
+        self.assertIs(names[0], names[15])
+        self.assertIs(self.cat.get_profile("WF 200x100"), self.cat.get_profile("WF 200x100", standard="SNI"))
+        self.assertIsNot(self.cat.get_profile("WF 200x100", standard="SNI"),
+                         self.cat.get_profile("WF 200x100", standard="JIS"))
+
+    def test_get_profiles_like_profile_database(self):
+        db = ProfileDatabase(DB_PATH)
+        self.assertEqual([p.name for p in self.cat.get_profiles("HSS", standard="SNI")],
+                         [p.name for p in db.get_profiles("HSS")])
+        self.assertEqual(len(self.cat.get_profiles()), 30)
+        self.assertEqual(len(db.get_profiles()), 15)
+        table = classify_catalogue(self.cat, grades=(240.0,))
+        self.assertTrue(all(p in table for p in self.cat.get_profiles()))
+
+    def test_usable_as_profile_database(self):
+        res = evaluate_members([Member("B1", "flexure", "WF 200x100", {"L": 3000, "Mu": 20e6})], self.cat)
+        self.assertEqual(res[0].status, "OK")
+        self.assertNotEqual(self.cat.version, FederatedCatalogue({"SNI": self.paths["SNI"]}).version)
+
+if __name__ == '__main__':
+    unittest.main()
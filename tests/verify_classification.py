@@ -0,0 +1,146 @@
+import unittest
+import math
+import os
+import sys
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.batch import flexure_batch, combined_batch
+from core.calculations import calculate_flexure, calculate_combined, calculate_compression
+from core.checks import Member, evaluate_members
+from core.classification import (
+    COMPACT, NONCOMPACT, SLENDER, E_STEEL, ClassificationTable, classify_catalogue,
+    local_buckling, section_classes, effective_area_ratio
+)
+from core.profiles import ProfileDatabase, SteelProfile
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+def plate_girder(name, d, bf, tw, tf):
+    """Welded I-section (no fillets) in catalogue units."""
+    h = d - 2 * tf
+    Ag = 2 * bf * tf + h * tw
+    Ix = (bf * d**3 - (bf - tw) * h**3) / 12
+    Iy = (2 * tf * bf**3 + h * tw**3) / 12
+    Zx = bf * tf * (d - tf) + tw * h**2 / 4
+    Zy = tf * bf**2 / 2 + h * tw**2 / 4
+    return SteelProfile(name, Ag * 7.85e-3, d, bf, tw, tf, Ag / 100, Ix / 1e4, Iy / 1e4,
+                        math.sqrt(Ix / Ag) / 10, math.sqrt(Iy / Ag) / 10, Zx / 1e3, Zy / 1e3)
+
+class TestClassification(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = ProfileDatabase(DB_PATH)
+        cls.noncompact = plate_girder("PG noncompact flange", 400, 300, 10, 8)    # bf/2tf = 18.75
+        cls.slender = plate_girder("PG slender flange", 400, 300, 10, 4.5)        # bf/2tf = 33.3
+        cls.slender_web = plate_girder("PG slender web", 1200, 300, 6, 20)        # h/tw = 193
+
+    def test_catalogue_is_classified_per_grade(self):
+        table = classify_catalogue(self.db, grades=(240.0, 410.0))
+        profiles = self.db.profiles
+        self.assertTrue(all(p in table for p in profiles))
+        # Hot-rolled catalogue sections are compact in flexure at both grades
+        for Fy in (240, 410):
+            data = local_buckling(profiles, Fy)
+            self.assertTrue(np.all(data["flange"] == COMPACT))
+            self.assertTrue(np.all(data["flb"] == 1.0))
+        self.assertEqual(section_classes(self.db.get_profile("WF 200x100"), 240)["flange"], "Compact")
+
+    def test_flange_classes(self):
+        s = math.sqrt(E_STEEL / 240)
+        self.assertTrue(0.38 * s < 18.75 < s)
+        self.assertEqual(int(local_buckling(self.noncompact, 240)["flange"]), NONCOMPACT)
+        self.assertEqual(int(local_buckling(self.slender, 240)["flange"]), SLENDER)
+        # The limits scale with sqrt(E / Fy): the same flange is slender at a high grade
+        self.assertEqual(section_classes(plate_girder("PG 2", 400, 300, 10, 5.5), 240)["flange"], "Noncompact")
+        self.assertEqual(section_classes(plate_girder("PG 2", 400, 300, 10, 5.5), 410)["flange"], "Slender")
+
+    def test_noncompact_flange_flexure(self):
+        p = self.noncompact
+        s = math.sqrt(E_STEEL / 240)
+        Mp = 240 * p.Zx
+        expected = Mp - (Mp - 0.7 * 240 * p.Sx) * (18.75 - 0.38 * s) / (s - 0.38 * s)  # F3-1
+        result = calculate_flexure(p, 500, 1.0, 240)
+        self.assertEqual(result.state, "Flange local buckling")
+        self.assertAlmostEqual(result.Mn, expected, delta=1e-6 * expected)
+
+    def test_slender_flange_flexure(self):
+        p = self.slender
+        kc = 4 / math.sqrt((400 - 9) / 10)
+        expected = 0.9 * E_STEEL * kc * p.Sx / (300 / 9)**2  # F3-2
+        self.assertAlmostEqual(calculate_flexure(p, 500, 1.0, 240).Mn, expected, delta=1e-6 * expected)
+
+    def test_slender_web_flexure(self):
+        p = self.slender_web
+        self.assertEqual(int(local_buckling(p, 240)["web"]), SLENDER)
+        aw = 1160 * 6 / (300 * 20)
+        Rpg = 1 - aw / (1200 + 300 * aw) * (1160 / 6 - 5.7 * math.sqrt(E_STEEL / 240))
+        result = calculate_flexure(p, 500, 1.0, 240)
+        self.assertEqual(result.state, "Web local buckling")
+        self.assertAlmostEqual(result.Mn, Rpg * 240 * p.Sx, delta=1e-6 * result.Mn)
+
+    def test_batch_matches_scalar(self):
+        profiles = [self.noncompact, self.slender, self.slender_web, self.db.get_profile("WF 300x150")]
+        lengths = [500, 3000, 9000, 15000]
+        table = flexure_batch(profiles, lengths, 1.0, 240)
+        for i, (p, L) in enumerate(zip(profiles, lengths)):
+            row = calculate_flexure(p, L, 1.0, 240)
+            self.assertAlmostEqual(table[i].Mn, row.Mn, delta=1e-9 * row.Mn)
+            self.assertEqual(table[i].state, row.state)
+        # Fy per row evaluates the stored ratios directly
+        Fy = np.array([240.0, 290.0, 410.0])
+        per_row = local_buckling([self.noncompact] * 3, Fy)
+        for k, F in enumerate(Fy):
+            self.assertAlmostEqual(per_row["flb"][k], float(local_buckling(self.noncompact, F)["flb"]))
+
+    def test_slender_compression(self):
+        p = self.slender
+        self.assertEqual(section_classes(p, 240)["compression"], "Slender")
+        Fcr = calculate_compression(p.Ag, p.rx, p.ry, 1.0, 2000, 1.0, 2000, 240).Fcr
+        ratio = float(effective_area_ratio(p, 240, Fcr))
+        self.assertLess(ratio, 1.0)
+        self.assertGreater(ratio, 0.5)
+        self.assertEqual(float(effective_area_ratio(self.db.get_profile("WF 300x150"), 240, 200.0)), 1.0)
+        # combined uses the effective area and the minor axis flange local buckling strength
+        result = calculate_combined(p, 100000, 50e6, 5e6, 2000, 1.0, 1.0, 240)
+        phi_Pn = calculate_compression(p.Ag, p.rx, p.ry, 1.0, 2000, 1.0, 2000, 240).phi_Pn
+        self.assertAlmostEqual(result.phi_Pn, phi_Pn * ratio)
+        self.assertLess(result.phi_Mny, 0.9 * 240 * p.Zy)
+        table = combined_batch(p, 100000, 50e6, 5e6, 2000, 1.0, 1.0, 240)
+        self.assertAlmostEqual(table[0].ratio, result.ratio)
+
+    def test_compression_member_matches_zero_moment_combined(self):
+        # WF 250x125 has a slender web at Fy = 450
+        p = self.db.get_profile("WF 250x125")
+        Fcr = calculate_compression(p.Ag, p.rx, p.ry, 1.0, 1000, 1.0, 1000, 450).Fcr
+        self.assertLess(float(effective_area_ratio(p, 450, Fcr)), 1.0)
+        params = {"Pu": 1.3e6, "Fy": 450, "L": 1000}
+        compression, combined = evaluate_members(
+            [Member("C", "compression", p.name, params), Member("B", "combined", p.name, params)], self.db)
+        self.assertAlmostEqual(compression.ratio, combined.ratio)
+        self.assertAlmostEqual(compression.result.phi_Pn, combined.result.phi_Pn)
+
+    def test_table_grows_in_batches(self):
+        table = ClassificationTable()
+        table.grade(240)  # grades computed before sections are added are extended
+        table.add(self.db.get_profiles("WF"))
+        n = len(table)
+        table.add(self.db.get_profiles("WF") + [self.slender])
+        self.assertEqual(len(table), n + 1)
+        self.assertEqual(int(table.lookup(self.slender, 240)["flange"]), SLENDER)
+        self.assertEqual(len(table.grade(240)["flb"]), n + 1)
+
+    def test_only_standard_grades_kept(self):
+        table = ClassificationTable()
+        table.add(self.db.get_profiles("WF"))
+        p = self.db.get_profile("WF 250x125")
+        for Fy in (240, 333.3, 451.7):
+            data = table.lookup(p, Fy)
+            self.assertAlmostEqual(float(data["flb"]), float(table.lookup([p], np.array([Fy]))["flb"][0]))
+        self.assertEqual(sorted(table._grades), [240.0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import os
+import sys
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.classification import E_STEEL
+from core.frame import Frame2D
+from core.profiles import ProfileDatabase
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+class TestFrame(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = ProfileDatabase(DB_PATH)
+        cls.profile = cls.db.get_profile("WF 300x150")
+
+    def cantilever(self, n=10, L=4000.0):
+        nodes = np.column_stack([np.linspace(0, L, n + 1), np.zeros(n + 1)])
+        return Frame2D(nodes, [(i, i + 1) for i in range(n)], self.profile, {0: (1, 1, 1)})
+
+    def test_cantilever_load_cases(self):
+        frame = self.cantilever()
+        loads = np.zeros((2, 11, 3))
+        loads[0, -1, 1] = -10000
+        loads[1, -1, 0] = 5000
+        result = frame.analyze(loads)
+        self.assertAlmostEqual(result.displacements[0, -1, 1], -10000 * 4000**3 / (3 * E_STEEL * self.profile.Ix))
+        np.testing.assert_allclose(result.reactions[0, 0], [0, 10000, 4e7], atol=1e-6)
+        forces = result.design_forces(0)
+        self.assertAlmostEqual(forces["Mu"][0], 4e7)
+        # Tension is reported as negative Pu
+        np.testing.assert_allclose(result.design_forces(1)["Pu"], -5000)
+
+    def test_fixed_beam_distributed_load(self):
+        frame = Frame2D([[0, 0], [3000, 0], [6000, 0]], [(0, 1), (1, 2)], self.profile,
+                        {0: (1, 1, 1), 2: (1, 1, 1)})
+        result = frame.analyze(member_loads=[[0, -10.0], [0, -10.0]])
+        forces = result.design_forces()
+        wL2 = 10 * 6000**2
+        np.testing.assert_allclose(forces["M1"], [-wL2 / 12, wL2 / 24])
+        np.testing.assert_allclose(forces["Mu"], wL2 / 12)
+        self.assertAlmostEqual(result.displacements[0, 1, 1], -10 * 6000**4 / (384 * E_STEEL * self.profile.Ix))
+        np.testing.assert_allclose(result.reactions[0, :, 1].sum(), 60000)
+
+    def test_portal_frame_equilibrium(self):
+        frame = Frame2D.grid(2, 3, 6000, 3500, self.profile, self.db.get_profile("WF 400x200"))
+        loads = np.zeros((len(frame.nodes), 3))
+        loads[frame.nodes[:, 0] == 0, 0] = 20000
+        # Columns come first in the member list, then the beams
+        q = np.zeros((len(frame.members), 2))
+        q[3 * 3:, 1] = -15.0
+        result = frame.analyze(loads, q)
+        # Base reactions balance the applied loads
+        R = result.reactions[0]
+        self.assertAlmostEqual(R[:, 0].sum(), -loads[:, 0].sum(), delta=1e-6)
+        self.assertAlmostEqual(R[:, 1].sum(), 15.0 * frame.lengths[3 * 3:].sum(), delta=1e-4)
+
+    def test_banded_solve_matches_dense(self):
+        frame = Frame2D.grid(6, 20, 6000, 3500, self.profile, self.profile)
+        rows, cols, values = frame.stiffness()
+        K = np.zeros((frame.n_free, frame.n_free))
+        np.add.at(K, (rows, cols), values)
+        self.assertGreater(frame.n_free, 2 * frame.factorize().m)
+        b = np.random.default_rng(0).normal(size=(frame.n_free, 3))
+        np.testing.assert_allclose(frame.factorize().solve(b), np.linalg.solve(K, b), rtol=1e-8, atol=1e-14)
+        # The factor is reused by later analyses
+        factor = frame.factorize()
+        frame.analyze(np.ones((len(frame.nodes), 3)))
+        self.assertIs(frame._factor, factor)
+
+    def test_unstable_frame(self):
+        frame = Frame2D([[0, 0], [3000, 0]], [(0, 1)], self.profile, {0: (1, 1, 0)})
+        with self.assertRaises(ValueError):
+            frame.analyze(np.zeros((2, 3)))
+
+    def test_member_checks(self):
+        frame = Frame2D.grid(2, 2, 6000, 3500, self.profile, self.profile)
+        result = frame.analyze(member_loads=[0, -20.0])
+        table = frame.check_members(result, Fy=240)
+        self.assertEqual(len(table["ratio"]), len(frame.members))
+        self.assertTrue(np.all(table["ratio"] > 0))
+
+if __name__ == '__main__':
+    unittest.main()
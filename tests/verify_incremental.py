@@ -0,0 +1,106 @@
+import unittest
+import os
+import sys
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.calculations import calculate_combined
+from core.checks import Member, MemberResult, evaluate_members
+from core.incremental import IncrementalChecker
+from core.profiles import ProfileDatabase
+from core.store import ResultStore
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+class TestChecks(unittest.TestCase):
+    def test_evaluate_matches_scalar(self):
+        db = ProfileDatabase(DB_PATH)
+        m = Member("C1", "combined", "WF 200x100", {"Pu": 100000, "Mux": 20e6, "L": 3000, "Fy": 250})
+        res = evaluate_members([m], db)[0]
+        expected = calculate_combined(db.get_profile("WF 200x100"), 100000, 20e6, 0, 3000, 1.0, 1.0, 250)
+        self.assertAlmostEqual(res.ratio, expected['ratio'])
+        self.assertEqual(res.status, expected['status'])
+
+    def test_unknown_profile(self):
+        db = ProfileDatabase(DB_PATH)
+        with self.assertRaises(ValueError):
+            evaluate_members([Member("X", "tension", "WF 999x999", {"Pu": 1})], db)
+
+    def test_missing_length_rejected(self):
+        db = ProfileDatabase(DB_PATH)
+        with self.assertRaisesRegex(ValueError, "'Lx' or 'L' for member c1"):
+            evaluate_members([Member("c1", "compression", "WF 250x125", {"Pu": 1.3e5, "Fy": 250})], db)
+        with self.assertRaisesRegex(ValueError, "'Lb' or 'L'"):
+            evaluate_members([Member("b1", "flexure", "WF 250x125", {"Mu": 1e6})], db)
+        # Optional inputs still take their defaults
+        res = evaluate_members([Member("c2", "compression", "WF 250x125", {"Pu": 1.3e5, "L": 3000})], db)[0]
+        self.assertEqual(res.status, "OK")
+
+class TestIncremental(unittest.TestCase):
+    def setUp(self):
+        self.db = ProfileDatabase(DB_PATH)
+        self.members = [
+            Member(f"B{i}", "flexure", "WF 250x125", {"Lb": 2000 + 100 * i, "Mu": 30e6, "Fy": 240})
+            for i in range(20)
+        ]
+
+    def test_only_changed_members_recomputed(self):
+        checker = IncrementalChecker(self.db)
+        first = checker.run(self.members)
+        self.assertEqual(len(first.recomputed), 20)
+
+        self.members[3].params["Mu"] = 90e6
+        second = checker.run(self.members)
+        self.assertEqual(second.recomputed, ["B3"])
+        self.assertEqual(len(second.results), 20)
+        self.assertEqual([(c.member_id, c.old_status, c.new_status) for c in second.changes], [("B3", "OK", "NOT SAFE")])
+
+    def test_removed_members_and_persistence(self):
+        checker = IncrementalChecker(self.db)
+        checker.run(self.members)
+        filename = "test_incremental_state.json"
+        checker.save(filename)
+        try:
+            reloaded = IncrementalChecker(self.db)
+            reloaded.load(filename)
+        finally:
+            os.remove(filename)
+        report = reloaded.run(self.members[:-1])
+        self.assertEqual(report.recomputed, [])
+        self.assertEqual(report.removed, ["B19"])
+
+    def test_load_run_save_round_trip(self):
+        members = self.members + [
+            Member("T1", "tension", "WF 200x100", {"Pu": 150000, "Fy": 240, "Fu": 370}),
+            Member("C1", "combined", "WF 200x100", {"Pu": 100000, "Mux": 20e6, "L": 3000}),
+        ]
+        checker = IncrementalChecker(self.db)
+        first = checker.run(members)
+        filename = "test_incremental_round_trip.json"
+        checker.save(filename)
+        try:
+            reloaded = IncrementalChecker(self.db)
+            reloaded.load(filename)
+            members[0].params["Mu"] = 90e6
+            report = reloaded.run(members)
+            reloaded.save(filename)
+        finally:
+            os.remove(filename)
+        self.assertEqual(report.recomputed, ["B0"])
+        self.assertTrue(all(isinstance(r, MemberResult) for r in report.results.values()))
+        self.assertEqual(report.results["T1"].to_dict(), first.results["T1"].to_dict())
+        self.assertEqual(report.results["C1"].result.status, first.results["C1"].result.status)
+
+        store = ResultStore(":memory:")
+        run_id = store.start_run("round trip")
+        self.assertEqual(store.add_results(run_id, [report.results[m.id] for m in members], members), len(members))
+
+    def test_catalogue_change_invalidates(self):
+        checker = IncrementalChecker(self.db)
+        checker.run(self.members)
+        self.db.version = "edited"
+        self.assertEqual(len(checker.run(self.members).recomputed), 20)
+
+if __name__ == '__main__':
+    unittest.main()
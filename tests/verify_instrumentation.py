@@ -0,0 +1,52 @@
+import unittest
+import os
+import sys
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core import instrumentation
+from core.calculations import calculate_combined
+from core.profiles import ProfileDatabase
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled_records_nothing(self):
+        instrumentation.disable()
+        ProfileDatabase(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv'))
+        self.assertEqual(instrumentation.get_timers(), {})
+        self.assertEqual(instrumentation.get_counters(), {})
+
+    def test_stage_timers_and_folded_stacks(self):
+        instrumentation.enable()
+        db = ProfileDatabase(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv'))
+        p = db.get_profile("WF 200x100")
+        calculate_combined(p, 100000, 20e6, 0, 3000, 1.0, 1.0, 240)
+
+        timers = instrumentation.get_timers()
+        self.assertEqual(timers[("parse", "profiles_csv")]["calls"], 1)
+        # Only the WF partition has been built
+        self.assertEqual(timers[("derive", "SteelProfile")]["calls"], len(db.get_all_names("WF")))
+        self.assertEqual(timers[("calc", "combined")]["calls"], 1)
+        self.assertEqual(timers[("calc", "flexure")]["calls"], 1)
+        self.assertEqual(instrumentation.get_counters()["parse.rows"], 15)
+        self.assertIn("calc", instrumentation.summary())
+
+        filename = "test_stacks.folded"
+        instrumentation.dump_folded(filename)
+        try:
+            with open(filename) as f:
+                stacks = [line.rsplit(" ", 1)[0] for line in f]
+        finally:
+            os.remove(filename)
+        self.assertIn("parse:partition;derive:SteelProfile", stacks)
+        self.assertIn("calc:combined;calc:compression", stacks)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import os
+import sys
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.calculations import calculate_combined
+from core.interaction import InteractionCache, surface_key
+from core.plotting import create_interaction_plot
+from core.profiles import ProfileDatabase
+import matplotlib.figure
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+class TestInteraction(unittest.TestCase):
+    def setUp(self):
+        self.db = ProfileDatabase(DB_PATH)
+        self.cache = InteractionCache(self.db)
+
+    def test_ratios_match_calculate_combined(self):
+        p = self.db.get_profile("WF 200x100")
+        surface = self.cache.get("WF 200x100", 3000, 1.0, 1.14, 250)
+        rng = np.random.default_rng(0)
+        Pu, Mux, Muy = rng.uniform(0, 4e5, 50), rng.uniform(0, 5e7, 50), rng.uniform(0, 5e6, 50)
+        ratios = surface.ratio(Pu, Mux, Muy)
+        for i in range(0, 50, 7):
+            expected = calculate_combined(p, Pu[i], Mux[i], Muy[i], 3000, 1.0, 1.14, 250)["ratio"]
+            self.assertAlmostEqual(ratios[i], expected)
+
+    def test_tension_rejected(self):
+        surface = self.cache.get("WF 200x100", 3000)
+        with self.assertRaises(ValueError):
+            surface.ratio(-5e5, 9e7, 0)
+        with self.assertRaises(ValueError):
+            surface.contains([1e5, -5 * surface.phi_Pn], [0, 0], [0, 0])
+        with self.assertRaises(ValueError):
+            self.cache.ratios([("WF 200x100", 3000)], [-1.0], [0.0], [0.0])
+
+    def test_mesh_lies_on_surface(self):
+        surface = self.cache.get("WF 250x125", 4000)
+        P, Mx, My = surface.mesh(9)
+        np.testing.assert_allclose(surface.ratio(P, Mx, My), 1.0)
+
+    def test_many_keys_one_pass_and_points_per_surface(self):
+        keys = [("WF 200x100", 3000), ("WF 250x125", 3000), ("WF 200x100", 3000.0)]
+        surfaces = self.cache.get_many(keys)
+        self.assertEqual(len(self.cache), 2)
+        self.assertIs(surfaces[0], surfaces[2])
+        ratios = self.cache.ratios(keys, [1e5] * 3, [2e7] * 3, [0] * 3)
+        self.assertEqual(ratios[0], ratios[2])
+        self.assertLess(ratios[1], ratios[0])
+
+    def test_save_and_load(self):
+        self.cache.get("WF 200x100", 3000)
+        path = "test_surfaces.json"
+        try:
+            self.cache.save(path)
+            other = InteractionCache(self.db)
+            self.assertEqual(other.load(path), 1)
+            self.assertIn(surface_key("WF 200x100", 3000), other)
+            self.db.version = "edited"
+            self.assertEqual(InteractionCache(self.db).load(path), 0)
+        finally:
+            os.remove(path)
+
+    def test_plot(self):
+        surface = self.cache.get("WF 200x100", 3000)
+        fig = create_interaction_plot(surface, [1e5, 4e5], [2e7, 4e7], [0, 1e6])
+        self.assertIsInstance(fig, matplotlib.figure.Figure)
+
+if __name__ == '__main__':
+    unittest.main()
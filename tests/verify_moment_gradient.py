@@ -0,0 +1,58 @@
+import unittest
+import os
+import sys
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.batch import flexure_batch
+from core.calculations import calculate_flexure
+from core.frame import Frame2D
+from core.moment_gradient import (
+    quarter_point_moments, moment_gradient_factors, moment_gradient_factor, flexure_from_diagrams
+)
+from core.profiles import ProfileDatabase
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+class TestMomentGradient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = ProfileDatabase(DB_PATH)
+
+    def test_standard_diagrams(self):
+        x = np.linspace(0, 1, 101)
+        diagrams = np.stack([np.ones_like(x), x, 1 - 2 * x, x * (1 - x)])
+        # Uniform moment, linear to zero, full reverse curvature, uniform load (AISC Table 3-1)
+        np.testing.assert_allclose(moment_gradient_factors(diagrams), [1.0, 12.5 / 7.5, 12.5 / 5.5, 12.5 / 11])
+        self.assertEqual(moment_gradient_factor(np.zeros(5)), 1.0)
+
+    def test_quarter_point_interpolation(self):
+        np.testing.assert_allclose(quarter_point_moments([[0, 10]]), [[2.5, 5.0, 7.5]])
+        # Uneven sample positions
+        np.testing.assert_allclose(quarter_point_moments([[0, 10, 0]], x=[0, 1, 3]), [[7.5, 7.5, 3.75]])
+        self.assertAlmostEqual(moment_gradient_factor([0, 10, 0], x=[0, 1, 3]),
+                               125 / (25 + 3 * 7.5 + 4 * 7.5 + 3 * 3.75))
+
+    def test_flexure_from_diagrams(self):
+        profile = self.db.get_profile("WF 300x150")
+        diagrams = np.outer([1.0, -1.0, 0.5], np.linspace(1, -1, 9)) * 1e8
+        table = flexure_from_diagrams(profile, diagrams, 6000, 240)
+        Cb = moment_gradient_factors(diagrams)
+        np.testing.assert_allclose(table["Mn"], flexure_batch(profile, 6000, Cb, 240)["Mn"])
+        self.assertAlmostEqual(table[0].Mn, calculate_flexure(profile, 6000, Cb[0], 240).Mn)
+        self.assertGreater(table[0].Mn, calculate_flexure(profile, 6000, 1.0, 240).Mn)
+
+    def test_frame_members(self):
+        profile = self.db.get_profile("WF 300x150")
+        frame = Frame2D([[0, 0], [6000, 0]], [(0, 1)], profile, {0: (1, 1, 1), 1: (1, 1, 1)})
+        result = frame.analyze(member_loads=[[0, -10.0]])
+        diagram = result.moment_diagrams(points=5)[0]
+        np.testing.assert_allclose(diagram[[0, 2, 4]], [-3e7, 1.5e7, -3e7])
+        # Fixed-end beam under uniform load: Cb = 2.38
+        self.assertAlmostEqual(moment_gradient_factors(result.moment_diagrams())[0], 2.38, places=2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import itertools
+import os
+import sys
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.calculations import calculate_tension
+from core.net_section import (
+    HolePattern, critical_path, effective_hole, net_area, shear_lag_factor,
+    effective_net_areas, net_tension_batch
+)
+from core.profiles import ProfileDatabase
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+def brute_force_loss(pattern):
+    lines = sorted(range(len(pattern.gauges)), key=lambda i: pattern.gauges[i])
+    best = 0.0
+    for r in range(1, len(lines) + 1):
+        for subset in itertools.combinations(lines, r):
+            for xs in itertools.product(*[pattern.pitches[i] for i in subset]):
+                loss = pattern.hole * r
+                for k in range(1, r):
+                    g = pattern.gauges[subset[k]] - pattern.gauges[subset[k - 1]]
+                    loss -= (xs[k] - xs[k - 1])**2 / (4 * g)
+                best = max(best, loss)
+    return best
+
+class TestNetSection(unittest.TestCase):
+    def test_staggered_chain(self):
+        # Four lines at g = 75 with a 40 mm stagger: zig-zag loss = 4 * 24 - 3 * 40^2 / 300
+        pattern = HolePattern.grid([0, 75, 150, 225], 1, 0.0, effective_hole(20), stagger=40)
+        path = critical_path(pattern)
+        self.assertAlmostEqual(path.loss, 80.0)
+        self.assertEqual([line for line, _ in path.holes], [0, 1, 2, 3])
+
+    def test_matches_exhaustive_enumeration(self):
+        rng = np.random.default_rng(0)
+        for _ in range(100):
+            n = int(rng.integers(1, 5))
+            gauges = rng.permutation(np.arange(n) * 60.0 + rng.uniform(0, 30))
+            pitches = [rng.uniform(0, 300, int(rng.integers(0, 4))) for _ in range(n)]
+            pattern = HolePattern(gauges, pitches, 22.0)
+            self.assertAlmostEqual(critical_path(pattern).loss, brute_force_loss(pattern))
+
+    def test_shear_lag_table(self):
+        db = ProfileDatabase(DB_PATH)
+        self.assertEqual(shear_lag_factor(db.get_profile("WF 200x100"), "flanges", 3), 0.85)
+        self.assertEqual(shear_lag_factor(db.get_profile("H-Beam 150x150"), "flanges", 3), 0.90)
+        self.assertEqual(shear_lag_factor(db.get_profile("WF 200x100"), "web", 4), 0.70)
+        self.assertGreater(shear_lag_factor(db.get_profile("WF 200x100"), "flanges", 2, l=300), 0.85)
+        with self.assertRaises(ValueError):
+            shear_lag_factor(db.get_profile("WF 200x100"), "web", 2)
+        self.assertAlmostEqual(shear_lag_factor(db.get_profile("HSS 150x150x6"), "gusset", l=300), 1 - 56.25 / 300)
+
+    def test_batch_matches_scalar(self):
+        db = ProfileDatabase(DB_PATH)
+        profiles = db.get_profiles("WF")
+        patterns = [HolePattern.grid([0, 50], 3, 60, effective_hole(16), stagger=30) if i % 2 else None
+                    for i in range(len(profiles))]
+        table = net_tension_batch(profiles, patterns, 0.85, 240, 370)
+        An, Ae = effective_net_areas(profiles, patterns, 0.85)
+        for i, p in enumerate(profiles):
+            self.assertAlmostEqual(An[i], net_area(p.Ag, p.tf, patterns[i], elements=2))
+            expected = calculate_tension(p.Ag, 0.85 * An[i], 240, 370)
+            self.assertEqual(table[i].to_dict(), expected.to_dict())
+
+if __name__ == '__main__':
+    unittest.main()
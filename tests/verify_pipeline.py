@@ -0,0 +1,75 @@
+import unittest
+import os
+import sys
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.calculations import calculate_combined, calculate_bolt_shear, calculate_base_plate
+from core.pipeline import DesignPipeline, run_pipeline
+from core.profiles import ProfileDatabase
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+STRUCTURE = {
+    "load_combinations": {"1.4D": {"D": 1.4}, "1.2D+1.6L": {"D": 1.2, "L": 1.6}},
+    "members": [
+        {"id": "C1", "profile": "WF 200x100", "level": "1", "params": {"L": 3000, "Fy": 240},
+         "loads": {"D": {"P": 50000, "Mx": 5e6}, "L": {"P": 30000, "Mx": 4e6}}},
+        {"id": "C2", "profile": "WF 150x75", "level": "2", "params": {"L": 4000, "Fy": 240},
+         "loads": {"D": {"P": 150000, "Mx": 10e6}, "L": {"P": 10000}}},
+    ],
+    "connections": [
+        {"id": "J1", "type": "bolt_shear", "params": {"db": 20, "n": 4, "Fnv": 372}, "loads": {"D": {"V": 100000}}},
+    ],
+    "supports": [
+        {"id": "S1", "profile": "WF 200x100", "params": {"fc": 25, "B": 300, "N": 300},
+         "loads": {"D": {"P": 200000}, "L": {"P": 100000}}},
+    ],
+}
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self):
+        self.db = ProfileDatabase(DB_PATH)
+
+    def test_results_match_scalar_checks(self):
+        records = []
+        summary = run_pipeline(STRUCTURE, self.db, sink=records.extend)
+        by_id = {r["id"]: r for r in records}
+        self.assertEqual(summary.items, 4)
+
+        p = self.db.get_profile("WF 200x100")
+        expected = calculate_combined(p, 1.2 * 50000 + 1.6 * 30000, 1.2 * 5e6 + 1.6 * 4e6, 0, 3000, 1.0, 1.0, 240)
+        self.assertAlmostEqual(by_id["C1"]["ratio"], expected["ratio"])
+        self.assertEqual(by_id["C1"]["combination"], "1.2D+1.6L")
+
+        self.assertAlmostEqual(by_id["J1"]["ratio"], 1.4 * 100000 / calculate_bolt_shear(20, 4, 372)["phi_Rn"])
+        bp = calculate_base_plate(1.2 * 200000 + 1.6 * 100000, 25, 300, 300, p.d, p.bf)
+        self.assertAlmostEqual(by_id["S1"]["ratio"], bp["bearing_ratio"])
+        self.assertEqual(summary.worst[0]["ratio"], max(r["ratio"] for r in records))
+
+    def test_streams_in_small_batches(self):
+        members = [dict(STRUCTURE["members"][i % 2], id=f"M{i}") for i in range(500)]
+        structure = dict(STRUCTURE, members=members)
+        summary = DesignPipeline(self.db, batch_size=16, queue_size=1).run(structure)
+        self.assertEqual(summary.items, 502)
+        self.assertEqual(sum(n for (kind, _), n in summary.counts.items() if kind == "member"), 500)
+        self.assertEqual(len(summary.worst), 20)
+
+    def test_stage_error_is_raised(self):
+        structure = dict(STRUCTURE, members=[dict(STRUCTURE["members"][0], profile="WF 999x999")])
+        with self.assertRaises(ValueError):
+            run_pipeline(structure, self.db)
+        with self.assertRaises(ValueError):
+            run_pipeline({"members": STRUCTURE["members"]}, self.db)
+
+    def test_missing_parameter_is_rejected(self):
+        member = dict(STRUCTURE["members"][0], params={"Fy": 240})
+        with self.assertRaisesRegex(ValueError, "'Lx' or 'L' for member C1"):
+            run_pipeline(dict(STRUCTURE, members=[member]), self.db)
+        connection = dict(STRUCTURE["connections"][0], params={"db": 20, "Fnv": 372})
+        with self.assertRaisesRegex(ValueError, "'n' for connection J1"):
+            run_pipeline(dict(STRUCTURE, connections=[connection]), self.db)
+
+if __name__ == '__main__':
+    unittest.main()
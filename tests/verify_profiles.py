@@ -0,0 +1,68 @@
+import unittest
+import csv
+import math
+import os
+import sys
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.batch import flexure_batch
+from core.calculations import calculate_flexure
+from core.profiles import ProfileDatabase
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+class TestProfileDatabase(unittest.TestCase):
+    def test_all_types_loaded(self):
+        db = ProfileDatabase(DB_PATH)
+        self.assertEqual(db.section_types, ["WF", "H-Beam", "HSS"])
+        self.assertEqual(len(db.get_all_names()), 15)
+        self.assertEqual(db.get_all_names("HSS"), ["HSS 100x100x4.5", "HSS 125x125x6", "HSS 150x150x6"])
+        self.assertEqual(db.get_profile("H-Beam 125x125").section_type, "H-Beam")
+        self.assertIsNone(db.get_profile("WF 999x999"))
+
+    def test_partitions_built_on_first_access(self):
+        db = ProfileDatabase(DB_PATH)
+        self.assertEqual(db.loaded_types, [])
+        db.get_profile("WF 200x100")
+        self.assertEqual(db.loaded_types, ["WF"])
+        self.assertIs(db.get_profile("WF 200x100"), db.get_profile("WF 200x100"))
+        self.assertEqual(len(db.profiles), 15)
+        self.assertEqual(sorted(db.loaded_types), ["H-Beam", "HSS", "WF"])
+
+    def test_reordered_columns_and_multiline_fields(self):
+        with open(DB_PATH) as f:
+            header, *rows = list(csv.reader(f))
+        order = [header.index(k) for k in header[2:]] + [1, 0]  # name and type moved to the end
+        path = "test_profiles_reordered.csv"
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow([header[i] for i in order] + ["note"])
+            for n, row in enumerate(rows):
+                writer.writerow([row[i] for i in order] + ["rolled\nsection" if n == 0 else ""])
+        try:
+            db = ProfileDatabase(path)
+            self.assertEqual(db.section_types, ["WF", "H-Beam", "HSS"])
+            self.assertEqual(len(db.get_all_names()), 15)
+            p = db.get_profile("WF 100x50")
+        finally:
+            os.remove(path)
+            if os.path.exists(path + ".props.npz"):
+                os.remove(path + ".props.npz")
+        self.assertEqual(p.d, ProfileDatabase(DB_PATH).get_profile("WF 100x50").d)
+
+    def test_hss_flexure_without_ltb(self):
+        db = ProfileDatabase(DB_PATH)
+        p = db.get_profile("HSS 150x150x6")
+        self.assertTrue(math.isnan(p.rts))
+        res = calculate_flexure(p, 6000, 1.0, 250)
+        self.assertAlmostEqual(res["Mn"], 250 * p.Zx)
+        self.assertIn("closed section", res["state"])
+
+        table = flexure_batch([p, db.get_profile("WF 200x100")], 6000, 1.0, 250)
+        self.assertEqual(table[0].to_dict(), res.to_dict())
+        self.assertEqual(table[1].to_dict(), calculate_flexure(db.get_profile("WF 200x100"), 6000, 1.0, 250).to_dict())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import math
+import os
+import sys
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.calculations import calculate_compression
+from core.profiles import ProfileDatabase
+from core.reliability import monte_carlo, limit_state, Normal, Lognormal, Gumbel
+
+import numpy as np
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+class TestReliability(unittest.TestCase):
+    def setUp(self):
+        self.profile = ProfileDatabase(DB_PATH).get_profile("WF 200x100")
+
+    def test_beta_matches_linear_limit_state(self):
+        # Short span: Mn = Fy * Zx, so R and S are both normal and beta is exact
+        muR = 280 * self.profile.Zx
+        muS = 0.7 * muR
+        variables = {"Fy": Normal(280, 0.07), "Lb": 500, "Mu": Normal(muS, 0.15)}
+        res = monte_carlo("flexure", self.profile, variables, n_samples=400000, seed=1, chunk_size=50000)
+        beta = (muR - muS) / math.hypot(0.07 * muR, 0.15 * muS)
+        self.assertAlmostEqual(res.beta, beta, delta=0.05)
+        self.assertAlmostEqual(res.mean_g, muR - muS, delta=0.01 * muR)
+
+    def test_deterministic_inputs_match_kernel(self):
+        g = limit_state("compression", self.profile, {"Fy": 240, "L": 3000, "Pu": 1e5}, np.random.default_rng(0), 3)
+        Pn = calculate_compression(self.profile.Ag, self.profile.rx, self.profile.ry, 1.0, 3000, 1.0, 3000, 240)["Pn"]
+        np.testing.assert_allclose(g, Pn - 1e5)
+
+    def test_seeded_and_parallel_reproducible(self):
+        variables = {"Fy": Lognormal(280, 0.07), "section": Normal(1.0, 0.03), "L": 3000,
+                     "Pu": [1e5, Gumbel(8e4, 0.25)], "Mux": [8e6, Gumbel(8e6, 0.3)]}
+        serial = monte_carlo("combined", self.profile, variables, n_samples=20000, seed=7, chunk_size=5000)
+        again = monte_carlo("combined", self.profile, variables, n_samples=20000, seed=7, chunk_size=5000)
+        parallel = monte_carlo("combined", self.profile, variables, n_samples=20000, seed=7, chunk_size=5000, workers=2)
+        self.assertEqual(serial, again)
+        self.assertEqual(serial, parallel)
+        self.assertTrue(0 < serial.pf < 1)
+
+    def test_no_failures(self):
+        res = monte_carlo("compression", self.profile, {"Fy": Normal(240, 0.05), "L": 1000, "Pu": 1000},
+                          n_samples=1000, seed=0)
+        self.assertEqual(res.pf, 0.0)
+        self.assertEqual(res.beta, math.inf)
+
+if __name__ == '__main__':
+    unittest.main()
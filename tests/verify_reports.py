@@ -0,0 +1,151 @@
+import unittest
+import csv
+import json
+import os
+import sys
+
+import numpy as np
+from reportlab.platypus import LongTable
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.checks import Member, evaluate_members
+from core.profiles import ProfileDatabase
+from core.batch import combined_batch
+from core.reports import (
+    backend_for, generate_report, write_reports, member_reports, write_table, member_schedule, format_column,
+    HTMLBackend, PDFBackend, CSVBackend, TABLE_CHUNK_ROWS
+)
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+INPUTS = {"Load": "100 kN", "Length": "3000 mm"}
+RESULTS = {"Capacity": 150.0, "Ratio": "0.66 <b>", "status": "SAFE"}
+
+class TestReportBackends(unittest.TestCase):
+    def tearDown(self):
+        for ext in ("pdf", "html", "csv", "jsonl"):
+            if os.path.exists(f"test_report.{ext}"):
+                os.remove(f"test_report.{ext}")
+
+    def test_backend_selection(self):
+        self.assertIs(backend_for("a.HTML"), HTMLBackend)
+        self.assertIs(backend_for("a.out", "pdf"), PDFBackend)
+        with self.assertRaises(ValueError):
+            backend_for("a.docx")
+
+    def test_html(self):
+        generate_report("test_report.html", "Test <Calculation>", INPUTS, RESULTS)
+        with open("test_report.html", encoding="utf-8") as f:
+            text = f.read()
+        self.assertIn("<td>Capacity</td><td>150.000</td>", text)
+        # Values are escaped
+        self.assertIn("Test &lt;Calculation&gt;", text)
+        self.assertIn("0.66 &lt;b&gt;", text)
+        self.assertIn('class="status ok">STATUS: SAFE', text)
+        self.assertTrue(text.rstrip().endswith("</html>"))
+
+    def test_failing_status_not_shown_as_ok(self):
+        write_reports("test_report.html", [("Failing", INPUTS, dict(RESULTS, status=status))
+                                           for status in ("NOT SAFE", "NOT OK", "OK")])
+        with open("test_report.html", encoding="utf-8") as f:
+            text = f.read()
+        self.assertIn('class="status fail">STATUS: NOT SAFE', text)
+        self.assertIn('class="status fail">STATUS: NOT OK', text)
+        self.assertIn('class="status ok">STATUS: OK', text)
+
+    def test_csv_and_jsonl(self):
+        generate_report("test_report.csv", "Test", INPUTS, RESULTS)
+        with open("test_report.csv", newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), len(INPUTS) + len(RESULTS))
+        self.assertEqual(rows[-1]["item"], "status")
+        self.assertEqual(rows[-1]["value"], "SAFE")
+
+        generate_report("test_report.jsonl", "Test", INPUTS, RESULTS)
+        with open("test_report.jsonl", encoding="utf-8") as f:
+            record = json.loads(f.readline())
+        self.assertEqual(record["status"], "SAFE")
+        self.assertEqual(record["results"], {"Capacity": 150.0, "Ratio": "0.66 <b>"})
+
+    def test_member_batch(self):
+        db = ProfileDatabase(DB_PATH)
+        members = [Member(f"C{i}", "combined", "WF 300x150", {"L": 3000, "Pu": 1e5 * i, "Mux": 2e7})
+                   for i in range(20)] + [Member("T1", "tension", "WF 200x100", {"Pu": 1e5}, level="L2")]
+        results = evaluate_members(members, db)
+        for ext in ("jsonl", "pdf"):
+            self.assertEqual(write_reports(f"test_report.{ext}", member_reports(members, results)), len(members))
+        self.assertGreater(os.path.getsize("test_report.pdf"), 0)
+        with open("test_report.jsonl", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([r["inputs"]["Member"] for r in records], [m.id for m in members])
+        self.assertAlmostEqual(records[3]["results"]["ratio"], results[3].ratio)
+        # Nested limit states are flattened
+        self.assertIn("yield.phi_Pn", records[-1]["results"])
+        self.assertEqual(records[-1]["inputs"]["Level"], "L2")
+
+class TestLargeTables(unittest.TestCase):
+    def setUp(self):
+        n = 2 * TABLE_CHUNK_ROWS + 7
+        self.columns = {"Member": [f"M{i}" for i in range(n)], "Ratio": np.linspace(0, 1, n),
+                        "Count": np.arange(n), "Status": ["OK"] * n}
+
+    def tearDown(self):
+        for ext in ("pdf", "html", "csv", "jsonl"):
+            if os.path.exists(f"test_table.{ext}"):
+                os.remove(f"test_table.{ext}")
+
+    def test_format_column(self):
+        self.assertEqual(format_column(np.array([1.0, 2.5])), ["1.000", "2.500"])
+        self.assertEqual(format_column([3, 4]), ["3", "4"])
+        self.assertEqual(format_column(["a", 0.5]), ["a", "0.5"])
+
+    def test_pdf_chunks(self):
+        out = PDFBackend("test_table.pdf")
+        out.add_table("Schedule", self.columns)
+        tables = [e for e in out.elements if isinstance(e, LongTable)]
+        self.assertEqual(len(tables), 3)
+        # Every chunk repeats the header row
+        self.assertTrue(all(t.repeatRows == 1 for t in tables))
+        self.assertEqual(sum(len(t._cellvalues) - 1 for t in tables), len(self.columns["Member"]))
+        out.close()
+        self.assertGreater(os.path.getsize("test_table.pdf"), 0)
+
+    def test_text_backends(self):
+        n = len(self.columns["Member"])
+        self.assertEqual(write_table("test_table.html", "Schedule", self.columns), n)
+        with open("test_table.html", encoding="utf-8") as f:
+            text = f.read()
+        self.assertEqual(text.count("<tr>"), n + 1)
+        self.assertIn("<td>M5</td><td>", text)
+
+        write_table("test_table.csv", "Schedule", self.columns)
+        with open("test_table.csv", newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), n)
+        self.assertEqual(float(rows[-1]["Ratio"]), 1.0)
+
+        write_table("test_table.jsonl", "Schedule", self.columns)
+        with open("test_table.jsonl", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(records[3], {"table": "Schedule", "Member": "M3", "Ratio": self.columns["Ratio"][3],
+                                      "Count": 3, "Status": "OK"})
+
+    def test_csv_layouts_do_not_mix(self):
+        with CSVBackend("test_table.csv") as out:
+            out.add_table("Schedule", self.columns)
+            with self.assertRaises(ValueError):
+                out.add("Test", INPUTS, RESULTS)
+
+    def test_result_table_and_member_schedule(self):
+        db = ProfileDatabase(DB_PATH)
+        profile = db.get_profile("WF 300x150")
+        table = combined_batch(profile, np.linspace(0, 5e5, 300), 2e7, 0.0, 3000, 1.0, 1.0, 240)
+        self.assertEqual(write_table("test_table.html", "Combined", table), 300)
+        members = [Member(f"B{i}", "flexure", "WF 300x150", {"Lb": 3000, "Mu": 1e6 * i}) for i in range(50)]
+        schedule = member_schedule(members, evaluate_members(members, db))
+        self.assertEqual(write_table("test_table.pdf", "Schedule", schedule), 50)
+
+if __name__ == '__main__':
+    unittest.main()
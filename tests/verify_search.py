@@ -0,0 +1,70 @@
+import unittest
+import os
+import sys
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.profiles import ProfileDatabase
+from core.search import ProfileIndex, catalogue_index, normalize
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+def synthetic_index(n=5000):
+    rng = np.random.default_rng(0)
+    types = ["WF", "H", "HSS", "L"]
+    names = [f"{types[i % 4]} {rng.integers(100, 1000)}x{rng.integers(50, 400)}.{i}" for i in range(n)]
+    depth = np.array([float(name.split()[1].split("x")[0]) for name in names])
+    return ProfileIndex(names, [types[i % 4] for i in range(n)], lambda attr: depth), names, depth
+
+class TestSearch(unittest.TestCase):
+    def test_normalize(self):
+        self.assertEqual(normalize("WF 300x150"), "wf300x150")
+        self.assertEqual(normalize(" HSS 100.100.5 "), "hss1001005")
+
+    def test_matches_brute_force(self):
+        index, names, _ = synthetic_index()
+        for query in ["", "w", "wf", "wf 3", "wf 30", "300x1", "hss 25", "x12", "zzz"]:
+            tokens = [normalize(t) for t in query.split()]
+            expected = {i for i, n in enumerate(names) if all(t in normalize(n) for t in tokens)}
+            self.assertEqual(set(index.search(query).tolist()), expected, query)
+
+    def test_incremental_narrowing(self):
+        index, names, _ = synthetic_index()
+        # Typing forwards, then deleting back (the cached matches must not leak into the wider query)
+        for query in ["w", "wf", "wf 4", "wf 45", "wf 4", "wf"]:
+            fresh, _, _ = synthetic_index()
+            np.testing.assert_array_equal(index.search(query), fresh.search(query))
+
+    def test_prefix_matches_first(self):
+        index = ProfileIndex(["H 300x300", "WF 300x150", "WF 200x100"], ["H", "WF", "WF"])
+        self.assertEqual(index.search_names("wf"), ["WF 300x150", "WF 200x100"])
+        self.assertEqual(index.search_names("300"), ["H 300x300", "WF 300x150"])
+        self.assertEqual(index.search_names("wf", limit=1), ["WF 300x150"])
+
+    def test_type_and_dimension_filters(self):
+        index, names, depth = synthetic_index()
+        ids = index.search("", section_type="HSS", d=(200, 400))
+        self.assertTrue(len(ids))
+        self.assertTrue(all(names[i].startswith("HSS ") and 200 <= depth[i] <= 400 for i in ids))
+        ids = index.search("x1", section_type=["WF", "H"], d=(None, 300))
+        self.assertTrue(all(names[i].split()[0] in ("WF", "H") and depth[i] <= 300 for i in ids))
+        with self.assertRaises(ValueError):
+            ProfileIndex(["A"], ["WF"]).search("", d=(0, 1))
+
+    def test_catalogue_index(self):
+        db = ProfileDatabase(DB_PATH)
+        index = catalogue_index(db)
+        self.assertIs(catalogue_index(ProfileDatabase(DB_PATH)), index)
+        self.assertEqual(sorted(index.names), sorted(db.get_all_names()))
+        name = db.get_all_names()[0]
+        self.assertIn(name, index.search_names(name))
+        # Dimension filters load profile data; name search does not
+        self.assertEqual(db.loaded_types, [])
+        deep = index.search_names("", d=(300, None))
+        self.assertTrue(all(db.get_profile(n).d >= 300 for n in deep))
+
+if __name__ == '__main__':
+    unittest.main()
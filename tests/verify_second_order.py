@@ -0,0 +1,88 @@
+import unittest
+import math
+import os
+import sys
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.batch import combined_batch
+from core.classification import E_STEEL
+from core.profiles import ProfileDatabase
+from core.second_order import (
+    equivalent_moment_factor, storey_amplifiers, second_order_batch, second_order_combined
+)
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+class TestSecondOrder(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = ProfileDatabase(DB_PATH)
+        cls.profile = cls.db.get_profile("WF 300x150")
+
+    def test_equivalent_moment_factor(self):
+        np.testing.assert_allclose(equivalent_moment_factor([-50, 50, 0], [100, 100, 0]), [0.8, 0.4, 1.0])
+
+    def test_b1(self):
+        p = self.profile
+        Pe1 = math.pi**2 * E_STEEL * p.Ix / 4000**2
+        table = second_order_batch(p, ["1", "1"], [0.3 * Pe1, 1000], 0, 1e7, 0, 0, 0, 4000, Cmx=[1.0, 0.4])
+        self.assertAlmostEqual(table[0].Pe1x, Pe1)
+        self.assertAlmostEqual(table[0].B1x, 1 / 0.7)
+        self.assertAlmostEqual(table[0].Mrx, 1e7 / 0.7)
+        # B1 is not taken below 1
+        self.assertEqual(table[1].B1x, 1.0)
+
+    def test_storey_grouping(self):
+        rng = np.random.default_rng(2)
+        n = 5000
+        storey = rng.choice(["L1", "L2", "L3", "Roof"], n)
+        P, Pe2x, Pe2y = rng.uniform(1e4, 1e5, n), rng.uniform(1e6, 1e7, n), rng.uniform(1e6, 1e7, n)
+        lateral = rng.random(n) < 0.7
+        labels, index, storeys = storey_amplifiers(storey, P, Pe2x, Pe2y, lateral)
+        for k, label in enumerate(labels):
+            rows = storey == label
+            self.assertAlmostEqual(storeys["P_story"][k], P[rows].sum(), delta=1e-6 * P[rows].sum())
+            Pe = Pe2x[rows & lateral].sum()
+            self.assertAlmostEqual(storeys["Pe_story_x"][k], Pe, delta=1e-6 * Pe)
+            self.assertAlmostEqual(storeys["B2x"][k], 1 / (1 - P[rows].sum() / Pe))
+        np.testing.assert_array_equal(labels[index], storey)
+
+    def test_b2_applies_to_sway_forces(self):
+        p = self.profile
+        table = second_order_batch(p, [1, 1, 2], [2e5, 2e5, 1e5], [1e4, -1e4, 0], [5e6, 5e6, 0], [2e7, 2e7, 1e7],
+                                   0, 0, 3500, Cmx=0.4, K2=1.2)
+        Pe2 = math.pi**2 * E_STEEL * p.Ix / (1.2 * 3500)**2
+        B2 = 1 / (1 - 4e5 / (2 * Pe2))
+        self.assertAlmostEqual(table[0].B2x, B2)
+        self.assertEqual(table[0].B2x, table[1].B2x)
+        self.assertAlmostEqual(table[0].Mrx, table[0].B1x * 5e6 + B2 * 2e7)
+        self.assertAlmostEqual(table[0].Pr, 2e5 + max(table[0].B2x, table[0].B2y) * 1e4)
+        self.assertAlmostEqual(table[2].B2x, 1 / (1 - 1e5 / Pe2))
+
+    def test_leaning_columns_and_instability(self):
+        p = self.profile
+        Pe2y = math.pi**2 * E_STEEL * p.Iy / 3500**2
+        # Leaning column load counts in P_story but adds no stiffness: the storey is unstable in y
+        table = second_order_batch(p, [1, 1], [0.6 * Pe2y, 0.6 * Pe2y], 0, 0, 0, 0, [1e6, 0], 3500,
+                                   lateral=[True, False])
+        self.assertTrue(np.isinf(table[0].B2y))
+        self.assertTrue(np.isinf(table[0].Mry))
+        self.assertEqual(table[1].Mry, 0.0)
+
+    def test_combined_uses_amplified_forces(self):
+        profiles = self.db.get_profiles("WF")
+        n = len(profiles)
+        Pnt, Plt, Mnt, Mlt = np.full(n, 2e5), np.full(n, 1e4), np.full(n, 1e7), np.full(n, 5e6)
+        amplified, combined = second_order_combined(profiles, np.zeros(n), Pnt, Plt, Mnt, Mlt, 0, 0,
+                                                    3000, 1.0, 1.0, 240, Cmx=0.6)
+        expected = combined_batch(profiles, amplified["Pr"], amplified["Mrx"], amplified["Mry"], 3000, 1.0, 1.0, 240)
+        np.testing.assert_allclose(combined["ratio"], expected["ratio"])
+        first_order = combined_batch(profiles, Pnt + Plt, Mnt + Mlt, 0, 3000, 1.0, 1.0, 240)
+        self.assertTrue(np.all(combined["ratio"] >= first_order["ratio"] - 1e-12))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import os
+import shutil
+import sys
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core import instrumentation
+from core.profiles import ProfileDatabase
+from core.section_properties import i_shape_properties, box_properties, cache_path
+
+class TestSectionProperties(unittest.TestCase):
+    def test_i_shape_against_aisc_w8x31(self):
+        # AISC Manual W8x31 (in units): J = 0.536, Cw = 530, rts = 2.28
+        props = i_shape_properties(8.0, 7.995, 0.285, 0.435, 9.13, 37.1, 27.5)
+        self.assertAlmostEqual(float(props["Cw"]), 530, delta=5)
+        self.assertAlmostEqual(float(props["J"]), 0.536, delta=0.03)
+        self.assertAlmostEqual(float(props["rts"]), 2.28, delta=0.03)
+
+    def test_fillet_radius_from_area(self):
+        # JIS WF 200x100x5.5x8 has r = 11 mm
+        props = i_shape_properties(200, 100, 5.5, 8, 2716, 1.34e6, 1.84e5)
+        self.assertAlmostEqual(float(props["r"]), 11.0, delta=0.1)
+
+    def test_box_has_no_warping(self):
+        props = box_properties(150, 150, 6)
+        self.assertEqual(float(props["Cw"]), 0.0)
+        self.assertGreater(float(props["J"]), 0)
+
+    def test_cache_reused_per_catalogue_version(self):
+        src = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+        path = "test_profiles.csv"
+        shutil.copy(src, path)
+        instrumentation.reset()
+        instrumentation.enable()
+        try:
+            first = ProfileDatabase(path)
+            J_first = first.get_profile("WF 200x100").J
+            self.assertTrue(os.path.exists(cache_path(path)))
+            J_second = ProfileDatabase(path).get_profile("WF 200x100").J
+            calls = instrumentation.get_timers()[("derive", "section_properties")]["calls"]
+        finally:
+            instrumentation.disable()
+            instrumentation.reset()
+            os.remove(path)
+            os.remove(cache_path(path))
+        self.assertEqual(calls, 1)
+        self.assertEqual(J_first, J_second)
+
+    def test_corrupt_cache_is_a_miss(self):
+        src = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+        path = "test_profiles_corrupt.csv"
+        shutil.copy(src, path)
+        try:
+            expected = ProfileDatabase(path).get_profile("WF 200x100").J
+            with open(cache_path(path), 'r+b') as f:
+                f.truncate(100)  # as left by an interrupted write
+            J = ProfileDatabase(path).get_profile("WF 200x100").J
+            reloaded = ProfileDatabase(path).get_profile("WF 200x100").J
+            leftovers = [f for f in os.listdir('.') if f.startswith(cache_path(path)) and f.endswith(".tmp")]
+        finally:
+            os.remove(path)
+            os.remove(cache_path(path))
+        self.assertEqual(J, expected)
+        self.assertEqual(reloaded, expected)
+        self.assertEqual(leftovers, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import asyncio
+import http.client
+import json
+import threading
+import unittest
+import os
+import sys
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.calculations import calculate_base_plate, calculate_flexure, calculate_tension
+from core.service import CalculationService
+
+class TestService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.service = CalculationService(workers=0)
+        cls.loop = asyncio.new_event_loop()
+        cls.port = cls.loop.run_until_complete(cls.service.start(port=0))
+        cls.thread = threading.Thread(target=cls.loop.run_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.call_soon_threadsafe(cls.service.close)
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.thread.join(timeout=5)
+
+    def request(self, conn, method, path, body=None):
+        conn.request(method, path, body=json.dumps(body) if body is not None else None,
+                     headers={"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        return resp.status, json.loads(resp.read())
+
+    def test_keep_alive_checks(self):
+        conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        status, health = self.request(conn, "GET", "/health")
+        self.assertEqual(status, 200)
+        self.assertEqual(health["status"], "ok")
+
+        status, res = self.request(conn, "POST", "/check/flexure", {"profile": "WF 200x100", "Lb": 3000, "Cb": 1.0, "Fy": 240})
+        self.assertEqual(status, 200)
+        expected = calculate_flexure(self.service.db.get_profile("WF 200x100"), 3000, 1.0, 240)
+        self.assertAlmostEqual(res["phi_Mn"], expected["phi_Mn"])
+        self.assertEqual(res["state"], expected["state"])
+
+        # Same connection reused for a second request
+        status, res = self.request(conn, "POST", "/check/tension", {"profile": "WF 200x100", "Fy": 240, "Fu": 370})
+        p = self.service.db.get_profile("WF 200x100")
+        self.assertAlmostEqual(res["yield"]["phi_Pn"], calculate_tension(p.Ag, p.Ag, 240, 370)["yield"]["phi_Pn"])
+        conn.close()
+
+    def test_batch_and_members(self):
+        conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        rows = [{"db": 16 + 2 * i, "n": 4, "Fnv": 372} for i in range(5)]
+        status, res = self.request(conn, "POST", "/batch/bolt_shear", rows)
+        self.assertEqual(status, 200)
+        self.assertEqual(len(res), 5)
+        self.assertLess(res[0]["phi_Rn"], res[4]["phi_Rn"])
+
+        members = [{"id": "C1", "check": "compression", "profile": "WF 200x100", "params": {"L": 3000, "Pu": 100000}}]
+        status, res = self.request(conn, "POST", "/members", members)
+        self.assertEqual(status, 200)
+        self.assertEqual(res[0]["member_id"], "C1")
+        conn.close()
+
+    def test_errors(self):
+        conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        status, res = self.request(conn, "POST", "/check/flexure", {"profile": "WF 999", "Lb": 1, "Cb": 1, "Fy": 1})
+        self.assertEqual(status, 400)
+        status, res = self.request(conn, "POST", "/check/compression", {"Ag": 100})
+        self.assertEqual(status, 400)
+        self.assertIn("Missing parameter", res["error"])
+        status, res = self.request(conn, "POST", "/check/tension", {"Ag": "big", "Ae": 1000, "Fy": 240, "Fu": 370})
+        self.assertEqual(status, 400)
+        self.assertIn("'Ag'", res["error"])
+        status, res = self.request(conn, "GET", "/nowhere")
+        self.assertEqual(status, 404)
+        conn.close()
+
+    def test_failing_row_isolated_in_coalesced_batch(self):
+        good = {"Ag": 1000.0, "Ae": 1000.0, "Fy": 240.0, "Fu": 370.0}
+        bad = dict(good, Ag="big")  # bypasses normalize(), so the batch kernel itself fails
+
+        async def submit():
+            coalescer = self.service._coalescers["tension"]
+            futures = [coalescer.submit(good), coalescer.submit(bad), coalescer.submit(good)]
+            return await asyncio.gather(*futures, return_exceptions=True)
+
+        results = asyncio.run_coroutine_threadsafe(submit(), self.loop).result(timeout=5)
+        self.assertAlmostEqual(results[0]["phi_Pn"], calculate_tension(1000, 1000, 240, 370)["phi_Pn"])
+        self.assertIsInstance(results[1], Exception)
+        self.assertEqual(results[2], results[0])
+
+    def test_base_plate_dimensions_from_profile(self):
+        conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        params = {"Pu": 500000, "fc": 25, "B": 300, "N": 300}
+        status, res = self.request(conn, "POST", "/check/base_plate", dict(params, profile="WF 200x100"))
+        self.assertEqual(status, 200)
+        p = self.service.db.get_profile("WF 200x100")
+        expected = calculate_base_plate(500000, 25, 300, 300, p.d, p.bf)
+        self.assertAlmostEqual(res["t_req"], expected["t_req"])
+        conn.close()
+
+    def test_non_finite_results_are_null(self):
+        conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        status, res = self.request(conn, "POST", "/check/weld", {"weld_type": "Plug", "Fexx": 480, "size": 6, "length": 100})
+        self.assertEqual(status, 200)
+        self.assertIsNone(res["phi_Rn"])
+        conn.close()
+
+if __name__ == '__main__':
+    unittest.main()
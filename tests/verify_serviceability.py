@@ -0,0 +1,75 @@
+import unittest
+import math
+import os
+import sys
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.calculations import calculate_flexure
+from core.classification import E_STEEL
+from core.profiles import ProfileDatabase
+from core.serviceability import (
+    G, stiffness_table, serviceability_batch, calculate_serviceability, lightest_sections
+)
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+class TestServiceability(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.db = ProfileDatabase(DB_PATH)
+        cls.profile = cls.db.get_profile("WF 300x150")
+
+    def test_stiffness_table(self):
+        EI, w_self = stiffness_table(self.profile)
+        self.assertEqual(EI, E_STEEL * self.profile.Ix)
+        self.assertAlmostEqual(w_self, self.profile.weight * 9.81e-3)
+        EI, _ = stiffness_table([self.profile, self.profile])
+        self.assertEqual(EI.shape, (2,))
+
+    def test_deflection_cases(self):
+        EI = E_STEEL * self.profile.Ix
+        table = serviceability_batch(self.profile, 5000, w=[10, 0, 10, 10], P=[0, 20000, 0, 0],
+                                     support=["simple", "cantilever", "fixed", "propped"], self_weight=False)
+        expected = [5 * 10 * 5000**4 / (384 * EI), 20000 * 5000**3 / (3 * EI),
+                    10 * 5000**4 / (384 * EI), 10 * 5000**4 / (185 * EI)]
+        np.testing.assert_allclose(table["delta"], expected)
+        np.testing.assert_allclose(table["delta_limit"], 5000 / 360)
+        with self.assertRaises(ValueError):
+            serviceability_batch(self.profile, 5000, w=10, support=["pinned"])
+
+    def test_natural_frequency(self):
+        res = calculate_serviceability(self.profile, 6000, w=10, f_min=4.0)
+        w = 10 + self.profile.weight * 9.81e-3
+        f1 = math.pi / 2 * math.sqrt(E_STEEL * self.profile.Ix * G / (w * 6000**4))
+        self.assertAlmostEqual(res.f1, f1)
+        self.assertAlmostEqual(res.frequency_ratio, 4.0 / f1)
+        # Rule of thumb f1 = 18 / sqrt(delta) for simply supported beams under their mass load
+        self.assertAlmostEqual(res.f1, 18 / math.sqrt(res.delta), delta=0.1)
+        self.assertEqual(res.ratio, max(res.deflection_ratio, res.frequency_ratio))
+
+    def test_lightest_sections(self):
+        candidates = self.db.get_profiles("WF")
+        spans = np.array([3000.0, 6000.0, 9000.0])
+        choice, ratio = lightest_sections(candidates, spans, w=8.0, wu=12.0, limit=360)
+        self.assertEqual(ratio.shape, (3, len(candidates)))
+        by_weight = sorted(candidates, key=lambda p: p.weight)
+        for L, chosen in zip(spans, choice):
+            self.assertIsNotNone(chosen)
+            # The chosen section passes both checks and every lighter one fails one of them
+            for p in by_weight:
+                w_self = p.weight * 9.81e-3
+                strength = (12.0 + 1.2 * w_self) * L**2 / 8 / calculate_flexure(p, L, 1.0, 240).phi_Mn
+                service = calculate_serviceability(p, L, w=8.0).ratio
+                if p is chosen:
+                    self.assertLessEqual(max(strength, service), 1.0)
+                    break
+                self.assertGreater(max(strength, service), 1.0)
+        # Nothing works for an impossible span
+        self.assertIsNone(lightest_sections(candidates, 60000.0, w=8.0, wu=12.0)[0][0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import os
+import sys
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.checks import Member, evaluate_members
+from core.profiles import ProfileDatabase
+from core.store import ResultStore
+
+class TestResultStore(unittest.TestCase):
+    def setUp(self):
+        self.filename = "test_results.db"
+        db = ProfileDatabase(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv'))
+        self.members = [
+            Member(f"C{i}", "compression", "WF 200x100", {"L": 3000, "Pu": 50000 * i}, level=str(i % 3))
+            for i in range(12)
+        ]
+        self.results = evaluate_members(self.members, db)
+        self.store = ResultStore(self.filename)
+        self.run_id = self.store.start_run("test", db.version)
+        self.store.add_results(self.run_id, self.results, self.members)
+
+    def tearDown(self):
+        self.store.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.filename + suffix):
+                os.remove(self.filename + suffix)
+
+    def test_top_ratios(self):
+        top = self.store.top_ratios(3)
+        self.assertEqual([r["member_id"] for r in top], ["C11", "C10", "C9"])
+        self.assertAlmostEqual(top[0]["ratio"], self.results[11].ratio)
+        self.assertAlmostEqual(top[0]["payload"]["phi_Pn"], self.results[11].result["phi_Pn"])
+
+    def test_failing_on_level(self):
+        failing = self.store.failing(level="1")
+        expected = [r.member_id for r, m in zip(self.results, self.members) if r.status == "NOT SAFE" and m.level == "1"]
+        self.assertEqual(sorted(r["member_id"] for r in failing), sorted(expected))
+        self.assertTrue(all(r["status"] == "NOT SAFE" for r in failing))
+
+    def test_member_history(self):
+        run2 = self.store.start_run("second")
+        self.store.add_results(run2, self.results[:1], self.members[:1], store_payload=False)
+        history = self.store.query(member_id="C0")
+        self.assertEqual([r["run_id"] for r in history], [self.run_id, run2])
+        self.assertEqual(sum(self.store.status_counts(self.run_id).values()), 12)
+
+if __name__ == '__main__':
+    unittest.main()
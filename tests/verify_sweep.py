@@ -0,0 +1,64 @@
+import unittest
+import os
+import sys
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.calculations import calculate_combined, calculate_compression, calculate_flexure
+from core.plotting import create_heatmap_plot
+from core.profiles import ProfileDatabase
+from core.sweep import sweep
+import matplotlib.figure
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'profiles.csv')
+
+class TestSweep(unittest.TestCase):
+    def setUp(self):
+        self.db = ProfileDatabase(DB_PATH)
+        self.profile = self.db.get_profile("WF 200x100")
+
+    def test_cartesian_product_matches_scalar(self):
+        ranges = {"Fy": [240, 290, 410], "K": [0.8, 1.0], "L": np.linspace(1000, 8000, 8), "Cb": [1.0, 1.3]}
+        # Small chunks so the grid spans several kernel calls
+        res = sweep("combined", ranges, fixed={"profile": self.profile, "Pu": 1e5, "Mux": 20e6, "Muy": 0}, chunk_size=7)
+        self.assertEqual(res.dims, ("Fy", "K", "L", "Cb"))
+        self.assertEqual(res["ratio"].shape, (3, 2, 8, 2))
+        for i, j, k, m in [(0, 0, 0, 0), (2, 1, 7, 1), (1, 0, 4, 1)]:
+            expected = calculate_combined(self.profile, 1e5, 20e6, 0, res.coords["L"][k], res.coords["K"][j],
+                                          res.coords["Cb"][m], res.coords["Fy"][i])
+            self.assertAlmostEqual(res["ratio"][i, j, k, m], expected["ratio"])
+
+    def test_aliases_and_profile_axis(self):
+        profiles = self.db.get_profiles("WF")
+        res = sweep("compression", {"profile": profiles, "L": [2000, 4000]}, fixed={"K": 1.0, "Fy": 240},
+                    outputs=["phi_Pn"])
+        p = profiles[3]
+        expected = calculate_compression(p.Ag, p.rx, p.ry, 1.0, 4000, 1.0, 4000, 240)
+        self.assertAlmostEqual(res["phi_Pn"][3, 1], expected["phi_Pn"])
+        self.assertEqual(res.coords["profile"][3], p.name)
+
+        res = sweep("flexure", {"L": [2000, 6000]}, fixed={"profile": p, "Cb": 1.0, "Fy": 240})
+        self.assertAlmostEqual(res["phi_Mn"][1], calculate_flexure(p, 6000, 1.0, 240)["phi_Mn"])
+
+    def test_slice2d_and_heatmap(self):
+        res = sweep("combined", {"Fy": [240, 250, 290], "L": [2000, 4000, 6000, 8000], "K": [1.0, 2.0]},
+                    fixed={"profile": self.profile, "Pu": 1e5, "Mux": 20e6, "Muy": 0, "Cb": 1.0})
+        x, y, data = res.slice2d("ratio", "L", "Fy", K=2.0)
+        self.assertEqual(data.shape, (3, 4))
+        self.assertEqual(data[2, 1], res["ratio"][2, 1, 1])
+        fig = create_heatmap_plot(x, y, data, "L (mm)", "Fy (MPa)", "Ratio", limit=1.0)
+        self.assertIsInstance(fig, matplotlib.figure.Figure)
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            sweep("combined", {"Q": [1, 2]}, fixed={"profile": self.profile})
+        with self.assertRaises(ValueError):
+            sweep("combined", {"Fy": [240]}, fixed={"profile": self.profile})
+        with self.assertRaisesRegex(ValueError, "'Fyy' is not an input"):
+            sweep("flexure", {"L": [3000, 4000]}, fixed={"profile": self.profile, "Cb": 1.0, "Fy": 240, "Fyy": 999})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import os
+import sys
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import core.bolt_group as bolt_group
+import core.weld_group as weld_group
+from core.calculations import calculate_weld
+from core.weld_group import (
+    WeldGroup, discretize, polar_moment, elastic_coefficient, ic_coefficient, ic_coefficients,
+    coefficient_table, weld_group_batch, calculate_weld_group, clear_cache
+)
+
+class TestWeldGroup(unittest.TestCase):
+    def setUp(self):
+        clear_cache()
+
+    def test_discretization(self):
+        group = WeldGroup.c_shape(100, 200)
+        mid, lengths, axis = discretize(group)
+        self.assertAlmostEqual(lengths.sum(), 400.0)
+        np.testing.assert_allclose((lengths[:, None] * mid).sum(axis=0), 0.0, atol=1e-9)
+        np.testing.assert_allclose(np.hypot(axis[:, 0], axis[:, 1]), 1.0)
+        # Single line: Ip = d^3 / 12
+        self.assertAlmostEqual(polar_moment(WeldGroup.line(300)), 300**3 / 12)
+
+    def test_concentric_directional_increase(self):
+        group = WeldGroup.parallel(100, 200)
+        # Longitudinal load: no increase; transverse load: 1.5 times
+        self.assertAlmostEqual(ic_coefficient(group, 0, 0), 400, delta=1)
+        self.assertAlmostEqual(ic_coefficient(group, 0, 90), 600, delta=1)
+        # A straight concentric line matches calculate_weld
+        result = calculate_weld_group(WeldGroup.line(150), 0, 0, 490, 8)
+        self.assertAlmostEqual(result.phi_Rn, calculate_weld("Fillet", 490, 8, 150).phi_Rn, delta=1e-3 * result.phi_Rn)
+
+    def test_ic_exceeds_elastic(self):
+        for group in (WeldGroup.c_shape(75, 250), WeldGroup.box(150, 200), WeldGroup.parallel(100, 200)):
+            for e in (25, 100, 400):
+                for angle in (0, 45, 75):
+                    self.assertGreater(ic_coefficient(group, e, angle), elastic_coefficient(group, e, angle))
+
+    def test_decreases_with_eccentricity(self):
+        group = WeldGroup.parallel(100, 200)
+        C, _ = ic_coefficients(group, np.linspace(50, 600, 60))
+        self.assertTrue(np.all(np.diff(C) < 0))
+        # Small eccentricities find the finite IC, not the one at infinity (C = concentric value)
+        self.assertAlmostEqual(ic_coefficient(group, 11.152542), 393.7, delta=0.1)
+        self.assertLess(ic_coefficient(group, 1), ic_coefficient(group, 0))
+
+    def test_converged(self):
+        group = WeldGroup.c_shape(80, 220)
+        C = ic_coefficient(group, 150, 30)
+        clear_cache()
+        bolt_group.MAX_ITER, bolt_group.TOLERANCE = 400, 1e-14
+        try:
+            self.assertAlmostEqual(ic_coefficient(group, 150, 30), C, places=6)
+        finally:
+            bolt_group.MAX_ITER, bolt_group.TOLERANCE = 60, 1e-10
+
+    def test_coefficient_table(self):
+        table = coefficient_table(WeldGroup.c_shape(75, 250), [50, 100, 200], angles=(0, 45))
+        self.assertEqual(table.shape, (2, 3))
+        self.assertAlmostEqual(table[1, 2], ic_coefficient(WeldGroup.c_shape(75, 250), 200, 45))
+
+    def test_batch_matches_scalar_and_uses_cache(self):
+        shapes = [WeldGroup.c_shape(75, 200), WeldGroup.box(150, 150)]
+        groups = shapes * 200
+        e = np.tile([100.0, 100.0, 250.0, 250.0], 100)
+        table = weld_group_batch(groups, e, 30, 490, 8)
+        self.assertEqual(len(table), 400)
+        self.assertEqual(len(weld_group._cache), 4)
+        for i in (0, 3, 399):
+            self.assertAlmostEqual(table["phi_Rn"][i], calculate_weld_group(groups[i], e[i], 30, 490, 8).phi_Rn)
+        self.assertAlmostEqual(table[0].phi_Rn, 0.75 * table[0].C * 0.6 * 490 * 0.707 * 8)
+
+    def test_cache_is_bounded(self):
+        group = WeldGroup.c_shape(75, 200)
+        e = np.linspace(50, 300, 8)
+        expected = np.array([ic_coefficient(group, ei, 30) for ei in e])
+        clear_cache()
+        maxsize = weld_group._cache.maxsize
+        weld_group._cache.maxsize = 3
+        try:
+            C, _ = ic_coefficients(group, e, 30)
+            self.assertEqual(len(weld_group._cache), 3)
+        finally:
+            weld_group._cache.maxsize = maxsize
+        np.testing.assert_allclose(C, expected)
+
+if __name__ == '__main__':
+    unittest.main()